@@ -1,6 +1,8 @@
 from collections.abc import Mapping
 from typing import Any, override
 
+from mpt_api_client import RQLQuery
+
 from mpt_extension_sdk.models import Agreement, Order
 from mpt_extension_sdk.models.account import AccountToken
 from mpt_extension_sdk.models.base import BaseModel
@@ -10,6 +12,7 @@ from mpt_extension_sdk.services.mpt_api_service.account_token import AccountToke
 from mpt_extension_sdk.services.mpt_api_service.agreement import AgreementService
 from mpt_extension_sdk.services.mpt_api_service.base import PaginatedCollection
 from mpt_extension_sdk.services.mpt_api_service.order import OrderService
+from mpt_extension_sdk.services.mpt_api_service.projection import ProjectionProfile
 
 
 class ExtMPTAPIService(MPTAPIService):
@@ -41,7 +44,9 @@ class MockAgreementService(AgreementService):
         return Agreement.from_payload(agreement)
 
     @override
-    async def get_all(self, offset: int = 0, limit: int = 100) -> PaginatedCollection[Agreement]:
+    async def get_all(
+        self, offset: int = 0, limit: int = 100, rql_filter: RQLQuery | None = None
+    ) -> PaginatedCollection[Agreement]:
         """Get agreements using offset pagination."""
         total = 10
         agreements = [
@@ -58,7 +63,13 @@ class MockAgreementService(AgreementService):
         return PaginatedCollection(limit=limit, offset=offset, resources=agreements, total=total)
 
     @override
-    async def get_by_id(self, agreement_id: str) -> Agreement:
+    async def get_by_id(
+        self,
+        agreement_id: str,
+        projection: ProjectionProfile = ProjectionProfile.FULL,
+        *,
+        refresh: bool = False,
+    ) -> Agreement:
         payload = {
             "id": agreement_id,
             "name": "Test Agreement",
@@ -74,7 +85,13 @@ class MockOrderService(OrderService):
     """Mock order service."""
 
     @override
-    async def get_by_id(self, order_id: str) -> Order:
+    async def get_by_id(
+        self,
+        order_id: str,
+        projection: ProjectionProfile = ProjectionProfile.FULL,
+        *,
+        refresh: bool = False,
+    ) -> Order:
         payload = {
             "id": order_id,
             "status": "Processing",
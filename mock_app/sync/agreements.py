@@ -9,17 +9,10 @@ class SyncAgreements:
     async def execute(self, ctx: APIContext) -> None:
         """Sync agreements."""
         ctx.logger.info("Sync agreements")
-        offset = 0
-        limit = 5
-        while True:
-            page = await ctx.mpt_api_service.agreements.get_all(offset=offset, limit=limit)
-            for agreement in page.resources:
-                ctx.logger.info("Syncing agreement %s", agreement.id)
-                self._sync_agreement(agreement.id)
-                ctx.logger.info("Agreement %s synced", agreement.id)
-            offset += limit
-            if offset >= page.total or not page.resources:
-                break
+        async for agreement in ctx.mpt_api_service.agreements.iter_all(page_size=5):
+            ctx.logger.info("Syncing agreement %s", agreement.id)
+            self._sync_agreement(agreement.id)
+            ctx.logger.info("Agreement %s synced", agreement.id)
 
     @trace_span(
         "sync_agreement",
@@ -1,9 +1,20 @@
 from functools import lru_cache
-from typing import Annotated
+from typing import Annotated, cast
 
-from fastapi import Depends
+from fastapi import Depends, Request
 
+from mpt_extension_sdk.runtime.async_tasks import AsyncTaskRunner
+from mpt_extension_sdk.runtime.event_outcomes import EventOutcomes
+from mpt_extension_sdk.runtime.object_lanes import ObjectLanes
+from mpt_extension_sdk.runtime.task_outbox import TaskOutbox
+from mpt_extension_sdk.runtime.task_transitions import TaskTransitionService
 from mpt_extension_sdk.services.mpt_api_service.api_service import MPTAPIService
+from mpt_extension_sdk.services.mpt_api_service.http_settings import HTTPClientSettings
+from mpt_extension_sdk.services.mpt_api_service.rate_limit import (
+    RateLimiter,
+    get_extension_rate_limiter,
+)
+from mpt_extension_sdk.services.mpt_api_service.retry_policy import RetryPolicy
 from mpt_extension_sdk.services.mpt_api_service.task import TaskService
 from mpt_extension_sdk.settings.runtime import RuntimeSettings, get_runtime_settings
 
@@ -15,10 +26,50 @@ def get_tasks_service(
     return _cached_tasks_service(
         base_url=runtime_settings.mpt_api_base_url,
         api_token=runtime_settings.ext_api_key,
+        retry_policy=RetryPolicy.from_runtime_settings(runtime_settings),
+        http_settings=HTTPClientSettings.from_runtime_settings(runtime_settings),
+        rate_limiter=get_extension_rate_limiter(runtime_settings),
     )
 
 
+def get_task_transitions(
+    request: Request,
+    task_service: Annotated[TaskService, Depends(get_tasks_service)],
+) -> TaskTransitionService:
+    """Return the target of task transitions: the outbox when enabled, else the service."""
+    task_outbox = cast(TaskOutbox | None, request.app.state.task_outbox)
+    return task_service if task_outbox is None else task_outbox
+
+
+def get_async_task_runner(request: Request) -> AsyncTaskRunner:
+    """Return the runner that executes background tasks of the application."""
+    return cast(AsyncTaskRunner, request.app.state.async_task_runner)
+
+
+def get_event_outcomes(request: Request) -> EventOutcomes:
+    """Return the recorded event outcomes used to short-circuit redeliveries."""
+    return cast(EventOutcomes, request.app.state.event_outcomes)
+
+
+def get_object_lanes(request: Request) -> ObjectLanes:
+    """Return the per-object execution lanes of the application."""
+    return cast(ObjectLanes, request.app.state.object_lanes)
+
+
 @lru_cache(maxsize=4)
-def _cached_tasks_service(*, base_url: str, api_token: str) -> TaskService:
+def _cached_tasks_service(
+    *,
+    base_url: str,
+    api_token: str,
+    retry_policy: RetryPolicy | None,
+    http_settings: HTTPClientSettings,
+    rate_limiter: RateLimiter,
+) -> TaskService:
     """Build the task service once per configuration, reusing its HTTP client."""
-    return MPTAPIService.from_config(base_url=base_url, api_token=api_token).tasks
+    return MPTAPIService.from_config(
+        base_url=base_url,
+        api_token=api_token,
+        retry_policy=retry_policy,
+        http_settings=http_settings,
+        rate_limiter=rate_limiter,
+    ).tasks
@@ -1,30 +1,36 @@
 import logging
-from collections.abc import Awaitable, Callable
-from inspect import isawaitable
-from typing import Annotated, Any
+from functools import partial
+from typing import Annotated
 
 from fastapi import APIRouter, Depends, Request, status
 
-from mpt_extension_sdk.api.auth import AuthenticationError, RequestAuthenticationService
-from mpt_extension_sdk.api.builders.dependencies import get_tasks_service
+from mpt_extension_sdk.api.builders.dependencies import (
+    get_async_task_runner,
+    get_event_outcomes,
+    get_object_lanes,
+    get_task_transitions,
+    get_tasks_service,
+)
+from mpt_extension_sdk.api.builders.event_context import build_route_context, build_task_progress
+from mpt_extension_sdk.api.builders.event_handlers import (
+    process_event,
+    process_task_event,
+    run_background_handler,
+)
 from mpt_extension_sdk.api.models.events import Event, EventResponse, TaskEvent
-from mpt_extension_sdk.errors.mapping import map_exception_to_event_response
-from mpt_extension_sdk.errors.pipeline import CancelError, DeferError, FailError
 from mpt_extension_sdk.extension_app import ExtensionApp
-from mpt_extension_sdk.observability.tracing import (
-    get_business_attributes,
-    record_exception,
-    set_attributes,
-    start_event_span,
+from mpt_extension_sdk.routing import EventDeliveryMode, EventRouteDefinition
+from mpt_extension_sdk.runtime.async_tasks import (
+    MIN_SATURATION_DELAY_SECONDS,
+    AsyncTaskRunner,
+    TaskExecution,
 )
-from mpt_extension_sdk.pipeline import EventBaseContext, build_context
-from mpt_extension_sdk.routing import EventDeliveryMode, EventRouteCallback, EventRouteDefinition
+from mpt_extension_sdk.runtime.event_outcomes import EventOutcomes
 from mpt_extension_sdk.runtime.logging import set_event_context
+from mpt_extension_sdk.runtime.object_lanes import ObjectLanes
+from mpt_extension_sdk.runtime.task_transitions import TaskTransitionService
 from mpt_extension_sdk.services.mpt_api_service.task import TaskService
 
-TaskHandler = Callable[[TaskEvent, EventBaseContext], Awaitable[None] | None]
-EventHandler = Callable[[Event, EventBaseContext], Awaitable[None] | None]
-
 logger = logging.getLogger(__name__)
 
 
@@ -32,74 +38,123 @@ def create_event_route(route: EventRouteDefinition, extension_app: ExtensionApp)
     """Create a FastAPI router for an event route definition."""
     if route.delivery_mode == EventDeliveryMode.TASK:
         return create_task_event_route(route, extension_app)
+    if route.delivery_mode == EventDeliveryMode.BACKGROUND_TASK:
+        return create_background_task_event_route(route, extension_app)
     return create_non_task_event_route(route, extension_app)
 
 
-# TODO: Refactor event route builders in a separate PR.
-def create_task_event_route(  # ruff:ignore[complex-structure]  # noqa: WPS213, WPS217
+def create_task_event_route(route: EventRouteDefinition, extension_app: ExtensionApp) -> APIRouter:
+    """Create a router for a task-based event handler."""
+    router = APIRouter()
+    handler_logger = logging.getLogger(route.callback.__module__)
+
+    @router.post(route.path, status_code=status.HTTP_200_OK, response_model=EventResponse)
+    async def handle_task_event(  # noqa: WPS211, WPS430
+        request: Request,
+        event: TaskEvent,
+        task_service: Annotated[TaskService, Depends(get_tasks_service)],
+        task_transitions: Annotated[TaskTransitionService, Depends(get_task_transitions)],
+        object_lanes: Annotated[ObjectLanes, Depends(get_object_lanes)],
+        event_outcomes: Annotated[EventOutcomes, Depends(get_event_outcomes)],
+    ) -> EventResponse:
+        handler_logger.info("Received event (%s): %s", event.id, event.to_dict())
+        set_event_context(task_id=event.task.id)
+        async with object_lanes.acquire(event.object.id):
+            replayed = await replay_outcome(event_outcomes, route, event, handler_logger)
+            if replayed is not None:
+                return replayed
+            progress = build_task_progress(event, task_service)
+            context = await build_route_context(
+                request,
+                event,
+                route,
+                extension_app,
+                handler_logger,
+                task_service=task_service,
+                task_transitions=task_transitions,
+                progress=progress,
+            )
+            if isinstance(context, EventResponse):
+                return context
+            response = await process_task_event(
+                route, event, context, progress, task_transitions, handler_logger
+            )
+            await event_outcomes.record(route.path, event.id, response)
+            return response
+
+    return router
+
+
+def create_background_task_event_route(
     route: EventRouteDefinition, extension_app: ExtensionApp
 ) -> APIRouter:
-    """Create a router for a task-based event handler."""
+    """Create a router that acknowledges task events and runs the handler in background.
+
+    The event is answered once the task is started; `AsyncTaskRunner` then runs the
+    handler within the route deadline and completes, fails or reschedules the task.
+    The outcome of the event is recorded for replay only once the task is finished.
+    """
     router = APIRouter()
     handler_logger = logging.getLogger(route.callback.__module__)
 
     @router.post(route.path, status_code=status.HTTP_200_OK, response_model=EventResponse)
-    async def handle_task_event(  # noqa: WPS212, WPS213, WPS217, WPS430
+    async def handle_background_task_event(  # noqa: WPS210, WPS211, WPS430
         request: Request,
         event: TaskEvent,
         task_service: Annotated[TaskService, Depends(get_tasks_service)],
+        task_transitions: Annotated[TaskTransitionService, Depends(get_task_transitions)],
+        task_runner: Annotated[AsyncTaskRunner, Depends(get_async_task_runner)],
+        object_lanes: Annotated[ObjectLanes, Depends(get_object_lanes)],
+        event_outcomes: Annotated[EventOutcomes, Depends(get_event_outcomes)],
     ) -> EventResponse:
         handler_logger.info("Received event (%s): %s", event.id, event.to_dict())
         set_event_context(task_id=event.task.id)
-        try:
-            context = await build_authenticated_context(
-                request, event, handler_logger, extension_app
+        replayed = await replay_outcome(event_outcomes, route, event, handler_logger)
+        if replayed is not None:
+            return replayed
+        with task_runner.reserve(event.task.id) as reserved:
+            refused = refuse_background_task(
+                task_runner, event.task.id, handler_logger, reserved=reserved
+            )
+            if refused is not None:
+                return refused
+            progress = build_task_progress(event, task_service)
+            context = await build_route_context(
+                request,
+                event,
+                route,
+                extension_app,
+                handler_logger,
+                task_service=task_service,
+                task_transitions=task_transitions,
+                progress=progress,
             )
-        except AuthenticationError as error:
-            handler_logger.exception("Task event authentication failed", exc_info=error)
-            return map_exception_to_event_response(error)  # noqa: WPS204
-        context = extension_app.build_context(route, context)
-        with start_event_span(route.path, task_based=True, event=event) as span:
-            business_attributes = get_business_attributes(context)
-            set_event_context(
-                order_id=str(business_attributes.get("order.id", "")),
-                agreement_id=str(business_attributes.get("agreement.id", "")),
+            if isinstance(context, EventResponse):
+                return context
+            handler_logger.info("Running task %s in background", event.task.id)
+            submitted = task_runner.submit(
+                execution=TaskExecution(
+                    task_id=event.task.id,
+                    task_callback=partial(
+                        run_background_handler, route, event, context, progress, object_lanes
+                    ),
+                    task_service=task_transitions,
+                    handler_logger=handler_logger,
+                    deadline_seconds=route.deadline_seconds,
+                    on_outcome=partial(event_outcomes.record, route.path, event.id),
+                )
             )
-            set_attributes(span, business_attributes)
-            handler_logger.info("Starting task %s", event.task.id)
-            await task_service.start(event.task.id)
-            try:  # noqa: WPS225
-                await run_handler(route.callback, event, context)
-            except CancelError as error:
-                record_exception(span, error)  # noqa: WPS204
-                handler_logger.info("Task %s cancelled", event.task.id)
-                await task_service.fail(event.task.id)
-                return map_exception_to_event_response(error)  # noqa: WPS204
-            except DeferError as error:
-                record_exception(span, error)
-                handler_logger.info("Task %s rescheduled", event.task.id)
-                await task_service.reschedule(event.task.id)
-                return map_exception_to_event_response(error)
-            except FailError as error:
-                record_exception(span, error)
-                handler_logger.exception("Task %s failed", event.task.id, exc_info=error)
-                await task_service.fail(event.task.id)
-                return map_exception_to_event_response(error)
-            except Exception as error:
-                record_exception(span, error)
-                handler_logger.exception("Task %s failed", event.task.id, exc_info=error)
-                await task_service.fail(event.task.id)
-                return map_exception_to_event_response(error)
-
-            handler_logger.info("Task %s completed successfully", event.task.id)
-            await task_service.complete(event.task.id)
-            return EventResponse.ok()
+        if not submitted:
+            # The runner stopped accepting work while the context was built.
+            handler_logger.warning("Task %s rescheduled: it could not be submitted", event.task.id)
+            await task_transitions.reschedule(event.task.id)
+            return EventResponse.reschedule(seconds=MIN_SATURATION_DELAY_SECONDS)
+        return EventResponse.ok()
 
     return router
 
 
-# TODO: Refactor event route builders in a separate PR.
-def create_non_task_event_route(  # ruff:ignore[complex-structure]  # noqa: WPS213
+def create_non_task_event_route(
     route: EventRouteDefinition, extension_app: ExtensionApp
 ) -> APIRouter:
     """Create a FastAPI router for a non-task event handler."""
@@ -107,70 +162,65 @@ def create_non_task_event_route(  # ruff:ignore[complex-structure]  # noqa: WPS2
     handler_logger = logging.getLogger(route.callback.__module__)
 
     @router.post(route.path, status_code=status.HTTP_200_OK, response_model=EventResponse)
-    async def handle_event(  # noqa: WPS212, WPS213, WPS430
-        request: Request, event: Event
+    async def handle_event(  # noqa: WPS430
+        request: Request,
+        event: Event,
+        object_lanes: Annotated[ObjectLanes, Depends(get_object_lanes)],
+        event_outcomes: Annotated[EventOutcomes, Depends(get_event_outcomes)],
     ) -> EventResponse:
         handler_logger.info("Received event (%s): %s", event.id, event.to_dict())
         set_event_context()
-        try:
-            context = await build_authenticated_context(
-                request, event, handler_logger, extension_app
-            )
-        except AuthenticationError as error:
-            handler_logger.exception("Event authentication failed", exc_info=error)
-            return map_exception_to_event_response(error)  # noqa: WPS204
-        context = extension_app.build_context(route, context)
-        with start_event_span(route.path, task_based=False, event=event) as span:
-            business_attributes = get_business_attributes(context)
-            set_event_context(
-                order_id=str(business_attributes.get("order.id", "")),
-                agreement_id=str(business_attributes.get("agreement.id", "")),
+        async with object_lanes.acquire(event.object.id, merge_key=route.path) as acquired:
+            if not acquired:
+                handler_logger.info(
+                    "Event (%s) merged into a later delivery for %s", event.id, event.object.id
+                )
+                return EventResponse.ok()
+            replayed = await replay_outcome(event_outcomes, route, event, handler_logger)
+            if replayed is not None:
+                return replayed
+            context = await build_route_context(
+                request, event, route, extension_app, handler_logger
             )
-            set_attributes(span, business_attributes)
-            try:  # noqa: WPS225
-                await run_handler(route.callback, event, context)
-            except CancelError as error:
-                record_exception(span, error)
-                handler_logger.info("Event (%s) canceled", event.id)
-                return map_exception_to_event_response(error)
-            except DeferError as error:
-                record_exception(span, error)
-                handler_logger.info("Event (%s) rescheduled", event.id)
-                return map_exception_to_event_response(error)
-            except FailError as error:
-                record_exception(span, error)
-                handler_logger.exception("Event (%s) failed", event.id, exc_info=error)
-                return map_exception_to_event_response(error)
-            except Exception as error:
-                record_exception(span, error)
-                handler_logger.exception("Unhandled error", exc_info=error)
-                return map_exception_to_event_response(error)
-
-            return EventResponse.ok()
+            if isinstance(context, EventResponse):
+                return context
+            response = await process_event(route, event, context, handler_logger)
+            await event_outcomes.record(route.path, event.id, response)
+            return response
 
     return router
 
 
-async def build_authenticated_context(
-    request: Request,
+async def replay_outcome(
+    event_outcomes: EventOutcomes,
+    route: EventRouteDefinition,
     event: Event,
     handler_logger: logging.Logger,
-    extension_app: ExtensionApp,
-) -> EventBaseContext:
-    """Build an event context after authenticating the incoming request."""
-    auth = RequestAuthenticationService().authenticate(request)
-    return await build_context(
-        event,
-        handler_logger,
-        auth=auth,
-        mpt_api_service_type=extension_app.mpt_api_service_type,
-    )
+) -> EventResponse | None:
+    """Return the recorded outcome of an event that the route already processed."""
+    replayed = await event_outcomes.replay(route.path, event.id)
+    if replayed is not None:
+        handler_logger.info("Event (%s) was already processed, replaying its outcome", event.id)
+    return replayed
 
 
-async def run_handler(
-    event_handler: EventRouteCallback, event: Any, context: EventBaseContext
-) -> None:
-    """Invoke a handler and await the result if it is a coroutine."""
-    handler_result = event_handler(event, context)
-    if isawaitable(handler_result):
-        await handler_result
+def refuse_background_task(
+    task_runner: AsyncTaskRunner,
+    task_id: str,
+    handler_logger: logging.Logger,
+    *,
+    reserved: bool,
+) -> EventResponse | None:
+    """Return the response to a task the runner cannot accept now, if any."""
+    if not reserved:
+        handler_logger.info("Task %s is already being processed", task_id)
+        return EventResponse.ok()
+    defer_seconds = task_runner.saturation_delay()
+    if defer_seconds is None:
+        return None
+    handler_logger.warning(
+        "Task %s deferred for %s seconds: background task capacity is exhausted",
+        task_id,
+        defer_seconds,
+    )
+    return EventResponse.reschedule(seconds=defer_seconds)
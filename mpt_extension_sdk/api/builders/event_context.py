@@ -0,0 +1,149 @@
+import asyncio
+import logging
+from collections.abc import Awaitable
+
+from fastapi import Request
+
+from mpt_extension_sdk.api.auth import AuthenticationError, RequestAuthenticationService
+from mpt_extension_sdk.api.models.events import Event, EventResponse, TaskEvent
+from mpt_extension_sdk.errors.mapping import map_exception_to_event_response
+from mpt_extension_sdk.extension_app import ExtensionApp
+from mpt_extension_sdk.pipeline import EventBaseContext, build_context
+from mpt_extension_sdk.pipeline.factory import assert_extension_id_matches
+from mpt_extension_sdk.pipeline.hydration import PhaseTimings
+from mpt_extension_sdk.routing import EventRouteDefinition
+from mpt_extension_sdk.runtime.task_transitions import TaskTransitionService
+from mpt_extension_sdk.services.mpt_api_service.task import TaskService
+from mpt_extension_sdk.services.mpt_api_service.task_progress import TaskProgressReporter
+from mpt_extension_sdk.settings.runtime import get_runtime_settings
+
+logger = logging.getLogger(__name__)
+
+
+async def build_route_context(  # noqa: WPS211
+    request: Request,
+    event: Event,
+    route: EventRouteDefinition,
+    extension_app: ExtensionApp,
+    handler_logger: logging.Logger,
+    *,
+    task_service: TaskService | None = None,
+    task_transitions: TaskTransitionService | None = None,
+    progress: TaskProgressReporter | None = None,
+) -> EventBaseContext | EventResponse:
+    """Build the route context of an event, or the response to a rejected request.
+
+    The task progress reporter is attached to the base context before it is adapted
+    with the route context adapter, and a failing adapter is handled like a failed
+    fetch.
+    """
+    try:
+        return await build_authenticated_context(
+            request,
+            event,
+            route,
+            extension_app,
+            handler_logger,
+            task_service=task_service,
+            task_transitions=task_transitions,
+            progress=progress,
+        )
+    except AuthenticationError as error:
+        handler_logger.exception("Event authentication failed", exc_info=error)
+        return map_exception_to_event_response(error)
+
+
+def build_task_progress(event: TaskEvent, task_service: TaskService) -> TaskProgressReporter:
+    """Build the progress reporter of the task of an event."""
+    return TaskProgressReporter(
+        task_service,
+        event.task.id,
+        interval_seconds=get_runtime_settings().task_progress_interval_seconds,
+    )
+
+
+async def build_authenticated_context(  # noqa: WPS211
+    request: Request,
+    event: Event,
+    route: EventRouteDefinition,
+    extension_app: ExtensionApp,
+    handler_logger: logging.Logger,
+    *,
+    task_service: TaskService | None = None,
+    task_transitions: TaskTransitionService | None = None,
+    progress: TaskProgressReporter | None = None,
+) -> EventBaseContext:
+    """Build a route context after authenticating the incoming request.
+
+    With a task service, the task of a task event is started while the context is
+    built: starting it only needs the extension token, so it overlaps the account
+    token mint, the object fetch and the route context adapter. The token is checked
+    against the extension first, so a task is never started for a request meant
+    for another extension. With a lazy route, the object is only fetched when the
+    context is hydrated. The phase durations are kept in `context.timings`.
+    """
+    timings = PhaseTimings()
+    with timings.measure("authenticate"):
+        auth = RequestAuthenticationService().authenticate(request)
+        assert_extension_id_matches(auth, get_runtime_settings())
+    base_context_build = timings.timed(
+        "context",
+        build_context(
+            event,
+            handler_logger,
+            auth=auth,
+            mpt_api_service_type=extension_app.mpt_api_service_type,
+            projection=route.projection,
+            lazy=route.lazy,
+        ),
+    )
+    context_build = adapt_route_context(base_context_build, route, extension_app, timings, progress)
+    if task_service is None or not isinstance(event, TaskEvent):
+        return await context_build
+    return await start_task_during(
+        context_build, event.task.id, task_service, task_transitions or task_service, timings
+    )
+
+
+async def adapt_route_context(
+    base_context_build: Awaitable[EventBaseContext],
+    route: EventRouteDefinition,
+    extension_app: ExtensionApp,
+    timings: PhaseTimings,
+    progress: TaskProgressReporter | None,
+) -> EventBaseContext:
+    """Await a base context, attach the timings and task progress, and adapt it."""
+    context = await base_context_build
+    context.timings = timings.durations
+    if progress is not None:
+        context.progress = progress
+    adapted: EventBaseContext = extension_app.build_context(route, context)
+    return adapted
+
+
+async def start_task_during(
+    context_build: Awaitable[EventBaseContext],
+    task_id: str,
+    task_service: TaskService,
+    task_transitions: TaskTransitionService,
+    timings: PhaseTimings,
+) -> EventBaseContext:
+    """Start a task while the context of its event is built.
+
+    A task started for a context that fails to build is rescheduled through the task
+    transitions before the error is raised, so a transient fetch failure leaves it
+    to a later delivery instead of failing it.
+    """
+    logger.info("Starting task %s", task_id)
+    context, started = await asyncio.gather(
+        context_build,
+        timings.timed("task_start", task_service.start(task_id)),
+        return_exceptions=True,
+    )
+    if isinstance(started, BaseException):
+        raise started
+    if isinstance(context, BaseException):
+        logger.warning("Rescheduling task %s: its context could not be built", task_id)
+        await task_transitions.reschedule(task_id)
+        raise context
+    return context
@@ -0,0 +1,144 @@
+import logging
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from opentelemetry.trace import Span
+
+from mpt_extension_sdk.api.models.events import Event, EventResponse, TaskEvent
+from mpt_extension_sdk.errors.mapping import map_exception_to_event_response
+from mpt_extension_sdk.errors.pipeline import CancelError, DeferError, FailError
+from mpt_extension_sdk.observability.tracing import (
+    get_business_attributes,
+    get_timing_attributes,
+    record_exception,
+    set_attributes,
+    start_event_span,
+)
+from mpt_extension_sdk.pipeline import EventBaseContext
+from mpt_extension_sdk.routing import EventRouteCallback, EventRouteDefinition
+from mpt_extension_sdk.runtime.logging import set_event_context
+from mpt_extension_sdk.runtime.object_lanes import ObjectLanes
+from mpt_extension_sdk.runtime.sync_executor import run_callback
+from mpt_extension_sdk.runtime.task_transitions import TaskTransitionService
+from mpt_extension_sdk.services.mpt_api_service.task_progress import TaskProgressReporter
+
+TaskHandler = Callable[[TaskEvent, EventBaseContext], Awaitable[None] | None]
+EventHandler = Callable[[Event, EventBaseContext], Awaitable[None] | None]
+
+
+@contextmanager
+def start_handler_span(
+    route: EventRouteDefinition, event: Event, context: EventBaseContext, *, task_based: bool
+) -> Iterator[Span]:
+    """Start the span of a handler run and tag it and the logs with the event objects."""
+    with start_event_span(route.path, task_based=task_based, event=event) as span:
+        business_attributes = get_business_attributes(context)
+        set_event_context(
+            order_id=str(business_attributes.get("order.id", "")),
+            agreement_id=str(business_attributes.get("agreement.id", "")),
+        )
+        set_attributes(span, {**business_attributes, **get_timing_attributes(context)})
+        yield span
+
+
+async def process_task_event(  # noqa: WPS211, WPS213
+    route: EventRouteDefinition,
+    event: TaskEvent,
+    context: EventBaseContext,
+    progress: TaskProgressReporter,
+    task_transitions: TaskTransitionService,
+    handler_logger: logging.Logger,
+) -> EventResponse:
+    """Run a task handler and move the task to the state matching its outcome."""
+    with start_handler_span(route, event, context, task_based=True) as span:
+        try:  # noqa: WPS225
+            async with progress:
+                await run_handler(route.callback, event, context)
+        except CancelError as error:
+            record_exception(span, error)
+            handler_logger.info("Task %s cancelled", event.task.id)
+            await task_transitions.fail(event.task.id)
+            return map_exception_to_event_response(error)
+        except DeferError as error:
+            record_exception(span, error)
+            handler_logger.info("Task %s rescheduled", event.task.id)
+            await task_transitions.reschedule(event.task.id)
+            return map_exception_to_event_response(error)
+        except Exception as error:
+            record_exception(span, error)
+            handler_logger.exception("Task %s failed", event.task.id, exc_info=error)
+            await task_transitions.fail(event.task.id)
+            return map_exception_to_event_response(error)
+
+        handler_logger.info("Task %s completed successfully", event.task.id)
+        await task_transitions.complete(event.task.id)
+        return EventResponse.ok()
+
+
+async def process_event(  # noqa: WPS213
+    route: EventRouteDefinition,
+    event: Event,
+    context: EventBaseContext,
+    handler_logger: logging.Logger,
+) -> EventResponse:
+    """Run a non-task handler and map its outcome to the event response."""
+    with start_handler_span(route, event, context, task_based=False) as span:
+        try:  # noqa: WPS225
+            await run_handler(route.callback, event, context)
+        except CancelError as error:
+            record_exception(span, error)
+            handler_logger.info("Event (%s) canceled", event.id)
+            return map_exception_to_event_response(error)
+        except DeferError as error:
+            record_exception(span, error)
+            handler_logger.info("Event (%s) rescheduled", event.id)
+            return map_exception_to_event_response(error)
+        except FailError as error:
+            record_exception(span, error)
+            handler_logger.exception("Event (%s) failed", event.id, exc_info=error)
+            return map_exception_to_event_response(error)
+        except Exception as error:
+            record_exception(span, error)
+            handler_logger.exception("Unhandled error", exc_info=error)
+            return map_exception_to_event_response(error)
+
+        return EventResponse.ok()
+
+
+async def run_handler(
+    event_handler: EventRouteCallback, event: Any, context: EventBaseContext
+) -> None:
+    """Invoke a handler, running synchronous handlers in the sync executor."""
+    await run_callback(event_handler, event, context)
+
+
+async def run_background_handler(
+    route: EventRouteDefinition,
+    event: TaskEvent,
+    context: EventBaseContext,
+    progress: TaskProgressReporter,
+    object_lanes: ObjectLanes,
+) -> None:
+    """Run a background task handler in its object lane and flush its progress.
+
+    The context was hydrated before the lane was taken, while an earlier delivery
+    for the object may still have been changing it, so its object is reloaded once
+    the lane is held.
+    """
+    async with object_lanes.acquire(event.object.id):
+        if object_lanes.enabled:
+            await context.refresh()
+        await run_traced_handler(route, event, context, progress)
+
+
+async def run_traced_handler(
+    route: EventRouteDefinition,
+    event: TaskEvent,
+    context: EventBaseContext,
+    progress: TaskProgressReporter,
+) -> None:
+    """Run a task handler in its event span and flush its progress."""
+    with start_handler_span(route, event, context, task_based=True):
+        async with progress:
+            await run_handler(route.callback, event, context)
@@ -1,5 +1,4 @@
 import logging
-from inspect import isawaitable
 from typing import TYPE_CHECKING, Any
 
 from fastapi import Request, Response, status
@@ -14,6 +13,7 @@ from mpt_extension_sdk.api.responses import APIResponse
 from mpt_extension_sdk.observability.tracing import record_exception, start_api_span
 from mpt_extension_sdk.pipeline import build_api_context
 from mpt_extension_sdk.runtime.logging import correlation_id_ctx
+from mpt_extension_sdk.runtime.sync_executor import run_callback
 
 if TYPE_CHECKING:
     from mpt_extension_sdk.extension_app import ExtensionApp
@@ -151,10 +151,11 @@ class APIRequestExecutor:  # noqa: WPS214
         return self._build_api_error_response(error, request=request)
 
     async def _run_api_handler(self, kwargs: dict[str, Any]) -> APIResponse:
-        """Invoke an API handler and return the resulting SDK response."""
-        response = self._route.callback(**kwargs)
-        if isawaitable(response):
-            response = await response
+        """Invoke an API handler and return the resulting SDK response.
+
+        Synchronous handlers run in the sync executor to keep the event loop free.
+        """
+        response = await run_callback(self._route.callback, **kwargs)
         if not isinstance(response, APIResponse):
             raise TypeError("API handlers must return APIResponse")
         return response
@@ -1,3 +1,6 @@
+from typing import Any
+
+
 class ExtRuntimeError(Exception):
     """Base runtime exception for SDK errors."""
 
@@ -10,6 +13,27 @@ class AsyncTasksRunnerError(ExtRuntimeError):
         super().__init__(message)
 
 
+class PartialFetchError(ExtRuntimeError):
+    """Raised when some chunks of a bulk fetch by ID fail."""
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        resources: list[Any],
+        failed_ids: list[str],
+        errors: list[Exception],
+    ) -> None:
+        self.resources = resources
+        self.failed_ids = failed_ids
+        self.errors = errors
+        super().__init__(message)
+
+
+class ContextNotHydratedError(ExtRuntimeError):
+    """Raised when the object of a lazily built context is read before it is loaded."""
+
+
 class ConfigError(ExtRuntimeError):
     """Raised when runtime or metadata configuration is invalid."""
 
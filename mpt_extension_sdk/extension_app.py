@@ -4,13 +4,13 @@ from typing import Any
 from mpt_extension_sdk.extension_validator import ExtensionValidator
 from mpt_extension_sdk.routing import (
     BaseRouteDefinition,
-    EventDeliveryMode,
     EventRouteDefinition,
     ScheduleRouteDefinition,
 )
 from mpt_extension_sdk.routing.routers.base import BaseExtensionRouter
 from mpt_extension_sdk.routing.validators import RouteValidator
 from mpt_extension_sdk.runtime.builders import PlugMetadataBuilder
+from mpt_extension_sdk.runtime.event_outcomes import EventOutcomeStore
 from mpt_extension_sdk.runtime.models import MetaConfig, MetaEvent, MetaPlug, MetaSchedule
 from mpt_extension_sdk.services.mpt_api_service import MPTAPIService
 
@@ -23,6 +23,7 @@ class ExtensionApp:
     version: str = "6.0.0"
     openapi: str = "/bypass/openapi.json"
     mpt_api_service_type: type[MPTAPIService] = field(default=MPTAPIService)
+    event_outcome_store: EventOutcomeStore | None = None
     _routes: list[BaseRouteDefinition] = field(default_factory=list, init=False, repr=False)
 
     def __post_init__(self) -> None:
@@ -63,7 +64,7 @@ class ExtensionApp:
                     event=route.event,
                     condition=route.condition,
                     path=route.path,
-                    task=route.delivery_mode == EventDeliveryMode.TASK,
+                    task=route.task_based,
                 )
                 for route in self._routes
                 if isinstance(route, EventRouteDefinition)
@@ -11,6 +11,7 @@ from mpt_extension_sdk.observability.tracing import (
     get_business_attributes,
     set_attributes,
 )
+from mpt_extension_sdk.runtime.sync_executor import get_sync_executor
 
 if TYPE_CHECKING:
     from mpt_extension_sdk.pipeline import BasePipeline, BaseStep, EventBaseContext
@@ -42,9 +43,13 @@ SPAN_ATTRIBUTE_RESOLUTION_ERRORS: tuple[type[Exception], ...] = (
 
 
 def trace_span(
-    name: str, attributes: SpanAttributes | None = None
+    name: str, attributes: SpanAttributes | None = None, *, offload: bool = False
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
-    """Start a child span around extension-defined business code."""
+    """Start a child span around extension-defined business code.
+
+    With `offload`, a synchronous function becomes awaitable and runs in the sync
+    executor inside the span, so its blocking work stays off the event loop.
+    """
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
         if iscoroutinefunction(func):
@@ -57,6 +62,9 @@ def trace_span(
 
             return async_wrapper
 
+        if offload:
+            return _offload_in_span(func, name, attributes)
+
         @wraps(func)
         def sync_wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: WPS430
             with TRACER.start_as_current_span(name) as span:
@@ -122,6 +130,20 @@ def start_step_span[
     return cast(StepCallable[PipelineT, StepT, CtxT, ReturnT, ParamT], wrapper)
 
 
+def _offload_in_span(
+    func: Callable[..., Any], name: str, attributes: SpanAttributes | None
+) -> Callable[..., Awaitable[Any]]:
+    """Wrap a synchronous function to run in the sync executor inside a span."""
+
+    @wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with TRACER.start_as_current_span(name) as span:
+            set_attributes(span, _resolve_span_attributes(attributes, args, kwargs))
+            return await get_sync_executor().run(func, *args, **kwargs)
+
+    return wrapper
+
+
 def _resolve_span_attributes(
     attributes: SpanAttributes | None, args: SpanArgs, kwargs: SpanKwargs
 ) -> Attributes:
@@ -115,6 +115,14 @@ def set_attributes(span: Span, attributes: Attributes) -> None:
             span.set_attribute(key, att_value)
 
 
+def get_timing_attributes(ctx: Any) -> Attributes:
+    """Return the phase durations that prepared a context, in milliseconds."""
+    attributes: Attributes = {}
+    for phase, seconds in (getattr(ctx, "timings", None) or {}).items():
+        attributes[f"mpt.hydration.{phase}_ms"] = round(seconds * 1000, 3)
+    return attributes
+
+
 def get_business_attributes(ctx: Any) -> Attributes:
     """Return business dimensions for the current agreement/order context."""
     attributes: Attributes = {}
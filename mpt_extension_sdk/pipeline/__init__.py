@@ -17,7 +17,7 @@ from mpt_extension_sdk.pipeline.context.order import (
 )
 from mpt_extension_sdk.pipeline.decorators import refresh_order
 from mpt_extension_sdk.pipeline.factory import build_api_context, build_context
-from mpt_extension_sdk.pipeline.step import BaseStep
+from mpt_extension_sdk.pipeline.step import BaseStep, ContextSnapshot, CPUBoundStep
 
 __all__ = [  # noqa: WPS410
     "AgreementContext",
@@ -26,6 +26,8 @@ __all__ = [  # noqa: WPS410
     "AgreementStatusActionType",
     "BasePipeline",
     "BaseStep",
+    "CPUBoundStep",
+    "ContextSnapshot",
     "EventBaseContext",
     "EventMetadata",
     "OrderContext",
@@ -63,7 +63,7 @@ class BasePipeline(ABC):  # noqa: WPS214
         """Execute a single step inside its tracing span."""
         ctx.logger.info("Running step %s", step.name)
         try:  # noqa: WPS225
-            await step.run(ctx)
+            await self._run_step(step, ctx)
         except DeferStepError as error:
             await self.on_step_deferred(step, ctx, error)
             raise DeferError(str(error), delay_seconds=error.delay_seconds) from error
@@ -77,3 +77,9 @@ class BasePipeline(ABC):  # noqa: WPS214
             raise
         else:
             await self.on_step_succeeded(step, ctx)
+
+    async def _run_step(self, step: "BaseStep", ctx: "EventBaseContext") -> None:
+        """Hydrate a lazily built context when the step needs it, then run the step."""
+        if step.hydrate_context:
+            await ctx.hydrate()
+        await step.run(ctx)
@@ -1,9 +1,9 @@
 from dataclasses import dataclass, field
 from enum import StrEnum
-from typing import Any
+from typing import Any, override
 
 from mpt_extension_sdk.models import Agreement
-from mpt_extension_sdk.pipeline.context.event import EventBaseContext
+from mpt_extension_sdk.pipeline.context.event import EventBaseContext, UnloadedObject
 
 
 class AgreementStatusActionType(StrEnum):
@@ -42,6 +42,36 @@ class AgreementContext(EventBaseContext):
         """Agreement ID."""
         return self.agreement.id
 
+    @property
+    def agreement_loaded(self) -> bool:
+        """False while `agreement` is the `UnloadedObject` of a lazily built context."""
+        return not isinstance(self.agreement, UnloadedObject)
+
+    @override
+    async def hydrate(self) -> None:
+        """Fetch the agreement of a lazily built context; a no-op once loaded."""
+        await self.load_agreement()
+
+    async def load_agreement(self) -> Agreement:
+        """Return the agreement, fetching it on first use when the context is lazy."""
+        if not self.agreement_loaded:
+            self.agreement = await self.mpt_api_service.agreements.get_by_id(
+                self.agreement_id, self.meta.projection
+            )
+        return self.agreement
+
+    @override
+    async def refresh(self) -> None:
+        """Reload the agreement if it was already loaded; a lazy one is loaded on first use."""
+        if self.agreement_loaded:
+            await self.refresh_agreement()
+
     async def refresh_agreement(self) -> None:
-        """Reload the current agreement from Marketplace."""
-        self.agreement = await self.mpt_api_service.agreements.get_by_id(self.agreement_id)
+        """Reload the current agreement from Marketplace with the route projection.
+
+        The agreement is fetched again even when the entity cache holds it, so writes made
+        through other services, e.g. subscriptions created inside the agreement, are seen.
+        """
+        self.agreement = await self.mpt_api_service.agreements.get_by_id(
+            self.agreement_id, self.meta.projection, refresh=True
+        )
@@ -2,6 +2,30 @@ from dataclasses import dataclass, field
 from typing import Any
 
 from mpt_extension_sdk.context import BaseContext
+from mpt_extension_sdk.errors.runtime import ContextNotHydratedError
+from mpt_extension_sdk.services.mpt_api_service.projection import ProjectionProfile
+from mpt_extension_sdk.services.mpt_api_service.task_progress import TaskProgressReporter
+
+
+class UnloadedObject:
+    """Stand-in for the order or agreement of a lazily built context.
+
+    Only `id` can be read until the object is loaded; any other attribute raises
+    `ContextNotHydratedError` instead of returning empty data.
+    """
+
+    def __init__(self, object_type: str, object_id: str) -> None:
+        self.object_type = object_type
+        self.id = object_id
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        attributes = self.__dict__
+        raise ContextNotHydratedError(
+            f"{attributes.get('object_type')} {attributes.get('id')} is not loaded: "
+            "hydrate the context before reading its attributes"
+        )
 
 
 @dataclass(frozen=True)
@@ -15,6 +39,7 @@ class EventMetadata:
 
     correlation_id: str | None = None
     installation_id: str | None = None
+    projection: ProjectionProfile = ProjectionProfile.FULL
 
 
 @dataclass(kw_only=True)
@@ -24,3 +49,15 @@ class EventBaseContext(BaseContext):
     meta: EventMetadata
 
     state: dict[str, Any] = field(default_factory=dict)
+    # Set by the runtime for task-backed events only.
+    progress: TaskProgressReporter | None = None
+    # Seconds spent in each phase that prepared the context, such as "context".
+    timings: dict[str, float] = field(default_factory=dict)
+
+    async def hydrate(self) -> None:
+        """Fetch the event object of a lazily built context; a no-op once loaded."""
+        return  # noqa: WPS324
+
+    async def refresh(self) -> None:
+        """Reload the event object if it was already loaded."""
+        return  # noqa: WPS324
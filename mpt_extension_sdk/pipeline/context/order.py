@@ -1,9 +1,9 @@
 from dataclasses import dataclass, field
 from enum import StrEnum
-from typing import Any
+from typing import Any, override
 
 from mpt_extension_sdk.models import Order
-from mpt_extension_sdk.pipeline.context.event import EventBaseContext
+from mpt_extension_sdk.pipeline.context.event import EventBaseContext, UnloadedObject
 
 
 class OrderStatusActionType(StrEnum):
@@ -43,6 +43,36 @@ class OrderContext(EventBaseContext):
         """Order ID."""
         return self.order.id
 
+    @property
+    def order_loaded(self) -> bool:
+        """False while `order` is the `UnloadedObject` of a lazily built context."""
+        return not isinstance(self.order, UnloadedObject)
+
+    @override
+    async def hydrate(self) -> None:
+        """Fetch the order of a lazily built context; a no-op once loaded."""
+        await self.load_order()
+
+    async def load_order(self) -> Order:
+        """Return the order, fetching it on first use when the context is lazy."""
+        if not self.order_loaded:
+            self.order = await self.mpt_api_service.orders.get_by_id(
+                self.order_id, self.meta.projection
+            )
+        return self.order
+
+    @override
+    async def refresh(self) -> None:
+        """Reload the order if it was already loaded; a lazy one is loaded on first use."""
+        if self.order_loaded:
+            await self.refresh_order()
+
     async def refresh_order(self) -> None:
-        """Reload the current order from Marketplace."""
-        self.order = await self.mpt_api_service.orders.get_by_id(self.order_id)
+        """Reload the current order from Marketplace with the route projection.
+
+        The order is fetched again even when the entity cache holds it, so writes made
+        through other services, e.g. subscriptions created inside the order, are seen.
+        """
+        self.order = await self.mpt_api_service.orders.get_by_id(
+            self.order_id, self.meta.projection, refresh=True
+        )
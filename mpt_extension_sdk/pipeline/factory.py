@@ -1,15 +1,21 @@
 import logging
 from dataclasses import dataclass
-from typing import Any, Self
+from typing import Any, Self, cast
 
 from mpt_extension_sdk.api.auth import AuthContext, AuthenticationError
 from mpt_extension_sdk.api.context import APIContext, AuthenticatedRequestContext
 from mpt_extension_sdk.api.models.events import Event
+from mpt_extension_sdk.models import Agreement, Order
 from mpt_extension_sdk.pipeline.context.agreement import AgreementContext
-from mpt_extension_sdk.pipeline.context.event import EventBaseContext, EventMetadata
+from mpt_extension_sdk.pipeline.context.event import (
+    EventBaseContext,
+    EventMetadata,
+    UnloadedObject,
+)
 from mpt_extension_sdk.pipeline.context.order import OrderContext
 from mpt_extension_sdk.runtime.logging import correlation_id_ctx, task_id_ctx
 from mpt_extension_sdk.services.mpt_api_service import MPTAPIService
+from mpt_extension_sdk.services.mpt_api_service.projection import ProjectionProfile
 from mpt_extension_sdk.settings.extension import BaseExtensionSettings, get_extension_settings
 from mpt_extension_sdk.settings.runtime import RuntimeSettings, get_runtime_settings
 
@@ -58,33 +64,45 @@ class RouteContextFactory:
         event: Event,
         handler_logger: logging.Logger,
         auth: AuthContext,
+        projection: ProjectionProfile = ProjectionProfile.FULL,
+        *,
+        lazy: bool = False,
     ) -> EventBaseContext:
-        """Build the fully hydrated execution context for an incoming event."""
+        """Build the hydrated execution context for an incoming event.
+
+        The event order or agreement is fetched with the relations of `projection`,
+        or only on first use through `EventBaseContext.hydrate` when `lazy` is set.
+        """
         self._assert_extension_id_matches(auth)
         api_service = await self.service_type.from_auth_context(
             base_url=self.runtime_settings.mpt_api_base_url,
             auth=auth,
         )
         return await self._build_event_context_with_model(
-            event, handler_logger, api_service, auth=auth
+            event, handler_logger, api_service, auth=auth, projection=projection, lazy=lazy
         )
 
     def _assert_extension_id_matches(self, auth: AuthContext) -> None:
         """Ensure the incoming token targets the configured extension."""
-        if auth.extension_id != self.runtime_settings.extension_id:
-            raise AuthenticationError
+        assert_extension_id_matches(auth, self.runtime_settings)
 
-    async def _build_event_context_with_model(
+    async def _build_event_context_with_model(  # noqa: WPS211
         self,
         event: Event,
         handler_logger: logging.Logger,
         api_service: MPTAPIService,
+        *,
         auth: AuthContext,
+        projection: ProjectionProfile,
+        lazy: bool,
     ) -> EventBaseContext:
-        """Build a fully hydrated execution context for the current event object."""
+        """Build an execution context for the current event object.
+
+        The object of a lazy context is an `UnloadedObject` until it is hydrated.
+        """
         common_kwargs: dict[str, Any] = {
             "logger": handler_logger,
-            "meta": self._build_execution_metadata(event),
+            "meta": self._build_execution_metadata(event, projection),
             "mpt_api_service": api_service,
             "account_settings": None,
             "ext_settings": self.extension_settings,
@@ -93,17 +111,29 @@ class RouteContextFactory:
         }
 
         object_type = event.object.object_type
+        object_id = event.object.id
         if object_type == "Order":
-            order = await api_service.orders.get_by_id(event.object.id)
+            if lazy:
+                return OrderContext(
+                    order=cast(Order, UnloadedObject(object_type, object_id)), **common_kwargs
+                )
+            order = await api_service.orders.get_by_id(object_id, projection)
             return OrderContext(order=order, **common_kwargs)
 
         if object_type == "Agreement":
-            agreement = await api_service.agreements.get_by_id(event.object.id)
+            if lazy:
+                return AgreementContext(
+                    agreement=cast(Agreement, UnloadedObject(object_type, object_id)),
+                    **common_kwargs,
+                )
+            agreement = await api_service.agreements.get_by_id(object_id, projection)
             return AgreementContext(agreement=agreement, **common_kwargs)
 
         raise RuntimeError(f"Unsupported context type: {object_type}")
 
-    def _build_execution_metadata(self, event: Event) -> EventMetadata:
+    def _build_execution_metadata(
+        self, event: Event, projection: ProjectionProfile
+    ) -> EventMetadata:
         """Build immutable execution metadata from the incoming event."""
         return EventMetadata(
             event_id=event.id,
@@ -111,6 +141,7 @@ class RouteContextFactory:
             object_type=event.object.object_type,
             correlation_id=correlation_id_ctx.get(),
             task_id=task_id_ctx.get(),
+            projection=projection,
         )
 
 
@@ -129,16 +160,30 @@ async def build_api_context(
     )
 
 
-async def build_context(
+def assert_extension_id_matches(auth: AuthContext, runtime_settings: RuntimeSettings) -> None:
+    """Ensure the incoming token targets the configured extension.
+
+    Raises:
+        AuthenticationError: If the token was issued for another extension.
+    """
+    if auth.extension_id != runtime_settings.extension_id:
+        raise AuthenticationError
+
+
+async def build_context(  # noqa: WPS211
     event: Event,
     handler_logger: logging.Logger,
     *,
     auth: AuthContext,
     mpt_api_service_type: type[MPTAPIService] = MPTAPIService,
+    projection: ProjectionProfile = ProjectionProfile.FULL,
+    lazy: bool = False,
 ) -> EventBaseContext:
-    """Build the fully hydrated execution context for an incoming event."""
+    """Build the execution context for an incoming event."""
     return await RouteContextFactory.from_service_type(mpt_api_service_type).build_event_context(
         event,
         handler_logger,
         auth,
+        projection,
+        lazy=lazy,
     )
@@ -0,0 +1,29 @@
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+
+
+class PhaseTimings:
+    """Durations of the phases that prepare an event context, in seconds.
+
+    Phases that overlap are timed independently, so their durations may add up to
+    more than the wall-clock time spent before the handler starts.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self._clock = clock
+        self.durations: dict[str, float] = {}
+
+    @contextmanager
+    def measure(self, phase: str) -> Iterator[None]:
+        """Record the duration of the enclosed block, including failed ones."""
+        started_at = self._clock()
+        try:
+            yield
+        finally:
+            self.durations[phase] = self._clock() - started_at
+
+    async def timed[ResultT](self, phase: str, awaitable: Awaitable[ResultT]) -> ResultT:
+        """Await a phase and record its duration."""
+        with self.measure(phase):
+            return await awaitable
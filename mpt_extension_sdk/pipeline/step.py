@@ -1,10 +1,22 @@
 from abc import ABC, abstractmethod
 from asyncio import CancelledError
-from typing import Any
+from dataclasses import dataclass
+from typing import Any, ClassVar, override
+
+from mpt_extension_sdk.models import Agreement, Order
+from mpt_extension_sdk.observability.tracing import TRACER
+from mpt_extension_sdk.pipeline.context.event import EventMetadata
+from mpt_extension_sdk.runtime.process_executor import get_process_executor
 
 
 class BaseStep(ABC):
-    """Base step class for pipeline execution."""
+    """Base step class for pipeline execution.
+
+    The pipeline hydrates a lazily built context before the first step that sets
+    `hydrate_context`, which every step does unless it opts out.
+    """
+
+    hydrate_context: ClassVar[bool] = True
 
     @property
     def name(self) -> str:
@@ -46,3 +58,50 @@ class BaseStep(ABC):
     async def post(self, ctx: Any) -> None:
         """Run post-processing hook."""
         return  # noqa: WPS324
+
+
+@dataclass(frozen=True)
+class ContextSnapshot:
+    """Picklable copy of the context data a CPU-bound step computes on."""
+
+    meta: EventMetadata
+    state: dict[str, Any]
+    order: Order | None = None
+    agreement: Agreement | None = None
+
+
+class CPUBoundStep(BaseStep):
+    """Step whose computation runs in the process executor.
+
+    `process` takes a picklable `snapshot` of the context, runs `compute` on it in
+    a pool process and applies the result with `merge` back on the event loop.
+    The step instance is pickled along with `compute`, so keep its attributes
+    plain data. By default `compute` returns entries merged into `ctx.state`.
+    """
+
+    @override
+    async def process(self, ctx: Any) -> None:
+        """Compute on a context snapshot in a pool process and merge the result."""
+        snapshot = self.snapshot(ctx)
+        with TRACER.start_as_current_span(f"step compute: {self.name}") as span:
+            span.set_attribute("mpt.extension.step_name", self.name)
+            computed = await get_process_executor().run(self.compute, snapshot)
+        self.merge(ctx, computed)
+
+    def snapshot(self, ctx: Any) -> Any:
+        """Return the picklable input of `compute`; override to send less data."""
+        return ContextSnapshot(
+            meta=ctx.meta,
+            state=dict(ctx.state),
+            order=getattr(ctx, "order", None),
+            agreement=getattr(ctx, "agreement", None),
+        )
+
+    @abstractmethod
+    def compute(self, snapshot: Any) -> Any:
+        """Run the CPU-bound computation in a pool process."""
+        raise NotImplementedError
+
+    def merge(self, ctx: Any, computed: Any) -> None:
+        """Apply the computation result to the context on the event loop."""
+        ctx.state.update(computed)
@@ -15,6 +15,7 @@ class EventDeliveryMode(StrEnum):
 
     EVENT = "event"
     TASK = "task"
+    BACKGROUND_TASK = "background_task"
 
 
 class HTTPMethod(StrEnum):
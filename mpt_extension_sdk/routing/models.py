@@ -10,6 +10,9 @@ from mpt_extension_sdk.routing.types import (
     ScheduleRouteCallback,
 )
 from mpt_extension_sdk.schemas import BaseSchema
+from mpt_extension_sdk.services.mpt_api_service.projection import ProjectionProfile
+
+DEFAULT_TASK_DEADLINE_SECONDS = 900.0
 
 
 @dataclass(frozen=True)
@@ -31,6 +34,14 @@ class EventRouteDefinition(BaseRouteDefinition):
     delivery_mode: EventDeliveryMode
     condition: str | None = None
     context_adapter_type: type[ContextAdapter] | None = None
+    projection: ProjectionProfile = ProjectionProfile.FULL
+    deadline_seconds: float = DEFAULT_TASK_DEADLINE_SECONDS
+    lazy: bool = False
+
+    @property
+    def task_based(self) -> bool:
+        """Whether the route handles task-backed events."""
+        return self.delivery_mode != EventDeliveryMode.EVENT
 
 
 @dataclass(frozen=True)
@@ -4,10 +4,11 @@ from typing import cast
 
 from mpt_extension_sdk.context import ContextAdapter
 from mpt_extension_sdk.routing.enums import EventDeliveryMode, RouteType
-from mpt_extension_sdk.routing.models import EventRouteDefinition
+from mpt_extension_sdk.routing.models import DEFAULT_TASK_DEADLINE_SECONDS, EventRouteDefinition
 from mpt_extension_sdk.routing.routers.base import BaseExtensionRouter
 from mpt_extension_sdk.routing.types import EventRouteCallback
 from mpt_extension_sdk.routing.validators import RouteValidator
+from mpt_extension_sdk.services.mpt_api_service.projection import ProjectionProfile
 
 _NO_CONTEXT_ADAPTER = object()
 
@@ -22,15 +23,23 @@ class EventRouter(BaseExtensionRouter):
         """Validate the default router adapter when configured."""
         RouteValidator.validate_context_adapter_type(self.context_adapter_type)
 
-    def event(
+    def event(  # noqa: WPS211
         self,
         path: str,
         name: str,
         event: str,
         condition: str | None = None,
         context_adapter_type: type[ContextAdapter] | object | None = _NO_CONTEXT_ADAPTER,
+        projection: ProjectionProfile = ProjectionProfile.FULL,
+        *,
+        lazy: bool = False,
     ) -> Callable[[EventRouteCallback], EventRouteCallback]:
-        """Register a non-task event handler on the router."""
+        """Register a non-task event handler on the router.
+
+        `projection` selects how much of the event order or agreement is fetched
+        to build the handler context. With `lazy=True` it is only fetched on first
+        use, see `EventBaseContext.hydrate`.
+        """
         return self._create_event_decorator(
             definition_payload={
                 "path": path,
@@ -43,30 +52,50 @@ class EventRouter(BaseExtensionRouter):
                     if context_adapter_type is _NO_CONTEXT_ADAPTER
                     else context_adapter_type
                 ),
+                "projection": projection,
+                "lazy": lazy,
             }
         )
 
-    def task(
+    def task(  # noqa: WPS211
         self,
         path: str,
         name: str,
         event: str,
         condition: str | None = None,
         context_adapter_type: type[ContextAdapter] | object | None = _NO_CONTEXT_ADAPTER,
+        projection: ProjectionProfile = ProjectionProfile.FULL,
+        *,
+        background: bool = False,
+        deadline_seconds: float = DEFAULT_TASK_DEADLINE_SECONDS,
+        lazy: bool = False,
     ) -> Callable[[EventRouteCallback], EventRouteCallback]:
-        """Register a task-based event handler on the router."""
+        """Register a task-based event handler on the router.
+
+        `projection` selects how much of the event order or agreement is fetched
+        to build the handler context, and `lazy=True` defers that fetch to first
+        use. With `background=True` the event is acknowledged once the task is
+        started, and the handler runs afterwards within `deadline_seconds`.
+        """
+        if deadline_seconds <= 0:
+            raise ValueError("Route deadline_seconds must be greater than 0")
         return self._create_event_decorator(
             definition_payload={
                 "path": path,
                 "name": name,
                 "event": event,
                 "condition": condition,
-                "delivery_mode": EventDeliveryMode.TASK,
+                "delivery_mode": (
+                    EventDeliveryMode.BACKGROUND_TASK if background else EventDeliveryMode.TASK
+                ),
                 "context_adapter_type": (
                     self.context_adapter_type
                     if context_adapter_type is _NO_CONTEXT_ADAPTER
                     else context_adapter_type
                 ),
+                "projection": projection,
+                "deadline_seconds": deadline_seconds,
+                "lazy": lazy,
             }
         )
 
@@ -93,6 +122,12 @@ class EventRouter(BaseExtensionRouter):
                     delivery_mode=cast(EventDeliveryMode, definition_payload["delivery_mode"]),
                     condition=cast(str | None, definition_payload["condition"]),
                     context_adapter_type=resolved_adapter_type,
+                    projection=cast(ProjectionProfile, definition_payload["projection"]),
+                    deadline_seconds=cast(
+                        float,
+                        definition_payload.get("deadline_seconds", DEFAULT_TASK_DEADLINE_SECONDS),
+                    ),
+                    lazy=cast(bool, definition_payload["lazy"]),
                 )
             )
             return event_handler
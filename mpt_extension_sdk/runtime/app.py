@@ -18,7 +18,11 @@ from mpt_extension_sdk.routing.models import (
     EventRouteDefinition,
     PlugRouteDefinition,
 )
-from mpt_extension_sdk.runtime.async_tasks import AsyncTaskRunner
+from mpt_extension_sdk.runtime.app_state import (
+    configure_runtime_state,
+    init_runtime_state,
+    release_runtime_resources,
+)
 from mpt_extension_sdk.runtime.logging import correlation_id_ctx, setup_logging, task_id_ctx
 from mpt_extension_sdk.settings.runtime import RuntimeSettings
 
@@ -68,6 +72,7 @@ def create_runtime_app(runtime_settings: RuntimeSettings) -> FastAPI:
     extension_app = load_extension_app(runtime_settings.app_module)
 
     app = _create_fastapi_app(extension_app)
+    configure_runtime_state(app, runtime_settings, extension_app)
     _configure_observability(app, observability_config)
     _configure_middlewares(app)
     _register_builtin_routes(app)
@@ -110,12 +115,16 @@ def _create_fastapi_app(extension_app: ExtensionApp) -> FastAPI:
         ASGI wrappers such as mrok's proxy pass their own wrapper object here,
         which does not expose `state`.
         """
+        if app.state.warm_up_caches:
+            await extension_app.mpt_api_service_type.warm_up_caches()
+        if app.state.task_outbox is not None:
+            app.state.task_outbox.start()
         app.state.ready = True
         try:
             yield
         finally:
             app.state.ready = False
-            await app.state.async_task_runner.shutdown()
+            await release_runtime_resources(app, extension_app)
 
     app = FastAPI(
         title="MPT Extension API",
@@ -127,7 +136,7 @@ def _create_fastapi_app(extension_app: ExtensionApp) -> FastAPI:
         lifespan=runtime_lifespan,
     )
     app.state.ready = False
-    app.state.async_task_runner = AsyncTaskRunner()
+    init_runtime_state(app)
     return app
 
 
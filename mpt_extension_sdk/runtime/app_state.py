@@ -0,0 +1,86 @@
+from pathlib import Path
+
+from fastapi import FastAPI
+
+from mpt_extension_sdk.api.builders.dependencies import get_tasks_service
+from mpt_extension_sdk.extension_app import ExtensionApp
+from mpt_extension_sdk.observability.config import ObservabilityConfig
+from mpt_extension_sdk.runtime.async_tasks import AsyncTaskRunner
+from mpt_extension_sdk.runtime.event_outcomes import (
+    EventOutcomes,
+    EventOutcomeStore,
+    InMemoryEventOutcomeStore,
+    get_event_outcome_store,
+)
+from mpt_extension_sdk.runtime.object_lanes import ObjectLanes
+from mpt_extension_sdk.runtime.process_executor import get_process_executor
+from mpt_extension_sdk.runtime.sync_executor import get_sync_executor
+from mpt_extension_sdk.runtime.task_outbox import SQLiteTaskOutboxStore, TaskOutbox
+from mpt_extension_sdk.settings.runtime import RuntimeSettings
+
+
+def init_runtime_state(app: FastAPI) -> None:
+    """Set the runtime resources of an app to their unconfigured defaults."""
+    app.state.warm_up_caches = False
+    app.state.async_task_runner = AsyncTaskRunner()
+    app.state.object_lanes = ObjectLanes(enabled=False)
+    app.state.event_outcomes = EventOutcomes()
+    app.state.task_outbox = None
+
+
+def configure_runtime_state(
+    app: FastAPI, runtime_settings: RuntimeSettings, extension_app: ExtensionApp
+) -> None:
+    """Build the runtime resources of an app and size the worker pools from the settings."""
+    app.state.warm_up_caches = runtime_settings.template_cache_warmup
+    app.state.async_task_runner = AsyncTaskRunner(
+        max_in_flight=runtime_settings.task_max_in_flight,
+        max_queued=runtime_settings.task_max_queued,
+    )
+    app.state.object_lanes = ObjectLanes(
+        enabled=runtime_settings.event_lanes_enabled,
+        merge_duplicates=runtime_settings.event_lanes_merge_duplicates,
+    )
+    app.state.event_outcomes = _build_event_outcomes(runtime_settings, extension_app)
+    app.state.task_outbox = _build_task_outbox(runtime_settings)
+    get_sync_executor().configure(max_workers=runtime_settings.sync_executor_max_workers)
+    get_process_executor().configure(
+        max_workers=runtime_settings.process_executor_max_workers,
+        observability=ObservabilityConfig.from_runtime_settings(runtime_settings),
+    )
+
+
+async def release_runtime_resources(app: FastAPI, extension_app: ExtensionApp) -> None:
+    """Stop local task executions and flush their transitions, then release the rest.
+
+    The worker pools and the Marketplace clients are released last.
+    """
+    await app.state.async_task_runner.shutdown()
+    if app.state.task_outbox is not None:
+        await app.state.task_outbox.stop()
+    get_sync_executor().shutdown()
+    get_process_executor().shutdown()
+    await extension_app.mpt_api_service_type.close_account_clients()
+
+
+def _build_event_outcomes(
+    runtime_settings: RuntimeSettings, extension_app: ExtensionApp
+) -> EventOutcomes:
+    """Build the event deduplication from the extension store or the runtime settings."""
+    store: EventOutcomeStore | None = extension_app.event_outcome_store
+    if store is None and runtime_settings.event_dedup_store_path:
+        store = get_event_outcome_store(runtime_settings.event_dedup_store_path)
+    return EventOutcomes(
+        store or InMemoryEventOutcomeStore(),
+        ttl_seconds=runtime_settings.event_dedup_ttl_seconds,
+    )
+
+
+def _build_task_outbox(runtime_settings: RuntimeSettings) -> TaskOutbox | None:
+    """Build the task transition outbox when a store path is configured."""
+    if not runtime_settings.task_outbox_path:
+        return None
+    return TaskOutbox(
+        SQLiteTaskOutboxStore(Path(runtime_settings.task_outbox_path)),
+        get_tasks_service(runtime_settings),
+    )
@@ -1,18 +1,25 @@
 import asyncio
 import logging
+import math
+import time
 from collections.abc import Awaitable, Callable, Iterator
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass
 
+from mpt_extension_sdk.api.models.events import EventResponse
+from mpt_extension_sdk.errors.mapping import map_exception_to_event_response
 from mpt_extension_sdk.errors.runtime import AsyncTasksRunnerError
-from mpt_extension_sdk.runtime.task_transitions import SafeTaskTransitions
-from mpt_extension_sdk.services.mpt_api_service.task import TaskService
+from mpt_extension_sdk.runtime.task_transitions import SafeTaskTransitions, TaskTransitionService
 
 logger = logging.getLogger(__name__)
 
 AsyncTaskHandler = Callable[[], Awaitable[None]]
+TaskOutcomeCallback = Callable[[EventResponse], Awaitable[None]]
 PROCESSING_TIMEOUT_REASON = "Processing timeout exceeded"
 SHUTDOWN_INTERRUPTION_REASON = "Interrupted by instance shutdown"
+MIN_SATURATION_DELAY_SECONDS = 30
+MAX_SATURATION_DELAY_SECONDS = 900
+DURATION_SMOOTHING = 0.2
 
 
 @dataclass(frozen=True)
@@ -21,9 +28,11 @@ class TaskExecution:
 
     task_id: str
     task_callback: AsyncTaskHandler
-    task_service: TaskService
+    task_service: TaskTransitionService
     handler_logger: logging.Logger
     deadline_seconds: float
+    # Receives the event response matching the task outcome once it is transitioned.
+    on_outcome: TaskOutcomeCallback | None = None
 
 
 @dataclass(frozen=True)
@@ -34,14 +43,47 @@ class RunningTask:
     transitions: SafeTaskTransitions
 
 
-class AsyncTaskRunner:
-    """Run SDK-managed tasks outside the HTTP request lifecycle."""
+class AsyncTaskRunner:  # noqa: WPS214
+    """Run SDK-managed tasks outside the HTTP request lifecycle.
 
-    def __init__(self) -> None:
+    At most `max_in_flight` handlers run at once (`0` means unlimited), and up to
+    `max_queued` more accepted tasks wait for a free slot. Beyond that the runner
+    is saturated and new tasks should be deferred with `saturation_delay`.
+    """
+
+    def __init__(self, *, max_in_flight: int = 0, max_queued: int = 0) -> None:
         """Initialize an empty local task registry."""
+        if max_in_flight < 0 or max_queued < 0:
+            raise ValueError("max_in_flight and max_queued cannot be negative")
         self._reserved: dict[str, asyncio.Task[object] | None] = {}
         self._running: dict[str, RunningTask] = {}
         self._shutting_down = False
+        self._max_in_flight = max_in_flight
+        self._max_queued = max_queued
+        self._slots = asyncio.Semaphore(max_in_flight) if max_in_flight else None
+        self._average_duration_seconds = float(MIN_SATURATION_DELAY_SECONDS)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of accepted tasks, running or waiting for a slot."""
+        return len(self._running)
+
+    def saturation_delay(self) -> int | None:
+        """Return the Defer delay for the task being accepted when the runner is full.
+
+        Call it while holding the task reservation. The delay scales the average
+        handler duration by the number of accepted tasks per slot.
+
+        Returns:
+            The delay in seconds, or None when the task can be accepted.
+        """
+        if self._slots is None:
+            return None
+        accepted = len(self._running) + len(self._reserved)
+        if accepted <= self._max_in_flight + self._max_queued:
+            return None
+        delay = math.ceil(self._average_duration_seconds * accepted / self._max_in_flight)
+        return max(MIN_SATURATION_DELAY_SECONDS, min(delay, MAX_SATURATION_DELAY_SECONDS))
 
     def is_running(self, task_id: str) -> bool:
         """Return whether this process is already executing a task."""
@@ -109,18 +151,26 @@ class AsyncTaskRunner:
             )
         )
 
-    async def _run_task(self, execution: TaskExecution) -> None:  # noqa: WPS213
+    async def _run_task(self, execution: TaskExecution) -> None:
+        # The task stays registered until its outcome is recorded, so a redelivery
+        # arriving meanwhile is not started again.
+        try:  # noqa: WPS501
+            await self._report_outcome(execution, await self._execute(execution))
+        finally:
+            self._running.pop(execution.task_id, None)
+
+    async def _execute(self, execution: TaskExecution) -> EventResponse:  # noqa: WPS213
+        """Run a task and transition it, returning the matching event response."""
         transitions = SafeTaskTransitions(execution.task_service, execution.handler_logger)
         try:
-            await asyncio.wait_for(
-                execution.task_callback(),
-                timeout=execution.deadline_seconds,
-            )
+            async with self._slots or nullcontext():
+                await self._run_callback(execution)
         except TimeoutError:
             execution.handler_logger.exception(
                 "Async task %s exceeded its processing timeout", execution.task_id
             )
             await transitions.fail(execution.task_id, reason=PROCESSING_TIMEOUT_REASON)
+            return EventResponse.cancel(reason=PROCESSING_TIMEOUT_REASON)
         except asyncio.CancelledError:
             # shutdown() fails the interrupted platform tasks after cancellation.
             execution.handler_logger.warning(
@@ -129,11 +179,33 @@ class AsyncTaskRunner:
             raise
         except Exception as error:
             await transitions.transition_on_error(execution.task_id, error)
-        else:
-            execution.handler_logger.info("Async task %s completed successfully", execution.task_id)
-            await transitions.complete(execution.task_id)
-        finally:
-            self._running.pop(execution.task_id, None)
+            return map_exception_to_event_response(error)
+        execution.handler_logger.info("Async task %s completed successfully", execution.task_id)
+        await transitions.complete(execution.task_id)
+        return EventResponse.ok()
+
+    async def _report_outcome(self, execution: TaskExecution, outcome: EventResponse) -> None:
+        """Pass the outcome of a finished task to its callback, logging its errors."""
+        if execution.on_outcome is None:
+            return
+        try:
+            await execution.on_outcome(outcome)
+        except Exception:
+            execution.handler_logger.exception(
+                "Failed to record the outcome of async task %s", execution.task_id
+            )
+
+    async def _run_callback(self, execution: TaskExecution) -> None:
+        """Run the task callback within its deadline once it holds a slot."""
+        started_at = time.monotonic()
+        await asyncio.wait_for(execution.task_callback(), timeout=execution.deadline_seconds)
+        self._record_duration(time.monotonic() - started_at)
+
+    def _record_duration(self, duration_seconds: float) -> None:
+        """Fold a completed handler duration into the average used for Defer delays."""
+        self._average_duration_seconds += DURATION_SMOOTHING * (
+            duration_seconds - self._average_duration_seconds
+        )
 
     def _get_current_task(self) -> asyncio.Task[object] | None:
         """Return the current asyncio task when running inside an event loop."""
@@ -0,0 +1,139 @@
+import sqlite3
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import lru_cache
+from pathlib import Path
+from typing import Protocol
+
+from mpt_extension_sdk.api.models.events import EventResponse, ResponseEnum
+from mpt_extension_sdk.runtime.sqlite_file import SQLiteFile
+
+DEFAULT_MAX_ENTRIES = 4096
+# Deferred events are redelivered on purpose, so only final outcomes are replayed.
+REPLAYABLE_RESPONSES = frozenset((ResponseEnum.OK, ResponseEnum.CANCEL))
+
+
+class EventOutcomeStore(Protocol):
+    """Store of recorded event outcomes keyed by route path and event id.
+
+    `load` and `save` are awaited on the event loop; a store doing blocking I/O runs
+    it in a worker thread.
+    """
+
+    async def load(self, key: str) -> EventResponse | None:
+        """Return the unexpired outcome recorded for a key, if any."""
+
+    async def save(self, key: str, outcome: EventResponse, ttl_seconds: float) -> None:
+        """Record the outcome of a key for `ttl_seconds`."""
+
+
+class InMemoryEventOutcomeStore:
+    """Process-local outcome store bounded to the most recent `max_entries` events."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max_entries
+        self._clock = clock
+        self._outcomes: OrderedDict[str, tuple[float, EventResponse]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._outcomes)
+
+    async def load(self, key: str) -> EventResponse | None:
+        """Return the unexpired outcome recorded for a key, if any."""
+        entry = self._outcomes.get(key)
+        if entry is None:
+            return None
+        expires_at, outcome = entry
+        if expires_at <= self._clock():
+            self._outcomes.pop(key)
+            return None
+        return outcome
+
+    async def save(self, key: str, outcome: EventResponse, ttl_seconds: float) -> None:
+        """Record the outcome of a key, evicting the oldest entries beyond the bound."""
+        self._outcomes[key] = (self._clock() + ttl_seconds, outcome)
+        self._outcomes.move_to_end(key)
+        while len(self._outcomes) > self._max_entries:
+            self._outcomes.popitem(last=False)
+
+
+class SQLiteEventOutcomeStore:
+    """Outcome store kept in a local SQLite file shared by the workers of a host.
+
+    A redelivery routed to another worker then still finds the recorded outcome.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._database = SQLiteFile(
+            path,
+            "CREATE TABLE IF NOT EXISTS event_outcomes ("
+            "key TEXT PRIMARY KEY, outcome TEXT NOT NULL, expires_at REAL NOT NULL)",
+        )
+
+    async def load(self, key: str) -> EventResponse | None:
+        """Return the unexpired outcome recorded for a key, if any."""
+        row = await self._database.run(_select_outcome, key)
+        if row is None:
+            return None
+        return EventResponse.model_validate_json(row[0])
+
+    async def save(self, key: str, outcome: EventResponse, ttl_seconds: float) -> None:
+        """Record the outcome of a key and prune expired outcomes."""
+        await self._database.run(_upsert_outcome, key, outcome.model_dump_json(), ttl_seconds)
+
+
+class EventOutcomes:
+    """Replay the outcome of event ids that were already processed.
+
+    Final outcomes (OK and Cancel) are recorded for `ttl_seconds` per route path and
+    event id; a redelivery within that window gets the recorded response without
+    building a context or running the handler. Without a store nothing is recorded.
+    """
+
+    def __init__(self, store: EventOutcomeStore | None = None, ttl_seconds: float = 0) -> None:
+        self._store = store if ttl_seconds > 0 else None
+        self._ttl_seconds = ttl_seconds
+
+    async def replay(self, route_path: str, event_id: str) -> EventResponse | None:
+        """Return the outcome recorded for an event delivered to a route, if any."""
+        if self._store is None:
+            return None
+        return await self._store.load(self._build_key(route_path, event_id))
+
+    async def record(self, route_path: str, event_id: str, outcome: EventResponse) -> None:
+        """Record the outcome of an event when it is final."""
+        if self._store is None or outcome.response not in REPLAYABLE_RESPONSES:
+            return
+        await self._store.save(self._build_key(route_path, event_id), outcome, self._ttl_seconds)
+
+    def _build_key(self, route_path: str, event_id: str) -> str:
+        return f"{route_path}#{event_id}"
+
+
+def _select_outcome(connection: sqlite3.Connection, key: str) -> tuple[str] | None:
+    row: tuple[str] | None = connection.execute(
+        "SELECT outcome FROM event_outcomes WHERE key = ? AND expires_at > ?",
+        (key, time.time()),
+    ).fetchone()
+    return row
+
+
+def _upsert_outcome(
+    connection: sqlite3.Connection, key: str, outcome: str, ttl_seconds: float
+) -> None:
+    now = time.time()
+    connection.execute(
+        "INSERT OR REPLACE INTO event_outcomes VALUES (?, ?, ?)", (key, outcome, now + ttl_seconds)
+    )
+    connection.execute("DELETE FROM event_outcomes WHERE expires_at <= ?", (now,))
+
+
+@lru_cache
+def get_event_outcome_store(path: str) -> SQLiteEventOutcomeStore:
+    """Return the process-wide SQLite event outcome store for a path."""
+    return SQLiteEventOutcomeStore(Path(path))
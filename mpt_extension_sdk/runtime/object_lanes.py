@@ -0,0 +1,99 @@
+import asyncio
+from dataclasses import dataclass, field
+from types import TracebackType
+
+
+@dataclass
+class ObjectLane:
+    """Lock and waiting deliveries of one Marketplace object."""
+
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    holders: int = 0
+    latest: dict[str, object] = field(default_factory=dict)
+
+
+class LaneTicket:
+    """Async context manager holding the lane of one object for a delivery.
+
+    Entering it yields True once the delivery may run, or False when a later
+    delivery with the same merge key superseded it while it was waiting.
+    """
+
+    def __init__(
+        self,
+        lanes: dict[str, ObjectLane] | None,
+        object_id: str,
+        merge_key: str | None,
+    ) -> None:
+        self._lanes = lanes
+        self._object_id = object_id
+        self._merge_key = merge_key
+
+    async def __aenter__(self) -> bool:
+        if self._lanes is None:
+            return True
+        lane = self._lanes.setdefault(self._object_id, ObjectLane())
+        lane.holders += 1
+        if self._merge_key is not None:
+            lane.latest[self._merge_key] = self
+        try:
+            await lane.lock.acquire()
+        except asyncio.CancelledError:
+            self._leave(lane)
+            raise
+        if self._merge_key is None:
+            return True
+        return lane.latest.pop(self._merge_key, self) is self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if self._lanes is None:
+            return
+        lane = self._lanes[self._object_id]
+        lane.lock.release()
+        self._leave(lane)
+
+    def _leave(self, lane: ObjectLane) -> None:
+        if self._merge_key is not None and lane.latest.get(self._merge_key) is self:
+            lane.latest.pop(self._merge_key)
+        lane.holders -= 1
+        if not lane.holders and self._lanes is not None:
+            self._lanes.pop(self._object_id, None)
+
+
+class ObjectLanes:
+    """Process-local execution lanes keyed by Marketplace object id.
+
+    Deliveries for the same object run one after another, in arrival order, while
+    deliveries for different objects run concurrently. With `merge_duplicates`,
+    a delivery still waiting in a lane is superseded by a later one with the same
+    merge key: only the latest waiting delivery runs, and the superseded ones are
+    told to skip their work.
+    """
+
+    def __init__(self, *, enabled: bool = True, merge_duplicates: bool = False) -> None:
+        self._lanes: dict[str, ObjectLane] | None = {} if enabled else None
+        self._merge_duplicates = merge_duplicates
+
+    def __len__(self) -> int:
+        return len(self._lanes or {})
+
+    @property
+    def enabled(self) -> bool:
+        """Whether deliveries for the same object run one after another."""
+        return self._lanes is not None
+
+    def acquire(self, object_id: str, merge_key: str | None = None) -> LaneTicket:
+        """Return a ticket that holds the lane of an object while it is entered.
+
+        Args:
+            object_id: Marketplace object id the delivery works on.
+            merge_key: Deliveries that may supersede each other, such as the route
+                path; ignored unless duplicates are merged.
+        """
+        resolved_merge_key = merge_key if self._merge_duplicates else None
+        return LaneTicket(self._lanes, object_id, resolved_merge_key)
@@ -0,0 +1,122 @@
+import asyncio
+import multiprocessing
+import os
+from collections.abc import Callable, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from multiprocessing.util import Finalize
+from typing import Any
+
+from opentelemetry import trace
+from opentelemetry.propagate import extract, inject
+
+from mpt_extension_sdk.observability.bootstrap import ObservabilityBootstrap
+from mpt_extension_sdk.observability.config import ObservabilityConfig
+from mpt_extension_sdk.runtime.sync_executor import get_sync_executor
+from mpt_extension_sdk.settings.runtime import DEFAULT_PROCESS_EXECUTOR_MAX_WORKERS
+
+type TraceCarrier = dict[str, str]
+
+OTEL_ENV_PREFIX = "OTEL_"
+# Runs before the multiprocessing finalizers of lower priority, e.g. queue cleanup.
+TRACING_SHUTDOWN_PRIORITY = 10
+
+
+class ProcessExecutor:
+    """Process pool running CPU-bound extension code outside the worker process.
+
+    The callable and its arguments are pickled to a pool process, so they must be
+    module-level functions, instances of importable classes and plain data. Pool
+    processes are started by a fork server rather than forked from the worker, so
+    they inherit none of its threads, locks or open connections. With an enabled
+    observability config, each pool process sets up its own tracer provider and
+    exporters, and the caller's trace context travels with the call, so spans
+    opened by the callable are exported as children of the caller's span. With
+    `max_workers=0` calls run in the sync executor threads instead.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_PROCESS_EXECUTOR_MAX_WORKERS,
+        observability: ObservabilityConfig | None = None,
+    ) -> None:
+        if max_workers < 0:
+            raise ValueError("max_workers cannot be negative")
+        self._max_workers = max_workers
+        self._observability = observability
+        self._pool: ProcessPoolExecutor | None = None
+
+    def configure(self, max_workers: int, observability: ObservabilityConfig | None = None) -> None:
+        """Resize the pool; calls already submitted finish on the previous one."""
+        if max_workers < 0:
+            raise ValueError("max_workers cannot be negative")
+        self.shutdown()
+        self._max_workers = max_workers
+        self._observability = observability
+
+    def shutdown(self) -> None:
+        """Release the pool processes without waiting for running calls."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    async def run(self, func: Callable[..., Any], /, *args: Any) -> Any:
+        """Run a picklable callable in a pool process and return its result."""
+        if not self._max_workers:
+            return await get_sync_executor().run(func, *args)
+        carrier: TraceCarrier = {}
+        inject(carrier)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_pool(), partial(run_in_trace_context, carrier, func, *args)
+        )
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = self._build_pool()
+        return self._pool
+
+    def _build_pool(self) -> ProcessPoolExecutor:
+        mp_context = multiprocessing.get_context("forkserver")
+        if self._observability is None or not self._observability.enabled:
+            return ProcessPoolExecutor(max_workers=self._max_workers, mp_context=mp_context)
+        return ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            mp_context=mp_context,
+            initializer=init_worker_tracing,
+            initargs=(self._observability, _get_otel_environment()),
+        )
+
+
+@lru_cache
+def get_process_executor() -> ProcessExecutor:
+    """Return the process-wide process executor."""
+    return ProcessExecutor()
+
+
+def run_in_trace_context(carrier: TraceCarrier, func: Callable[..., Any], *args: Any) -> Any:
+    """Call a function with the span propagated in a carrier as the current span."""
+    with trace.use_span(trace.get_current_span(extract(carrier))):
+        return func(*args)
+
+
+def init_worker_tracing(config: ObservabilityConfig, otel_environment: Mapping[str, str]) -> None:
+    """Set up tracing in a pool process and export its pending spans when it exits.
+
+    The fork server may have started before the `OTEL_*` exporter settings were
+    loaded, so the settings seen by the worker process are applied first.
+    """
+    os.environ.update(otel_environment)
+    ObservabilityBootstrap.bootstrap(config)
+    provider = trace.get_tracer_provider()
+    shutdown = getattr(provider, "shutdown", None)
+    if shutdown is not None:
+        Finalize(provider, shutdown, exitpriority=TRACING_SHUTDOWN_PRIORITY)
+
+
+def _get_otel_environment() -> dict[str, str]:
+    return {
+        env_name: env_value
+        for env_name, env_value in os.environ.items()
+        if env_name.startswith(OTEL_ENV_PREFIX)
+    }
@@ -0,0 +1,48 @@
+import asyncio
+import os
+import sqlite3
+from collections.abc import Callable, Iterator
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import Concatenate
+
+SQLITE_TIMEOUT_SECONDS = 5.0
+OWNER_ONLY_FILE_MODE = 0o600
+
+
+class SQLiteFile:
+    """Local SQLite file in WAL mode shared by the workers of a host.
+
+    The file is created readable by its owner only. `run` calls a function with a
+    fresh connection in a worker thread and commits its statements as one
+    transaction, so disk I/O and lock waits never block the event loop.
+    """
+
+    def __init__(self, path: Path, schema: str) -> None:
+        self.path = path
+        os.close(os.open(path, os.O_CREAT | os.O_RDWR, OWNER_ONLY_FILE_MODE))
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(schema)
+
+    async def run[**ParamT, ReturnT](
+        self,
+        operation: Callable[Concatenate[sqlite3.Connection, ParamT], ReturnT],
+        *args: ParamT.args,
+        **kwargs: ParamT.kwargs,
+    ) -> ReturnT:
+        """Run `operation(connection, *args, **kwargs)` in one transaction off the loop."""
+        return await asyncio.to_thread(
+            self._run, lambda connection: operation(connection, *args, **kwargs)
+        )
+
+    def _run[ReturnT](self, operation: Callable[[sqlite3.Connection], ReturnT]) -> ReturnT:
+        with self._connect() as connection:
+            return operation(connection)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection and commit its statements as one transaction."""
+        connection = sqlite3.connect(self.path, timeout=SQLITE_TIMEOUT_SECONDS)
+        with closing(connection), connection:
+            yield connection
@@ -0,0 +1,133 @@
+import asyncio
+import contextvars
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from inspect import isawaitable, iscoroutinefunction
+from typing import Any
+
+from mpt_extension_sdk.settings.runtime import DEFAULT_SYNC_EXECUTOR_MAX_WORKERS
+
+
+@dataclass(frozen=True)
+class SyncExecutorStats:
+    """Snapshot of the saturation counters of the sync executor."""
+
+    max_workers: int
+    running: int = 0
+    queued: int = 0
+    calls: int = 0
+    saturated_calls: int = 0
+    wait_seconds: float = 0
+
+
+class SyncExecutor:  # noqa: WPS214
+    """Bounded thread pool running synchronous extension code off the event loop.
+
+    Calls run with a copy of the caller's context variables, so the correlation id,
+    task id and current OpenTelemetry span stay visible in the worker thread. A call
+    made while every worker is busy waits in the pool queue and is counted as
+    saturated. With `max_workers=0` calls run inline on the event loop.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_SYNC_EXECUTOR_MAX_WORKERS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_workers < 0:
+            raise ValueError("max_workers cannot be negative")
+        self._max_workers = max_workers
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._pool: ThreadPoolExecutor | None = None
+        self._pending = 0
+        self._running = 0
+        self._calls = 0
+        self._saturated_calls = 0
+        self._wait_seconds: float = 0
+
+    @property
+    def stats(self) -> SyncExecutorStats:
+        """Current saturation counters."""
+        with self._lock:
+            return SyncExecutorStats(
+                max_workers=self._max_workers,
+                running=self._running,
+                queued=self._pending - self._running,
+                calls=self._calls,
+                saturated_calls=self._saturated_calls,
+                wait_seconds=self._wait_seconds,
+            )
+
+    def configure(self, max_workers: int) -> None:
+        """Resize the pool; calls already submitted finish on the previous one."""
+        if max_workers < 0:
+            raise ValueError("max_workers cannot be negative")
+        self.shutdown()
+        self._max_workers = max_workers
+
+    def shutdown(self) -> None:
+        """Release the worker threads without waiting for running calls."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+    async def run(self, func: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Any:
+        """Run a synchronous callable in the pool and return its result."""
+        if not self._max_workers:
+            return func(*args, **kwargs)
+        context = contextvars.copy_context()
+        with self._lock:
+            self._calls += 1
+            if self._pending >= self._max_workers:
+                self._saturated_calls += 1
+            self._pending += 1
+        call_future = self._get_pool().submit(
+            self._run_call, partial(context.run, func, *args, **kwargs), self._clock()
+        )
+        call_future.add_done_callback(self._finish_call)
+        return await asyncio.wrap_future(call_future)
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="mpt-sync"
+            )
+        return self._pool
+
+    def _run_call(self, call: Callable[[], Any], submitted_at: float) -> Any:
+        with self._lock:
+            self._running += 1
+            self._wait_seconds += self._clock() - submitted_at
+        return call()
+
+    def _finish_call(self, call_future: Future[Any]) -> None:
+        # Calls cancelled while queued never reached `_run_call`.
+        with self._lock:
+            self._pending -= 1
+            if not call_future.cancelled():
+                self._running -= 1
+
+
+@lru_cache
+def get_sync_executor() -> SyncExecutor:
+    """Return the process-wide sync executor."""
+    return SyncExecutor()
+
+
+async def run_callback(callback: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Any:
+    """Invoke an extension callback without blocking the event loop.
+
+    Coroutine functions are awaited directly; synchronous callables run in the
+    sync executor, and an awaitable they return is awaited afterwards.
+    """
+    if iscoroutinefunction(callback):
+        return await callback(*args, **kwargs)
+    callback_result = await get_sync_executor().run(callback, *args, **kwargs)
+    if isawaitable(callback_result):
+        return await callback_result
+    return callback_result
@@ -0,0 +1,305 @@
+import asyncio
+import logging
+import sqlite3
+import time
+from collections import defaultdict
+from collections.abc import Sequence
+from contextlib import suppress
+from dataclasses import dataclass
+from enum import StrEnum
+from pathlib import Path
+from typing import Self
+
+from mpt_extension_sdk.runtime.sqlite_file import SQLiteFile
+from mpt_extension_sdk.runtime.task_transitions import (
+    TaskTransitionService,
+    is_finalized_rejection,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 20
+DEFAULT_MAX_ATTEMPTS = 20
+DEFAULT_CLAIM_SECONDS = 60
+DEFAULT_POLL_INTERVAL_SECONDS = 1
+MIN_RETRY_DELAY_SECONDS = 1
+MAX_RETRY_DELAY_SECONDS = 300
+
+
+class TaskTransition(StrEnum):
+    """Platform Task lifecycle transition queued in the outbox."""
+
+    COMPLETE = "complete"
+    FAIL = "fail"
+    RESCHEDULE = "reschedule"
+
+
+@dataclass(frozen=True)
+class PendingTransition:
+    """Task transition kept in the outbox until the platform accepts it."""
+
+    entry_id: int
+    task_id: str
+    transition: TaskTransition
+    reason: str | None
+    attempts: int
+
+    @classmethod
+    def from_row(cls, row: tuple[int, str, str, str | None, int]) -> Self:
+        """Build a pending transition from an outbox table row."""
+        return cls(
+            entry_id=row[0],
+            task_id=row[1],
+            transition=TaskTransition(row[2]),
+            reason=row[3],
+            attempts=row[4],
+        )
+
+
+class SQLiteTaskOutboxStore:
+    """Task transitions kept in a local SQLite file shared by the workers of a host.
+
+    Claimed entries stay hidden from other claims for `claim_seconds`, so each one
+    is sent by a single worker, and become due again if that worker dies first.
+    """
+
+    def __init__(self, path: Path, claim_seconds: float = DEFAULT_CLAIM_SECONDS) -> None:
+        self._database = SQLiteFile(
+            path,
+            "CREATE TABLE IF NOT EXISTS task_outbox ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, task_id TEXT NOT NULL, "
+            "transition TEXT NOT NULL, reason TEXT, attempts INTEGER NOT NULL, "
+            "due_at REAL NOT NULL)",
+        )
+        self._claim_seconds = claim_seconds
+
+    async def count(self) -> int:
+        """Return the number of transitions in the outbox, due or not."""
+        return await self._database.run(_count)
+
+    async def add(
+        self, task_id: str, transition: TaskTransition, reason: str | None = None
+    ) -> None:
+        """Queue a transition, due at once."""
+        await self._database.run(_insert, task_id, transition, reason)
+
+    async def claim(self, limit: int) -> list[PendingTransition]:
+        """Return up to `limit` due transitions, oldest first, and hide them from other claims.
+
+        A transition is not returned while an earlier one of its task is pending.
+        """
+        rows = await self._database.run(_claim, limit, self._claim_seconds)
+        return [PendingTransition.from_row(row) for row in rows]
+
+    async def remove(self, entry_ids: Sequence[int]) -> None:
+        """Drop transitions that left the outbox."""
+        await self._database.run(_delete, entry_ids)
+
+    async def retry(self, entry_id: int, delay_seconds: float) -> None:
+        """Count a failed attempt and make the transition due again after a delay."""
+        await self._database.run(_postpone, entry_id, delay_seconds)
+
+
+class TaskOutbox:  # noqa: WPS214
+    """Durable queue of platform Task transitions sent in the background.
+
+    `complete`, `fail` and `reschedule` record the transition and return at once.
+    Once started, a background worker sends due transitions in batches, retries
+    failures with exponential backoff, and drops a transition when the platform
+    reports the task final (404/409) or after `max_attempts`. Transitions left in the
+    store by a previous process are sent when the outbox starts again.
+    """
+
+    def __init__(
+        self,
+        store: SQLiteTaskOutboxStore,
+        task_service: TaskTransitionService,
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        poll_interval_seconds: float = DEFAULT_POLL_INTERVAL_SECONDS,
+    ) -> None:
+        if batch_size < 1 or max_attempts < 1:
+            raise ValueError("batch_size and max_attempts must be greater than 0")
+        self._store = store
+        self._task_service = task_service
+        self._batch_size = batch_size
+        self._max_attempts = max_attempts
+        self._poll_interval_seconds = poll_interval_seconds
+        self._wakeup = asyncio.Event()
+        self._worker: asyncio.Task[None] | None = None
+
+    async def complete(self, task_id: str) -> None:
+        """Queue the completion of a task."""
+        await self._add(task_id, TaskTransition.COMPLETE)
+
+    async def fail(self, task_id: str, reason: str | None = None) -> None:
+        """Queue the failure of a task."""
+        await self._add(task_id, TaskTransition.FAIL, reason)
+
+    async def reschedule(self, task_id: str) -> None:
+        """Queue the rescheduling of a task."""
+        await self._add(task_id, TaskTransition.RESCHEDULE)
+
+    def start(self) -> None:
+        """Start the background worker on the running event loop."""
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._run(), name="mpt-task-outbox")
+
+    async def stop(self) -> None:
+        """Stop the background worker, then make a last attempt at the due transitions."""
+        if self._worker is not None:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+        await self.flush()
+
+    async def flush(self) -> int:
+        """Send one batch of due transitions.
+
+        Returns:
+            The number of transitions claimed from the store.
+        """
+        batch = await self._store.claim(self._batch_size)
+        by_task: dict[str, list[PendingTransition]] = defaultdict(list)
+        for entry in batch:
+            by_task[entry.task_id].append(entry)
+        sends = (self._send_in_order(entries) for entries in by_task.values())
+        sent = await asyncio.gather(*sends)
+        await self._store.remove([entry_id for entry_ids in sent for entry_id in entry_ids])
+        return len(batch)
+
+    async def _add(
+        self, task_id: str, transition: TaskTransition, reason: str | None = None
+    ) -> None:
+        await self._store.add(task_id, transition, reason)
+        self._wakeup.set()
+
+    async def _run(self) -> None:
+        """Flush batches back to back while they are full, otherwise wait for new work."""
+        while True:
+            try:
+                claimed = await self.flush()
+            except Exception:
+                logger.exception("Task outbox flush failed")
+                claimed = 0
+            if claimed < self._batch_size:
+                await self._wait_for_work()
+
+    async def _wait_for_work(self) -> None:
+        with suppress(TimeoutError):
+            await asyncio.wait_for(self._wakeup.wait(), timeout=self._poll_interval_seconds)
+        self._wakeup.clear()
+
+    async def _send_in_order(self, entries: Sequence[PendingTransition]) -> list[int]:
+        """Send the transitions of one task oldest first, returning those that left.
+
+        Sending stops at the first transition kept for a retry, so a later transition
+        of the task never reaches the platform before it.
+        """
+        sent: list[int] = []
+        for entry in entries:
+            if not await self._send(entry):  # noqa: WPS476
+                break
+            sent.append(entry.entry_id)
+        return sent
+
+    async def _send(self, entry: PendingTransition) -> bool:
+        """Send a transition and return whether it can leave the outbox."""
+        try:
+            await self._call(entry)
+        except Exception as error:
+            if is_finalized_rejection(error):
+                logger.warning(
+                    "Lifecycle transition for task %s was rejected because the task is final",
+                    entry.task_id,
+                )
+                return True
+            return await self._schedule_retry(entry, error)
+        return True
+
+    async def _call(self, entry: PendingTransition) -> None:
+        match entry.transition:
+            case TaskTransition.COMPLETE:
+                await self._task_service.complete(entry.task_id)
+            case TaskTransition.FAIL:
+                await self._task_service.fail(entry.task_id, reason=entry.reason)
+            case TaskTransition.RESCHEDULE:
+                await self._task_service.reschedule(entry.task_id)
+
+    async def _schedule_retry(self, entry: PendingTransition, error: Exception) -> bool:
+        """Back off a failed transition; return True when it is given up instead."""
+        attempts = entry.attempts + 1
+        if attempts >= self._max_attempts:
+            logger.error(
+                "Giving up %s of task %s after %s attempts",
+                entry.transition,
+                entry.task_id,
+                attempts,
+                exc_info=error,
+            )
+            return True
+        delay = min(MIN_RETRY_DELAY_SECONDS * 2**entry.attempts, MAX_RETRY_DELAY_SECONDS)
+        logger.warning(
+            "Retrying %s of task %s in %s seconds: %s",
+            entry.transition,
+            entry.task_id,
+            delay,
+            error,
+        )
+        await self._store.retry(entry.entry_id, delay)
+        return False
+
+
+def _count(connection: sqlite3.Connection) -> int:
+    return int(connection.execute("SELECT COUNT(*) FROM task_outbox").fetchone()[0])
+
+
+def _insert(
+    connection: sqlite3.Connection,
+    task_id: str,
+    transition: TaskTransition,
+    reason: str | None,
+) -> None:
+    connection.execute(
+        "INSERT INTO task_outbox (task_id, transition, reason, attempts, due_at) "
+        "VALUES (?, ?, ?, 0, ?)",
+        (task_id, transition, reason, time.time()),
+    )
+
+
+def _claim(
+    connection: sqlite3.Connection, limit: int, claim_seconds: float
+) -> list[tuple[int, str, str, str | None, int]]:
+    """Select due rows and push their due time back, holding the write lock throughout.
+
+    A row is skipped while an earlier row of its task is claimed or waiting for a
+    retry, so the transitions of a task are sent in the order they were queued.
+    """
+    now = time.time()
+    connection.execute("BEGIN IMMEDIATE")
+    rows = connection.execute(
+        "SELECT id, task_id, transition, reason, attempts FROM task_outbox AS entry "
+        "WHERE due_at <= ? AND NOT EXISTS (SELECT 1 FROM task_outbox AS earlier "
+        "WHERE earlier.task_id = entry.task_id AND earlier.id < entry.id "
+        "AND earlier.due_at > ?) ORDER BY id LIMIT ?",
+        (now, now, limit),
+    ).fetchall()
+    connection.executemany(
+        "UPDATE task_outbox SET due_at = ? WHERE id = ?",
+        [(now + claim_seconds, row[0]) for row in rows],
+    )
+    return rows
+
+
+def _delete(connection: sqlite3.Connection, entry_ids: Sequence[int]) -> None:
+    connection.executemany(
+        "DELETE FROM task_outbox WHERE id = ?", [(entry_id,) for entry_id in entry_ids]
+    )
+
+
+def _postpone(connection: sqlite3.Connection, entry_id: int, delay_seconds: float) -> None:
+    connection.execute(
+        "UPDATE task_outbox SET attempts = attempts + 1, due_at = ? WHERE id = ?",
+        (time.time() + delay_seconds, entry_id),
+    )
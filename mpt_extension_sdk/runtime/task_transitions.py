@@ -1,14 +1,35 @@
 import logging
+from typing import Protocol
 
 from mpt_api_client.exceptions import MPTAPIError, MPTHttpError
 
 from mpt_extension_sdk.errors.mapping import map_exception_to_event_response
 from mpt_extension_sdk.errors.pipeline import DeferError
-from mpt_extension_sdk.services.mpt_api_service.task import TaskService
 
 FINALIZED_TASK_STATUS_CODES = frozenset((404, 409))
 
 
+class TaskTransitionService(Protocol):
+    """Target of platform Task lifecycle transitions, such as `TaskService`."""
+
+    async def complete(self, task_id: str) -> None:
+        """Complete a task."""
+
+    async def fail(self, task_id: str, reason: str | None = None) -> None:
+        """Fail a task with an optional reason."""
+
+    async def reschedule(self, task_id: str) -> None:
+        """Move a task back to a retryable status."""
+
+
+def is_finalized_rejection(error: Exception) -> bool:
+    """Return whether the platform rejected a transition because the task is final."""
+    return (
+        isinstance(error, (MPTHttpError, MPTAPIError))
+        and getattr(error, "status_code", None) in FINALIZED_TASK_STATUS_CODES
+    )
+
+
 class SafeTaskTransitions:
     """Platform Task lifecycle transitions tolerant of finalized-task rejections.
 
@@ -17,7 +38,7 @@ class SafeTaskTransitions:
     into an error.
     """
 
-    def __init__(self, task_service: TaskService, handler_logger: logging.Logger) -> None:
+    def __init__(self, task_service: TaskTransitionService, handler_logger: logging.Logger) -> None:
         """Initialize the transitions with their collaborators."""
         self.task_service = task_service
         self.handler_logger = handler_logger
@@ -58,8 +79,7 @@ class SafeTaskTransitions:
 
     def _log_finalized_rejection(self, task_id: str, error: MPTHttpError | MPTAPIError) -> None:
         """Log lifecycle rejections caused by already-finalized platform tasks."""
-        status_code = getattr(error, "status_code", None)
-        if status_code in FINALIZED_TASK_STATUS_CODES:
+        if is_finalized_rejection(error):
             self.handler_logger.warning(
                 "Lifecycle transition for task %s was rejected because the task is final",
                 task_id,
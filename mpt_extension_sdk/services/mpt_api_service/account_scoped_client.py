@@ -1,110 +1,29 @@
-import asyncio
-import datetime as dt
 from collections.abc import AsyncGenerator
-from typing import TYPE_CHECKING, ClassVar, override
+from typing import TYPE_CHECKING, override
 
-from httpx import Request, Response, codes
+from httpx import AsyncBaseTransport, Request, Response, codes
 from mpt_api_client.auth import Authentication
 from mpt_api_client.http import TransportSettings
-from mpt_api_client.http.async_client import AsyncHTTPClient
 
 from mpt_extension_sdk.api.auth import AuthContext
-from mpt_extension_sdk.models.account import AccountToken
 from mpt_extension_sdk.services.api_client_v2.mpt_api_client import AsyncMPTClient
+from mpt_extension_sdk.services.mpt_api_service.account_token_provider import AccountTokenProvider
+from mpt_extension_sdk.services.mpt_api_service.account_token_store import (
+    AccountTokenStore,
+    get_account_token_store,
+)
+from mpt_extension_sdk.services.mpt_api_service.client_factory import build_http_client
+from mpt_extension_sdk.services.mpt_api_service.client_registry import (
+    get_account_client_registry,
+)
+from mpt_extension_sdk.services.mpt_api_service.http_settings import HTTPClientSettings
+from mpt_extension_sdk.services.mpt_api_service.rate_limit import RateLimiter
+from mpt_extension_sdk.services.mpt_api_service.retry_policy import RetryPolicy
 from mpt_extension_sdk.settings.runtime import RuntimeSettings
 
 if TYPE_CHECKING:
     from mpt_extension_sdk.services.mpt_api_service.api_service import MPTAPIService
 
-AccountCacheKey = tuple[str, str]
-AccountTokenCache = dict[AccountCacheKey, AccountToken]
-AccountLockCache = dict[AccountCacheKey, asyncio.Lock]
-
-TOKEN_EXPIRY_LEEWAY_SECONDS = 60
-
-
-class AccountTokenProvider:  # noqa: WPS214
-    """Account-scoped token cache with serialized refreshes per account."""
-
-    _account_token_cache: ClassVar[AccountTokenCache] = {}
-    _account_token_locks: ClassVar[AccountLockCache] = {}
-
-    def __init__(
-        self,
-        *,
-        runtime_settings: RuntimeSettings,
-        auth: AuthContext,
-        service_type: type["MPTAPIService"],
-        min_remaining_validity_seconds: int = TOKEN_EXPIRY_LEEWAY_SECONDS,
-    ) -> None:
-        self._runtime_settings = runtime_settings
-        self._auth = auth
-        self._service_type = service_type
-        self._min_remaining_validity_seconds = min_remaining_validity_seconds
-
-    @property
-    def cache_key(self) -> AccountCacheKey:
-        """The cache key for the current account."""
-        return self._auth.extension_id, self._auth.account.id
-
-    @classmethod
-    def clear_cache(cls) -> None:
-        """Clear all cached account tokens and refresh locks."""
-        cls._account_token_cache.clear()
-        cls._account_token_locks.clear()
-
-    async def get_token(self) -> str:
-        """Return a valid account token, refreshing it when needed."""
-        cache_key = self.cache_key
-        cached_token = self._account_token_cache.get(cache_key)
-        if cached_token is not None and self._is_token_valid(cached_token.expires_at):
-            return cached_token.token
-
-        lock = self._account_token_locks.setdefault(cache_key, asyncio.Lock())
-        async with lock:
-            cached_token = self._account_token_cache.get(cache_key)
-            if cached_token is not None and self._is_token_valid(cached_token.expires_at):
-                return cached_token.token
-
-            account_token = await self._fetch_account_token()
-            self._store_token(cache_key, account_token)
-            return account_token.token
-
-    def invalidate(self, token: str) -> None:
-        """Drop the cached account token when it matches a rejected one.
-
-        Only evicts the cache entry if it still holds the rejected token, so a fresh
-        token stored by a concurrent refresh is never discarded.
-
-        Args:
-            token: The bearer token rejected by the platform.
-        """
-        cache_key = self.cache_key
-        cached_token = self._account_token_cache.get(cache_key)
-        if cached_token is not None and cached_token.token == token:
-            self._account_token_cache.pop(cache_key, None)
-
-    async def _fetch_account_token(self) -> AccountToken:
-        mpt_api_service = self._service_type.from_config(
-            base_url=self._runtime_settings.mpt_api_base_url,
-            api_token=self._runtime_settings.ext_api_key,
-        )
-        return await mpt_api_service.account_token.create_token(self._auth.account.id)
-
-    def _is_token_valid(self, expires_at: dt.datetime) -> bool:
-        expected_time = dt.datetime.now(dt.UTC).timestamp() + self._min_remaining_validity_seconds
-        return expires_at.timestamp() > expected_time
-
-    def _store_token(self, cache_key: AccountCacheKey, cached: AccountToken) -> None:
-        self._account_token_cache[cache_key] = cached
-        now = dt.datetime.now(dt.UTC)
-        expired_keys = [
-            key for key, entry in self._account_token_cache.items() if entry.expires_at <= now
-        ]
-        for key in expired_keys:
-            self._account_token_cache.pop(key, None)
-            self._account_token_locks.pop(key, None)
-
 
 class AccountScopedAuthentication(Authentication):
     """Authentication provider that signs requests with an account-scoped token."""
@@ -127,22 +46,87 @@ class AccountScopedAuthentication(Authentication):
         request.headers["Authorization"] = f"Bearer {token}"
         response = yield request
         if response.status_code == codes.UNAUTHORIZED:
-            self._token_provider.invalidate(token)
+            await self._token_provider.invalidate(token)
             token = await self._token_provider.get_token()
             request.headers["Authorization"] = f"Bearer {token}"
             yield request
 
 
-def build_account_scoped_mpt_client(
+def build_account_scoped_mpt_client(  # noqa: WPS211
     *,
     base_url: str,
     token_provider: AccountTokenProvider,
-    timeout: float = 60.0,
+    http_settings: HTTPClientSettings | None = None,
+    transport: AsyncBaseTransport | None = None,
+    rate_limiter: RateLimiter | None = None,
+    retry_policy: RetryPolicy | None = None,
 ) -> AsyncMPTClient:
-    """Build an MPT client that authenticates requests with account-scoped tokens."""
+    """Build an MPT client that authenticates requests with account-scoped tokens.
+
+    Args:
+        base_url: MPT API base URL.
+        token_provider: Provider of the account-scoped bearer tokens.
+        http_settings: Optional pool limits and timeouts of the client.
+        transport: Optional shared transport; the client owns its own pool otherwise.
+        rate_limiter: Optional limiter shared by every request of the account.
+        retry_policy: Optional backoff policy used instead of the upstream retries.
+    """
     return AsyncMPTClient(
-        AsyncHTTPClient(
-            TransportSettings(base_url=base_url, timeout=timeout),
+        build_http_client(
+            TransportSettings(base_url=base_url),
             authentication=AccountScopedAuthentication(token_provider),
+            transport=transport,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            http_settings=http_settings,
         )
     )
+
+
+def get_account_scoped_client(
+    base_url: str,
+    auth: AuthContext,
+    runtime_settings: RuntimeSettings,
+    service_type: type["MPTAPIService"],
+) -> AsyncMPTClient:
+    """Return the pooled account-scoped client of the request account.
+
+    The client is built on the first request of the account and reused afterwards
+    through the process-wide client registry.
+    """
+    return get_account_client_registry().get_client(
+        (base_url, auth.extension_id, auth.account.id),
+        lambda transport: build_account_scoped_mpt_client(
+            base_url=base_url,
+            token_provider=AccountTokenProvider(
+                runtime_settings=runtime_settings,
+                auth=auth,
+                service_type=service_type,
+                refresh_ahead_seconds=runtime_settings.token_refresh_ahead_seconds,
+                token_store=_get_token_store(runtime_settings),
+            ),
+            transport=transport,
+            rate_limiter=_build_rate_limiter(runtime_settings),
+            retry_policy=RetryPolicy.from_runtime_settings(runtime_settings),
+            http_settings=HTTPClientSettings.from_runtime_settings(runtime_settings),
+        ),
+    )
+
+
+async def close_account_scoped_clients() -> None:
+    """Cancel the background token refreshes and close the pooled account clients."""
+    await AccountTokenProvider.cancel_background_refreshes()
+    await get_account_client_registry().aclose()
+
+
+def _get_token_store(runtime_settings: RuntimeSettings) -> AccountTokenStore | None:
+    if not runtime_settings.account_token_store_path:
+        return None
+    return get_account_token_store(runtime_settings.account_token_store_path)
+
+
+def _build_rate_limiter(runtime_settings: RuntimeSettings) -> RateLimiter:
+    return RateLimiter(
+        requests_per_second=runtime_settings.rate_limit_requests_per_second or None,
+        burst=runtime_settings.rate_limit_burst or None,
+    )
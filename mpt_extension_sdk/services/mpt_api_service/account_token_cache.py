@@ -0,0 +1,127 @@
+import asyncio
+import datetime as dt
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+from mpt_extension_sdk.models.account import AccountToken
+
+AccountCacheKey = tuple[str, str]
+
+DEFAULT_MAX_ACCOUNT_TOKENS = 512
+
+
+@dataclass(frozen=True)
+class AccountTokenCacheStats:
+    """Point-in-time statistics of an account token cache."""
+
+    size: int
+    max_entries: int
+    hits: int
+    misses: int
+    evictions: int
+    locks: int
+
+
+@dataclass
+class AccountLock:
+    """Refresh lock of one account with the number of tasks using it."""
+
+    lock: asyncio.Lock
+    users: int = 0
+
+
+class AccountTokenCache:  # noqa: WPS214
+    """Bounded LRU cache of account tokens with per-account refresh locks.
+
+    Tokens are evicted least recently used first beyond `max_entries`, and expired
+    tokens are dropped when looked up. A refresh lock only exists while a task holds
+    or waits for it, so neither structure grows with the number of accounts served.
+    """
+
+    def __init__(self, *, max_entries: int = DEFAULT_MAX_ACCOUNT_TOKENS) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be greater than 0")
+        self._max_entries = max_entries
+        self._tokens: OrderedDict[AccountCacheKey, AccountToken] = OrderedDict()
+        self._locks: dict[AccountCacheKey, AccountLock] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    @property
+    def stats(self) -> AccountTokenCacheStats:
+        """Current size, hit, miss, eviction and lock counts."""
+        return AccountTokenCacheStats(
+            size=len(self._tokens),
+            max_entries=self._max_entries,
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            locks=len(self._locks),
+        )
+
+    def get(self, key: AccountCacheKey) -> AccountToken | None:
+        """Return the cached token, or None when it is missing or expired."""
+        account_token = self.peek(key)
+        if account_token is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._tokens.move_to_end(key)
+        return account_token
+
+    def peek(self, key: AccountCacheKey) -> AccountToken | None:
+        """Return the cached token like `get`, without counting a hit or a miss.
+
+        Used to re-check the cache under the refresh lock after a counted miss.
+        """
+        account_token = self._tokens.get(key)
+        if account_token is not None and account_token.expires_at <= dt.datetime.now(dt.UTC):
+            self._tokens.pop(key)
+            return None
+        return account_token
+
+    def put(self, key: AccountCacheKey, account_token: AccountToken) -> None:
+        """Cache a token, evicting the least recently used ones beyond the bound."""
+        self._tokens[key] = account_token
+        self._tokens.move_to_end(key)
+        while len(self._tokens) > self._max_entries:
+            self._tokens.popitem(last=False)
+            self._evictions += 1
+
+    def discard(self, key: AccountCacheKey, token: str) -> None:
+        """Drop the cached token of an account when it still matches `token`."""
+        account_token = self._tokens.get(key)
+        if account_token is not None and account_token.token == token:
+            self._tokens.pop(key)
+
+    def is_locked(self, key: AccountCacheKey) -> bool:
+        """Whether a task currently holds the refresh lock of an account."""
+        account_lock = self._locks.get(key)
+        return account_lock is not None and account_lock.lock.locked()
+
+    @asynccontextmanager
+    async def locked(self, key: AccountCacheKey) -> AsyncIterator[None]:
+        """Hold the refresh lock of an account, dropping it once no task uses it."""
+        account_lock = self._locks.setdefault(key, AccountLock(lock=asyncio.Lock()))
+        account_lock.users += 1
+        try:
+            async with account_lock.lock:
+                yield
+        finally:
+            account_lock.users -= 1
+            if not account_lock.users:
+                self._locks.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every cached token and reset the statistics."""
+        self._tokens.clear()
+        self._locks.clear()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
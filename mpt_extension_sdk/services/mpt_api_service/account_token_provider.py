@@ -0,0 +1,188 @@
+import asyncio
+import datetime as dt
+import logging
+from typing import TYPE_CHECKING, ClassVar
+
+from mpt_extension_sdk.api.auth import AuthContext
+from mpt_extension_sdk.models.account import AccountToken
+from mpt_extension_sdk.services.mpt_api_service.account_token_cache import (
+    AccountCacheKey,
+    AccountTokenCache,
+    AccountTokenCacheStats,
+)
+from mpt_extension_sdk.services.mpt_api_service.account_token_store import AccountTokenStore
+from mpt_extension_sdk.services.mpt_api_service.http_settings import HTTPClientSettings
+from mpt_extension_sdk.services.mpt_api_service.rate_limit import get_extension_rate_limiter
+from mpt_extension_sdk.services.mpt_api_service.retry_policy import RetryPolicy
+from mpt_extension_sdk.settings.runtime import ACCOUNT_TOKEN_EXPIRY_LEEWAY_SECONDS, RuntimeSettings
+
+if TYPE_CHECKING:
+    from mpt_extension_sdk.services.mpt_api_service.api_service import MPTAPIService
+
+AccountRefreshTasks = dict[AccountCacheKey, asyncio.Task[None]]
+
+logger = logging.getLogger(__name__)
+
+
+class AccountTokenProvider:  # noqa: WPS214
+    """Account-scoped token cache with serialized refreshes per account.
+
+    With `refresh_ahead_seconds` set, a request that finds its cached token within
+    that window of expiry still gets the cached token, and a background task renews
+    it. Accounts active within the window are therefore refreshed off the request
+    path; idle accounts refresh on their next request as before.
+
+    With a `token_store` shared by the workers of a host, a token missing from the
+    process cache is first read from the store, and only minted, under the store's
+    cross-process lock, when no worker stored a usable one.
+    """
+
+    _account_token_cache: ClassVar[AccountTokenCache] = AccountTokenCache()
+    _account_refresh_tasks: ClassVar[AccountRefreshTasks] = {}
+
+    def __init__(  # noqa: WPS211
+        self,
+        *,
+        runtime_settings: RuntimeSettings,
+        auth: AuthContext,
+        service_type: type["MPTAPIService"],
+        min_remaining_validity_seconds: int = ACCOUNT_TOKEN_EXPIRY_LEEWAY_SECONDS,
+        refresh_ahead_seconds: int = 0,
+        token_store: AccountTokenStore | None = None,
+    ) -> None:
+        self._runtime_settings = runtime_settings
+        self._auth = auth
+        self._service_type = service_type
+        self._min_remaining_validity_seconds = min_remaining_validity_seconds
+        self._refresh_ahead_seconds = refresh_ahead_seconds
+        self._token_store = token_store
+
+    @property
+    def cache_key(self) -> AccountCacheKey:
+        """The cache key for the current account."""
+        return self._auth.extension_id, self._auth.account.id
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Clear all cached account tokens and refresh locks."""
+        cls._account_token_cache.clear()
+
+    @classmethod
+    def cache_stats(cls) -> AccountTokenCacheStats:
+        """Return the statistics of the process-wide account token cache."""
+        return cls._account_token_cache.stats
+
+    @classmethod
+    async def cancel_background_refreshes(cls) -> None:
+        """Cancel the refresh-ahead tasks still running and wait for them to stop."""
+        refresh_tasks = list(cls._account_refresh_tasks.values())
+        cls._account_refresh_tasks.clear()
+        for refresh_task in refresh_tasks:
+            refresh_task.cancel()
+        await asyncio.gather(*refresh_tasks, return_exceptions=True)
+
+    async def get_token(self) -> str:
+        """Return a valid account token, refreshing it when needed."""
+        cache_key = self.cache_key
+        cached_token = self._account_token_cache.get(cache_key)
+        if cached_token is not None and self._is_token_valid(cached_token.expires_at):
+            if self._is_refresh_due(cached_token.expires_at):
+                self._schedule_refresh(cache_key, cached_token.token)
+            return cached_token.token
+
+        async with self._account_token_cache.locked(cache_key):
+            cached_token = self._account_token_cache.peek(cache_key)
+            if cached_token is not None and self._is_token_valid(cached_token.expires_at):
+                return cached_token.token
+
+            account_token = await self._obtain_token(cache_key)
+            self._account_token_cache.put(cache_key, account_token)
+            return account_token.token
+
+    async def invalidate(self, token: str) -> None:
+        """Drop the cached account token when it matches a rejected one.
+
+        Only evicts the cache entry if it still holds the rejected token, so a fresh
+        token stored by a concurrent refresh is never discarded.
+
+        Args:
+            token: The bearer token rejected by the platform.
+        """
+        self._account_token_cache.discard(self.cache_key, token)
+        if self._token_store is not None:
+            await self._token_store.discard(self.cache_key, token)
+
+    async def _obtain_token(
+        self, cache_key: AccountCacheKey, *, refresh_ahead: bool = False
+    ) -> AccountToken:
+        """Reuse a token stored by another worker, minting one only when none is usable."""
+        token_store = self._token_store
+        if token_store is None:
+            return await self._fetch_account_token()
+        stored_token = await self._load_usable_token(
+            token_store, cache_key, refresh_ahead=refresh_ahead
+        )
+        if stored_token is not None:
+            return stored_token
+
+        async with token_store.mint_lock(cache_key):
+            stored_token = await self._load_usable_token(
+                token_store, cache_key, refresh_ahead=refresh_ahead
+            )
+            if stored_token is not None:
+                return stored_token
+            account_token = await self._fetch_account_token()
+            await token_store.save(cache_key, account_token)
+            return account_token
+
+    async def _load_usable_token(
+        self, token_store: AccountTokenStore, cache_key: AccountCacheKey, *, refresh_ahead: bool
+    ) -> AccountToken | None:
+        stored_token = await token_store.load(cache_key)
+        if stored_token is None or not self._is_token_valid(stored_token.expires_at):
+            return None
+        if refresh_ahead and self._is_refresh_due(stored_token.expires_at):
+            return None
+        return stored_token
+
+    async def _fetch_account_token(self) -> AccountToken:
+        mpt_api_service = self._service_type.from_config(
+            base_url=self._runtime_settings.mpt_api_base_url,
+            api_token=self._runtime_settings.ext_api_key,
+            retry_policy=RetryPolicy.from_runtime_settings(self._runtime_settings),
+            http_settings=HTTPClientSettings.from_runtime_settings(self._runtime_settings),
+            rate_limiter=get_extension_rate_limiter(self._runtime_settings),
+        )
+        return await mpt_api_service.account_token.create_token(self._auth.account.id)
+
+    def _is_token_valid(self, expires_at: dt.datetime) -> bool:
+        expected_time = dt.datetime.now(dt.UTC).timestamp() + self._min_remaining_validity_seconds
+        return expires_at.timestamp() > expected_time
+
+    def _is_refresh_due(self, expires_at: dt.datetime) -> bool:
+        refresh_time = dt.datetime.now(dt.UTC).timestamp() + self._refresh_ahead_seconds
+        return expires_at.timestamp() <= refresh_time
+
+    def _schedule_refresh(self, cache_key: AccountCacheKey, token: str) -> None:
+        """Start one background refresh per account unless a refresh is running."""
+        if (
+            self._account_token_cache.is_locked(cache_key)
+            or cache_key in self._account_refresh_tasks
+        ):
+            return
+        refresh_task = asyncio.create_task(self._refresh_ahead(cache_key, token))
+        self._account_refresh_tasks[cache_key] = refresh_task
+        refresh_task.add_done_callback(lambda _: self._account_refresh_tasks.pop(cache_key, None))
+
+    async def _refresh_ahead(self, cache_key: AccountCacheKey, token: str) -> None:
+        """Replace a token close to expiry; a failure leaves it to the request path."""
+        async with self._account_token_cache.locked(cache_key):
+            cached_token = self._account_token_cache.peek(cache_key)
+            if cached_token is None or cached_token.token != token:
+                return
+            try:
+                account_token = await self._obtain_token(cache_key, refresh_ahead=True)
+            except Exception:
+                logger.exception("Failed to refresh token ahead for account %s", cache_key[1])
+                return
+            self._account_token_cache.put(cache_key, account_token)
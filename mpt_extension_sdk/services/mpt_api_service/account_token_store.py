@@ -0,0 +1,125 @@
+import asyncio
+import fcntl
+import sqlite3
+import time
+import zlib
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import IO, Protocol
+
+from mpt_extension_sdk.models.account import AccountToken
+from mpt_extension_sdk.runtime.sqlite_file import SQLiteFile
+from mpt_extension_sdk.services.mpt_api_service.account_token_cache import AccountCacheKey
+
+LOCK_SLOTS = 256
+LOCK_POLL_SECONDS = 0.02
+OWNER_ONLY_DIR_MODE = 0o700
+
+
+class AccountTokenStore(Protocol):
+    """Token store shared by the workers of a host.
+
+    `load`, `save` and `discard` must not block the event loop; `mint_lock`
+    serializes token minting for an account across every process using the store.
+    """
+
+    async def load(self, key: AccountCacheKey) -> AccountToken | None:
+        """Return the stored token of an account, if any."""
+
+    async def save(self, key: AccountCacheKey, account_token: AccountToken) -> None:
+        """Store the token of an account."""
+
+    async def discard(self, key: AccountCacheKey, token: str) -> None:
+        """Drop the stored token of an account when it still matches `token`."""
+
+    def mint_lock(self, key: AccountCacheKey) -> AbstractAsyncContextManager[None]:
+        """Hold the cross-process lock used while minting a token for an account."""
+
+
+class SQLiteAccountTokenStore:
+    """Account token store kept in a local SQLite file.
+
+    Workers started by Ziticorn on one host share the file, so a token minted by
+    one worker is reused by the others. Minting is serialized with `flock` on one of
+    `LOCK_SLOTS` lock files next to the database, picked by hashing the account key.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._lock_dir = path.with_name(f"{path.name}.locks")
+        self._lock_dir.mkdir(mode=OWNER_ONLY_DIR_MODE, parents=True, exist_ok=True)
+        self._database = SQLiteFile(
+            path,
+            "CREATE TABLE IF NOT EXISTS account_tokens ("
+            "extension_id TEXT NOT NULL, account_id TEXT NOT NULL, "
+            "token TEXT NOT NULL, exp INTEGER NOT NULL, "
+            "PRIMARY KEY (extension_id, account_id))",
+        )
+
+    async def load(self, key: AccountCacheKey) -> AccountToken | None:
+        """Return the stored token of an account, if any."""
+        row = await self._database.run(_select_token, key)
+        if row is None:
+            return None
+        return AccountToken.from_payload({"token": row[0], "exp": row[1]})
+
+    async def save(self, key: AccountCacheKey, account_token: AccountToken) -> None:
+        """Store the token of an account and prune expired tokens."""
+        await self._database.run(_upsert_token, key, account_token)
+
+    async def discard(self, key: AccountCacheKey, token: str) -> None:
+        """Drop the stored token of an account when it still matches `token`."""
+        await self._database.run(_delete_token, key, token)
+
+    @asynccontextmanager
+    async def mint_lock(self, key: AccountCacheKey) -> AsyncIterator[None]:
+        """Hold the lock slot of an account across processes.
+
+        The lock is polled without blocking, so a cancelled wait leaves no thread
+        blocked on the lock file; closing the file releases the lock.
+        """
+        slot = zlib.crc32("/".join(key).encode()) % LOCK_SLOTS
+        with (self._lock_dir / f"{slot}.lock").open("a") as lock_file:
+            while not _try_lock(lock_file):
+                await asyncio.sleep(LOCK_POLL_SECONDS)
+            yield
+
+
+def _try_lock(lock_file: IO[str]) -> bool:
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        return False
+    return True
+
+
+def _select_token(connection: sqlite3.Connection, key: AccountCacheKey) -> tuple[str, int] | None:
+    row: tuple[str, int] | None = connection.execute(
+        "SELECT token, exp FROM account_tokens WHERE extension_id = ? AND account_id = ?",
+        key,
+    ).fetchone()
+    return row
+
+
+def _upsert_token(
+    connection: sqlite3.Connection, key: AccountCacheKey, account_token: AccountToken
+) -> None:
+    connection.execute(
+        "INSERT OR REPLACE INTO account_tokens VALUES (?, ?, ?, ?)",
+        (*key, account_token.token, account_token.exp),
+    )
+    connection.execute("DELETE FROM account_tokens WHERE exp <= ?", (int(time.time()),))
+
+
+def _delete_token(connection: sqlite3.Connection, key: AccountCacheKey, token: str) -> None:
+    connection.execute(
+        "DELETE FROM account_tokens WHERE extension_id = ? AND account_id = ? AND token = ?",
+        (*key, token),
+    )
+
+
+@lru_cache
+def get_account_token_store(path: str) -> SQLiteAccountTokenStore:
+    """Return the process-wide SQLite account token store for a path."""
+    return SQLiteAccountTokenStore(Path(path))
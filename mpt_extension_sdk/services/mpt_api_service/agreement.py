@@ -1,48 +1,119 @@
 import logging
-from collections.abc import Mapping
-from typing import Any
+from collections.abc import AsyncIterator, Mapping
+from functools import partial
+from types import MappingProxyType
+from typing import Any, override
+
+from mpt_api_client import RQLQuery
 
 from mpt_extension_sdk.models import Agreement
 from mpt_extension_sdk.models.base import BaseModel
-from mpt_extension_sdk.services.mpt_api_service.base import BaseService, PaginatedCollection
+from mpt_extension_sdk.services.mpt_api_service.base import (
+    DEFAULT_PREFETCH_PAGES,
+    BatchedReadService,
+    PaginatedCollection,
+)
+from mpt_extension_sdk.services.mpt_api_service.projection import ProjectionProfile
 
 logger = logging.getLogger(__name__)
 
+AGREEMENT_SELECT = (
+    "assets",
+    "buyer",
+    "client",
+    "licensee",
+    "lines",
+    "listing",
+    "parameters",
+    "product",
+    "seller",
+    "subscriptions",
+)
+# Relations the Agreement model cannot be validated without.
+AGREEMENT_REQUIRED_SELECT = ("client", "licensee", "product")
+AGREEMENT_SELECTS: Mapping[ProjectionProfile, tuple[str, ...]] = MappingProxyType({
+    ProjectionProfile.MINIMAL: AGREEMENT_REQUIRED_SELECT,
+    ProjectionProfile.PARAMETERS: (*AGREEMENT_REQUIRED_SELECT, "parameters"),
+    ProjectionProfile.FULL: AGREEMENT_SELECT,
+})
+
 
-class AgreementService(BaseService[Agreement]):
+class AgreementService(BatchedReadService[Agreement]):
     """Agreements service."""
 
-    async def get_all(self, offset: int = 0, limit: int = 100) -> PaginatedCollection[Agreement]:
-        """Fetch a page of agreements."""
-        return await self._paginate(
-            self._client.commerce.agreements,
-            Agreement,
-            offset=offset,
-            limit=limit,
-        )
+    async def get_all(
+        self, offset: int = 0, limit: int = 100, rql_filter: RQLQuery | None = None
+    ) -> PaginatedCollection[Agreement]:
+        """Fetch a page of agreements, optionally filtered by an RQL query."""
+        collection = self._client.commerce.agreements
+        if rql_filter is not None:
+            collection = collection.filter(rql_filter)
+        return await self._paginate(collection, Agreement, offset=offset, limit=limit)
+
+    def iter_all(
+        self,
+        rql_filter: RQLQuery | None = None,
+        *,
+        page_size: int = 100,
+        prefetch_pages: int = DEFAULT_PREFETCH_PAGES,
+        ordered: bool = True,
+    ) -> AsyncIterator[Agreement]:
+        """Stream all agreements, fetching the next pages while the current one is consumed.
 
-    async def get_by_id(self, agreement_id: str) -> Agreement:
-        """Fetch an agreement."""
-        agreement = await self._client.commerce.agreements.get(
-            agreement_id,
-            select=[
-                "assets",
-                "buyer",
-                "client",
-                "licensee",
-                "lines",
-                "listing",
-                "parameters",
-                "product",
-                "seller",
-                "subscriptions",
-            ],
+        Args:
+            rql_filter: Optional RQL query applied to the agreements collection.
+            page_size: Number of agreements requested per page.
+            prefetch_pages: Maximum number of page requests in flight.
+            ordered: Yield agreements in collection order instead of page arrival order.
+        """
+        return self._iterate(
+            partial(self.get_all, rql_filter=rql_filter),
+            page_size=page_size,
+            prefetch_pages=prefetch_pages,
+            ordered=ordered,
         )
-        logger.debug("Fetched agreement %s: %s", agreement_id, agreement.to_dict())
-        return Agreement.from_payload(agreement)
+
+    async def get_by_id(
+        self,
+        agreement_id: str,
+        projection: ProjectionProfile = ProjectionProfile.FULL,
+        *,
+        refresh: bool = False,
+    ) -> Agreement:
+        """Fetch an agreement, or read it from the entity cache when enabled.
+
+        The entity cache and batched reads hold full agreements, so narrower
+        projections are always fetched with their own request. With `refresh`, the
+        cached agreement is dropped and fetched again.
+        """
+        if refresh:
+            self._invalidate(agreement_id)
+        if projection is not ProjectionProfile.FULL:
+            return await self._fetch_by_id(agreement_id, projection)
+        return await self._load_by_id(agreement_id, self._fetch_by_id)
 
     async def update(self, agreement_id: str, attributes: Mapping[str, Any] | BaseModel) -> None:
         """Update an agreement."""
         await self._client.commerce.agreements.update(
             agreement_id, self._serialize_attributes(attributes)
         )
+        self._invalidate(agreement_id)
+
+    @override
+    async def _fetch_many(self, entity_ids: list[str]) -> list[Agreement]:
+        """Fetch agreements with their expansions by ID in one request."""
+        return await self._fetch_by_ids(
+            self._client.commerce.agreements.select(*AGREEMENT_SELECT), Agreement, entity_ids
+        )
+
+    async def _fetch_by_id(
+        self, agreement_id: str, projection: ProjectionProfile = ProjectionProfile.FULL
+    ) -> Agreement:
+        """Fetch an agreement with the expansions of a projection from Marketplace API."""
+        select = AGREEMENT_SELECTS[projection]
+        agreement = await self._coalesced_read(
+            ("commerce.agreements", agreement_id, *select),
+            partial(self._client.commerce.agreements.get, agreement_id, select=list(select)),
+        )
+        logger.debug("Fetched agreement %s: %s", agreement_id, agreement.to_dict())
+        return Agreement.from_payload(agreement)
@@ -1,15 +1,22 @@
-from typing import Self
+from typing import Self, Unpack
 
 from mpt_extension_sdk.api.auth import AuthContext
 from mpt_extension_sdk.services.api_client_v2.mpt_api_client import AsyncMPTClient
 from mpt_extension_sdk.services.mpt_api_service.account_scoped_client import (
-    AccountTokenProvider,
-    build_account_scoped_mpt_client,
+    close_account_scoped_clients,
+    get_account_scoped_client,
 )
 from mpt_extension_sdk.services.mpt_api_service.account_token import AccountTokenService
 from mpt_extension_sdk.services.mpt_api_service.agreement import AgreementService
 from mpt_extension_sdk.services.mpt_api_service.asset import AssetService
-from mpt_extension_sdk.services.mpt_api_service.client_factory import build_mpt_client
+from mpt_extension_sdk.services.mpt_api_service.client_factory import (
+    MPTClientOptions,
+    build_mpt_client,
+)
+from mpt_extension_sdk.services.mpt_api_service.entity_cache import (
+    EntityCaches,
+    get_client_entity_caches,
+)
 from mpt_extension_sdk.services.mpt_api_service.extension import ExtensionService
 from mpt_extension_sdk.services.mpt_api_service.installation import InstallationService
 from mpt_extension_sdk.services.mpt_api_service.order import OrderService
@@ -19,50 +26,128 @@ from mpt_extension_sdk.services.mpt_api_service.product import (
 )
 from mpt_extension_sdk.services.mpt_api_service.subscription import SubscriptionService
 from mpt_extension_sdk.services.mpt_api_service.task import TaskService
-from mpt_extension_sdk.services.mpt_api_service.template import TemplateService
+from mpt_extension_sdk.services.mpt_api_service.template import (
+    ProductTemplateCache,
+    TemplateService,
+    get_runtime_template_cache,
+    warm_up_template_cache,
+)
 from mpt_extension_sdk.settings.runtime import get_runtime_settings
 
 
 class MPTAPIService:  # noqa: WPS215, WPS230
     """API service for Marketplace operations."""
 
-    def __init__(self, client: AsyncMPTClient) -> None:
+    def __init__(
+        self,
+        client: AsyncMPTClient,
+        *,
+        entity_caches: EntityCaches | None = None,
+        coalesced_reads: tuple[str, ...] = (),
+        batched_reads: tuple[str, ...] = (),
+        template_cache: ProductTemplateCache | None = None,
+    ) -> None:
         """Initialize API service.
 
         Args:
             client: Shared MPT API client.
+            entity_caches: Optional order and agreement caches bound to the client.
+            coalesced_reads: Names of the services whose identical concurrent
+                `get_by_id` reads share one request.
+            batched_reads: Names of the services whose `get_by_id` reads made within
+                one event-loop tick are batched into `id in (...)` requests.
+            template_cache: Optional process-wide cache of the templates per product.
         """
+        entity_caches = entity_caches or EntityCaches()
         self.client = client
-        self.agreements = AgreementService(client)
-        self.assets = AssetService(client)
+        self.agreements = AgreementService(
+            client,
+            cache=entity_caches.agreements,
+            coalesce_reads="agreements" in coalesced_reads,
+            batch_reads="agreements" in batched_reads,
+        )
+        self.assets = AssetService(
+            client,
+            coalesce_reads="assets" in coalesced_reads,
+            batch_reads="assets" in batched_reads,
+            order_cache=entity_caches.orders,
+        )
         self.account_token = AccountTokenService(client)
         self.extensions = ExtensionService(client)
         self.installations = InstallationService(client)
         self.products = ProductService(client)
         self.product_items = ProductItemService(client)
-        self.orders = OrderService(client)
-        self.subscriptions = SubscriptionService(client)
+        self.orders = OrderService(
+            client, cache=entity_caches.orders, coalesce_reads="orders" in coalesced_reads
+        )
+        self.subscriptions = SubscriptionService(
+            client,
+            coalesce_reads="subscriptions" in coalesced_reads,
+            batch_reads="subscriptions" in batched_reads,
+            order_cache=entity_caches.orders,
+        )
         self.tasks = TaskService(client)
-        self.templates = TemplateService(client)
+        self.templates = TemplateService(
+            client, product_cache=template_cache, order_cache=entity_caches.orders
+        )
 
     @classmethod
     async def from_auth_context(cls, base_url: str, auth: AuthContext) -> Self:
-        """Create the service from the request authentication context."""
+        """Create the service from the request authentication context.
+
+        The account-scoped client is reused across requests for the same account
+        through the process-wide client registry. When `SDK_ENTITY_CACHE_TTL_SECONDS`
+        is set, orders and agreements are cached alongside the account client, and
+        the services listed in `SDK_COALESCED_READ_SERVICES` and
+        `SDK_BATCHED_READ_SERVICES` coalesce or batch their reads. Product templates
+        are cached process-wide when `SDK_TEMPLATE_CACHE_TTL_SECONDS` is set, and
+        transient failures are retried with backoff when `SDK_HTTP_RETRY_ENABLED` is set.
+        """
         runtime_settings = get_runtime_settings()
-        client = build_account_scoped_mpt_client(
-            base_url=base_url,
-            token_provider=AccountTokenProvider(
-                runtime_settings=runtime_settings, auth=auth, service_type=cls
-            ),
+        client = get_account_scoped_client(base_url, auth, runtime_settings, cls)
+        entity_caches = None
+        if runtime_settings.entity_cache_ttl_seconds > 0:
+            entity_caches = get_client_entity_caches(
+                client,
+                ttl_seconds=runtime_settings.entity_cache_ttl_seconds,
+                max_entries=runtime_settings.entity_cache_max_entries,
+            )
+        return cls(
+            client,
+            entity_caches=entity_caches,
+            coalesced_reads=tuple(runtime_settings.coalesced_read_services),
+            batched_reads=tuple(runtime_settings.batched_read_services),
+            template_cache=get_runtime_template_cache(runtime_settings),
         )
-        return cls(client)
 
     @classmethod
-    def from_config(cls, base_url: str, api_token: str) -> Self:
+    async def warm_up_caches(cls) -> None:
+        """Load the templates of the extension products into the template cache.
+
+        Product ids are read from the `product_ids` of the extension settings. The
+        templates are read with the extension token; failures are logged, so a
+        product that cannot be warmed up is loaded on its first lookup instead.
+        """
+        await warm_up_template_cache(get_runtime_settings())
+
+    @classmethod
+    async def close_account_clients(cls) -> None:
+        """Close the pooled account-scoped clients created by `from_auth_context`."""
+        await close_account_scoped_clients()
+
+    @classmethod
+    def from_config(
+        cls,
+        base_url: str,
+        api_token: str,
+        **client_options: Unpack[MPTClientOptions],
+    ) -> Self:
         """Create the service from connection settings.
 
         Args:
             base_url: MPT API base URL.
             api_token: MPT API token.
+            client_options: Optional retry policy, HTTP settings and rate limiter of
+                the client.
         """
-        return cls(build_mpt_client(base_url=base_url, api_token=api_token))
+        return cls(build_mpt_client(base_url=base_url, api_token=api_token, **client_options))
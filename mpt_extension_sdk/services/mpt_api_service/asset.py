@@ -1,14 +1,29 @@
 from collections.abc import Mapping
-from typing import Any
+from functools import partial
+from typing import Any, override
 
-from mpt_extension_sdk.models import Asset
+from mpt_extension_sdk.models import Asset, Order
 from mpt_extension_sdk.models.base import BaseModel
-from mpt_extension_sdk.services.mpt_api_service.base import BaseService
+from mpt_extension_sdk.services.api_client_v2.mpt_api_client import AsyncMPTClient
+from mpt_extension_sdk.services.mpt_api_service.base import BatchedReadService
+from mpt_extension_sdk.services.mpt_api_service.entity_cache import EntityCache
 
 
-class AssetService(BaseService[Asset]):
+class AssetService(BatchedReadService[Asset]):
     """Asset service."""
 
+    def __init__(
+        self,
+        client: AsyncMPTClient,
+        *,
+        coalesce_reads: bool = False,
+        batch_reads: bool = False,
+        order_cache: EntityCache[Order] | None = None,
+    ) -> None:
+        """Initialize the service with the order cache its order writes invalidate."""
+        super().__init__(client, coalesce_reads=coalesce_reads, batch_reads=batch_reads)
+        self._order_cache = order_cache
+
     async def create(self, asset: Mapping[str, Any] | BaseModel) -> Asset:
         """Create an asset."""
         return Asset.from_payload(
@@ -18,16 +33,17 @@ class AssetService(BaseService[Asset]):
     async def create_order_asset(
         self, order_id: str, asset: Mapping[str, Any] | BaseModel
     ) -> Asset:
-        """Create an asset inside an order."""
-        return Asset.from_payload(
-            await self._client.commerce.orders.assets(order_id).create(
-                self._serialize_attributes(asset)
-            )
+        """Create an asset inside an order and drop the cached order."""
+        created = await self._client.commerce.orders.assets(order_id).create(
+            self._serialize_attributes(asset)
         )
+        if self._order_cache is not None:
+            self._order_cache.invalidate(order_id)
+        return Asset.from_payload(created)
 
     async def get_by_id(self, asset_id: str) -> Asset:
         """Fetch an asset by ID."""
-        return Asset.from_payload(await self._client.commerce.assets.get(asset_id))
+        return await self._load_by_id(asset_id, self._fetch_by_id)
 
     async def update(self, asset_id: str, attributes: Mapping[str, Any] | BaseModel) -> Asset:
         """Update an asset."""
@@ -36,3 +52,16 @@ class AssetService(BaseService[Asset]):
                 asset_id, self._serialize_attributes(attributes)
             )
         )
+
+    @override
+    async def _fetch_many(self, entity_ids: list[str]) -> list[Asset]:
+        """Fetch assets by ID in one request."""
+        return await self._fetch_by_ids(self._client.commerce.assets, Asset, entity_ids)
+
+    async def _fetch_by_id(self, asset_id: str) -> Asset:
+        """Fetch one asset from Marketplace API."""
+        return Asset.from_payload(
+            await self._coalesced_read(
+                ("commerce.assets", asset_id), partial(self._client.commerce.assets.get, asset_id)
+            )
+        )
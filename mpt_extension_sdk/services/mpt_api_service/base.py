@@ -1,9 +1,30 @@
-from collections.abc import Mapping
+import asyncio
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine, Mapping
 from dataclasses import dataclass
-from typing import Any
+from functools import partial
+from typing import Any, Self
 
+from mpt_api_client import RQLQuery
+
+from mpt_extension_sdk.errors.runtime import PartialFetchError
 from mpt_extension_sdk.models.base import BaseModel
 from mpt_extension_sdk.services.api_client_v2.mpt_api_client import AsyncMPTClient
+from mpt_extension_sdk.services.mpt_api_service.batch_loader import (
+    MAX_BATCH_SIZE,
+    BatchFetch,
+    BatchLoader,
+)
+from mpt_extension_sdk.services.mpt_api_service.entity_cache import EntityCache
+from mpt_extension_sdk.services.mpt_api_service.single_flight import (
+    ReadCall,
+    SingleFlight,
+    get_read_single_flight,
+)
+
+DEFAULT_PREFETCH_PAGES = 1
+DEFAULT_CHUNK_CONCURRENCY = 4
 
 
 @dataclass(frozen=True)
@@ -16,12 +37,110 @@ class PaginatedCollection[Model: BaseModel]:
     total: int
 
 
-class BaseService[Model: BaseModel]:
+type PageFetcher[Model: BaseModel] = Callable[..., Coroutine[Any, Any, PaginatedCollection[Model]]]
+type PageTask[Model: BaseModel] = asyncio.Task[PaginatedCollection[Model]]
+
+
+class BaseService[Model: BaseModel]:  # noqa: WPS214
     """Base service class for all services."""
 
-    def __init__(self, client: AsyncMPTClient) -> None:
-        """Initialize service with an MPT client."""
+    def __init__(
+        self,
+        client: AsyncMPTClient,
+        cache: EntityCache[Model] | None = None,
+        *,
+        coalesce_reads: bool = False,
+        batch_fetch: BatchFetch[Model] | None = None,
+    ) -> None:
+        """Initialize service with an MPT client.
+
+        Args:
+            client: Shared MPT API client.
+            cache: Optional entity cache used by `get_by_id` reads.
+            coalesce_reads: Share one request between identical concurrent reads.
+            batch_fetch: Optional coroutine function fetching entities by ID in one
+                request; `get_by_id` reads made within one event-loop tick are then
+                collected into chunked calls to it.
+        """
         self._client = client
+        self._cache = cache
+        self._coalesce_reads = coalesce_reads
+        self._batch_loader = None if batch_fetch is None else BatchLoader(batch_fetch)
+
+    async def _load_by_id(self, entity_id: str, fetch: Callable[[str], Awaitable[Model]]) -> Model:
+        """Load an entity through the entity cache and the batch loader when enabled."""
+        if self._batch_loader is not None:
+            fetch = self._batch_loader.load
+        if self._cache is None:
+            return await fetch(entity_id)
+        return await self._cache.get_or_fetch(entity_id, partial(fetch, entity_id))
+
+    async def _coalesced_read[Payload](
+        self, key: tuple[str, ...], read: ReadCall[Payload]
+    ) -> Payload:
+        """Run a read, sharing it with identical concurrent reads when coalescing is on.
+
+        Args:
+            key: Endpoint, entity ID and query identifying identical reads.
+            read: Issues the read against Marketplace API.
+        """
+        if not self._coalesce_reads:
+            return await read()
+        single_flight: SingleFlight[Payload] = get_read_single_flight()
+        return await single_flight.run((self._client, *key), read)
+
+    async def _fetch_by_ids(
+        self, collection: Any, model: type[Model], entity_ids: list[str]
+    ) -> list[Model]:
+        """Fetch the entities of a collection matching the given IDs in one page."""
+        id_filter = RQLQuery().id.in_(entity_ids)  # type: ignore[arg-type]
+        filtered_collection = collection.filter(id_filter)
+        page = await self._paginate(filtered_collection, model, limit=len(entity_ids))
+        return page.resources
+
+    async def _fetch_in_chunks(
+        self,
+        entity_ids: list[str],
+        fetch_chunk: BatchFetch[Model],
+        *,
+        chunk_size: int = MAX_BATCH_SIZE,
+        concurrency: int = DEFAULT_CHUNK_CONCURRENCY,
+    ) -> list[Model]:
+        """Fetch entities by ID in chunks with at most `concurrency` requests in flight.
+
+        Resources are returned in chunk order, as a sequential walk would return them.
+
+        Args:
+            entity_ids: IDs to fetch.
+            fetch_chunk: Coroutine function fetching the entities of one chunk of IDs.
+            chunk_size: Maximum number of IDs per request.
+            concurrency: Maximum number of chunk requests in flight.
+
+        Raises:
+            PartialFetchError: When some chunks fail; it carries the resources of the
+                successful chunks and the IDs of the failed ones. When every chunk
+                fails, the error of the first chunk is raised as is instead.
+        """
+        if chunk_size <= 0 or concurrency <= 0:
+            raise ValueError("chunk_size and concurrency must be greater than 0")
+        chunks = [
+            entity_ids[start : start + chunk_size]
+            for start in range(0, len(entity_ids), chunk_size)
+        ]
+        semaphore = asyncio.Semaphore(concurrency)
+        chunk_results = await asyncio.gather(
+            *[_fetch_chunk_limited(semaphore, fetch_chunk, chunk_ids) for chunk_ids in chunks],
+            return_exceptions=True,
+        )
+        errors = [error for error in chunk_results if isinstance(error, Exception)]
+        if errors and len(errors) == len(chunks):
+            raise errors[0]
+        return _merge_chunk_results(chunks, chunk_results)
+
+    def _invalidate(self, entity_id: str) -> None:
+        """Drop a cached entity after it was written through the service."""
+        if self._cache is not None:
+            self._cache.invalidate(entity_id)
 
     def _serialize_attributes(self, attributes: Mapping[str, Any] | BaseModel) -> dict[str, Any]:
         """Serialize update or create attributes for the Marketplace client."""
@@ -47,3 +166,161 @@ class BaseService[Model: BaseModel]:
             resources=resources,
             total=pagination.total if pagination else offset + len(resources),
         )
+
+    async def _iterate(
+        self,
+        fetch_page: PageFetcher[Model],
+        *,
+        page_size: int = 100,
+        prefetch_pages: int = DEFAULT_PREFETCH_PAGES,
+        ordered: bool = True,
+    ) -> AsyncIterator[Model]:
+        """Yield every resource of a collection while the next pages are fetched ahead.
+
+        Once the first page reports the collection total, up to `prefetch_pages`
+        following pages are requested concurrently, so a bulk read takes roughly
+        `pages / prefetch_pages` round trips and at most `prefetch_pages + 1` pages are
+        held in memory. Pending requests are cancelled when the consumer stops early.
+
+        Args:
+            fetch_page: Coroutine function fetching one page by `offset` and `limit`.
+            page_size: Number of resources requested per page.
+            prefetch_pages: Maximum number of page requests in flight.
+            ordered: Yield pages in collection order; when False, pages are yielded
+                as soon as they arrive.
+        """
+        if page_size <= 0 or prefetch_pages <= 0:
+            raise ValueError("page_size and prefetch_pages must be greater than 0")
+
+        first_page = await fetch_page(offset=0, limit=page_size)
+        # The API may cap the requested page size, so follow the page limit it reports.
+        step = first_page.limit or page_size
+        page: PaginatedCollection[Model] | None = first_page
+        async with PageReadAhead(
+            fetch_page,
+            start_offset=first_page.offset + step,
+            step=step,
+            window=prefetch_pages,
+            ordered=ordered,
+        ) as read_ahead:
+            while page is not None:
+                read_ahead.schedule(total=page.total)
+                for resource in page.resources:
+                    yield resource
+                page = await read_ahead.next_page()
+
+
+class BatchedReadService[Model: BaseModel](BaseService[Model], ABC):
+    """Service whose `get_by_id` reads can be batched into `id in (...)` requests."""
+
+    def __init__(
+        self,
+        client: AsyncMPTClient,
+        cache: EntityCache[Model] | None = None,
+        *,
+        coalesce_reads: bool = False,
+        batch_reads: bool = False,
+    ) -> None:
+        """Initialize service with an MPT client.
+
+        Args:
+            client: Shared MPT API client.
+            cache: Optional entity cache used by `get_by_id` reads.
+            coalesce_reads: Share one request between identical concurrent reads.
+            batch_reads: Collect `get_by_id` reads made within one event-loop tick
+                into chunked `id in (...)` requests.
+        """
+        super().__init__(
+            client,
+            cache,
+            coalesce_reads=coalesce_reads,
+            batch_fetch=self._fetch_many if batch_reads else None,
+        )
+
+    @abstractmethod
+    async def _fetch_many(self, entity_ids: list[str]) -> list[Model]:
+        """Fetch entities by ID in one request."""
+
+
+async def _fetch_chunk_limited[Model: BaseModel](
+    semaphore: asyncio.Semaphore, fetch_chunk: BatchFetch[Model], chunk_ids: list[str]
+) -> list[Model]:
+    async with semaphore:
+        return await fetch_chunk(chunk_ids)
+
+
+def _merge_chunk_results[Model: BaseModel](
+    chunks: list[list[str]], chunk_results: list[list[Model] | BaseException]
+) -> list[Model]:
+    resources: list[Model] = []
+    failed_ids: list[str] = []
+    errors: list[Exception] = []
+    for chunk_ids, chunk_result in zip(chunks, chunk_results, strict=True):
+        if isinstance(chunk_result, Exception):
+            failed_ids.extend(chunk_ids)
+            errors.append(chunk_result)
+        elif isinstance(chunk_result, BaseException):
+            raise chunk_result
+        else:
+            resources.extend(chunk_result)
+    if errors:
+        raise PartialFetchError(
+            f"Failed to fetch {len(failed_ids)} of {sum(map(len, chunks))} resources",
+            resources=resources,
+            failed_ids=failed_ids,
+            errors=errors,
+        ) from errors[0]
+    return resources
+
+
+class PageReadAhead[Model: BaseModel]:
+    """Bounded window of page requests issued ahead of a collection consumer."""
+
+    def __init__(
+        self,
+        fetch_page: PageFetcher[Model],
+        *,
+        start_offset: int,
+        step: int,
+        window: int,
+        ordered: bool = True,
+    ) -> None:
+        self._fetch_page = fetch_page
+        self._next_offset = start_offset
+        self._step = step
+        self._window = window
+        self._ordered = ordered
+        self._pending: deque[PageTask[Model]] = deque()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Cancel the page requests the consumer no longer needs."""
+        for pending_page in self._pending:
+            pending_page.cancel()
+        await asyncio.gather(*self._pending, return_exceptions=True)
+        self._pending.clear()
+
+    def schedule(self, *, total: int) -> None:
+        """Request following pages until the window is full or the total is reached."""
+        while len(self._pending) < self._window and self._next_offset < total:
+            self._pending.append(
+                asyncio.create_task(self._fetch_page(offset=self._next_offset, limit=self._step))
+            )
+            self._next_offset += self._step
+
+    async def next_page(self) -> PaginatedCollection[Model] | None:
+        """Wait for the next page, or return None when none is pending.
+
+        Ordered windows return the oldest requested page; unordered windows return
+        the first page that completes.
+        """
+        if not self._pending:
+            return None
+        if self._ordered:
+            return await self._pending.popleft()
+        done, _ = await asyncio.wait(self._pending, return_when=asyncio.FIRST_COMPLETED)
+        completed = next(page_task for page_task in self._pending if page_task in done)
+        self._pending.remove(completed)
+        return completed.result()
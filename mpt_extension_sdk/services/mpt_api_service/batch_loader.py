@@ -0,0 +1,91 @@
+import asyncio
+from collections.abc import Callable, Coroutine
+from http import HTTPStatus
+from operator import attrgetter
+from typing import Any
+
+from mpt_api_client.exceptions import MPTHttpError
+
+from mpt_extension_sdk.models.base import BaseModel
+
+MAX_BATCH_SIZE = 100
+
+_resource_id = attrgetter("id")
+
+type BatchFetch[Model: BaseModel] = Callable[[list[str]], Coroutine[Any, Any, list[Model]]]
+type BatchWaiters[Model: BaseModel] = dict[str, list[asyncio.Future[Model]]]
+
+
+class BatchLoader[Model: BaseModel]:
+    """Collect loads made within one event-loop tick into chunked batch fetches.
+
+    Every `load` call issued before the loop runs its next callbacks is queued. The
+    queued ids are then deduplicated, split into chunks of `max_batch_size` and
+    fetched with one request per chunk. Ids missing from a batch response fail with
+    the 404 error a single `get` would raise.
+    """
+
+    def __init__(self, fetch_many: BatchFetch[Model], *, max_batch_size: int = MAX_BATCH_SIZE):
+        if max_batch_size <= 0:
+            raise ValueError("max_batch_size must be greater than 0")
+        self._fetch_many = fetch_many
+        self._max_batch_size = max_batch_size
+        self._waiters: BatchWaiters[Model] = {}
+        self._in_flight: set[asyncio.Task[None]] = set()
+
+    async def load(self, entity_id: str) -> Model:
+        """Queue an entity for the next batch and wait for it."""
+        loop = asyncio.get_running_loop()
+        if not self._waiters:
+            loop.call_soon(self._dispatch)
+        waiter: asyncio.Future[Model] = loop.create_future()
+        self._waiters.setdefault(entity_id, []).append(waiter)
+        return await waiter
+
+    def _dispatch(self) -> None:
+        """Start one batch fetch per chunk of the queued ids."""
+        waiters = self._waiters
+        self._waiters = {}
+        entity_ids = list(waiters)
+        for start in range(0, len(entity_ids), self._max_batch_size):
+            chunk_ids = entity_ids[start : start + self._max_batch_size]
+            batch = asyncio.create_task(
+                self._load_batch({entity_id: waiters[entity_id] for entity_id in chunk_ids})
+            )
+            self._in_flight.add(batch)
+            batch.add_done_callback(self._in_flight.discard)
+
+    async def _load_batch(self, waiters: BatchWaiters[Model]) -> None:
+        """Fetch one chunk and hand each waiter its entity or the failure."""
+        try:
+            resources = await self._fetch_many(list(waiters))
+        except Exception as error:
+            for entity_waiters in waiters.values():
+                _settle(entity_waiters, error)
+            return
+        _resolve_batch(waiters, resources)
+
+
+def _resolve_batch[Model: BaseModel](waiters: BatchWaiters[Model], resources: list[Model]) -> None:
+    resources_by_id = {_resource_id(resource): resource for resource in resources}
+    for entity_id, entity_waiters in waiters.items():
+        resource = resources_by_id.get(entity_id)
+        _settle(entity_waiters, _not_found(entity_id) if resource is None else resource)
+
+
+def _settle[Model: BaseModel](
+    waiters: list[asyncio.Future[Model]], outcome: Model | Exception
+) -> None:
+    for waiter in waiters:
+        if waiter.done():
+            continue
+        if isinstance(outcome, Exception):
+            waiter.set_exception(outcome)
+        else:
+            waiter.set_result(outcome)
+
+
+def _not_found(entity_id: str) -> MPTHttpError:
+    return MPTHttpError(
+        status_code=HTTPStatus.NOT_FOUND, message=f"Resource {entity_id} not found", body=""
+    )
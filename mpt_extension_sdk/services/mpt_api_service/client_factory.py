@@ -1,13 +1,145 @@
 from functools import lru_cache
+from typing import TypedDict
 
-from mpt_api_client.auth import BearerTokenAuthentication
+from httpx import AsyncBaseTransport, AsyncClient, AsyncHTTPTransport, Timeout
+from httpx_retries import RetryTransport
+from mpt_api_client.auth import Authentication, BearerTokenAuthentication
+from mpt_api_client.http import TransportSettings
+from mpt_api_client.http.async_client import AsyncHTTPClient
 
 from mpt_extension_sdk.services.api_client_v2.mpt_api_client import AsyncMPTClient
+from mpt_extension_sdk.services.mpt_api_service.http_settings import HTTPClientSettings
+from mpt_extension_sdk.services.mpt_api_service.rate_limit import (
+    RateLimiter,
+    RateLimitTransport,
+    get_extension_rate_limiter,
+)
+from mpt_extension_sdk.services.mpt_api_service.retry_policy import (
+    BackoffRetryTransport,
+    RetryPolicy,
+)
+from mpt_extension_sdk.settings.runtime import RuntimeSettings
+
+USER_AGENT = "swo-marketplace-client/1.0"
+
+
+class MPTClientOptions(TypedDict, total=False):
+    """Optional transport settings of an MPT client built by `build_mpt_client`."""
+
+    retry_policy: RetryPolicy | None
+    http_settings: HTTPClientSettings | None
+    rate_limiter: RateLimiter | None
+
+
+class PooledAsyncHTTPClient(AsyncHTTPClient):
+    """`AsyncHTTPClient` that sends its requests through a caller-supplied transport.
+
+    The upstream constructor always opens its own retrying connection pool; this
+    client skips it, so a shared pool is used without building one to discard.
+    """
+
+    def __init__(
+        self,
+        transport_settings: TransportSettings,
+        *,
+        authentication: Authentication,
+        transport: AsyncBaseTransport,
+        timeout: Timeout | float,
+    ) -> None:
+        self._transport = transport_settings
+        authentication.configure(transport_settings)
+        self.httpx_client = AsyncClient(
+            base_url=transport_settings.url,
+            headers={"User-Agent": USER_AGENT},
+            auth=authentication,
+            timeout=timeout,
+            transport=transport,
+            follow_redirects=True,
+        )
 
 
 @lru_cache
-def build_mpt_client(base_url: str, api_token: str) -> AsyncMPTClient:
+def build_mpt_client(
+    base_url: str,
+    api_token: str,
+    retry_policy: RetryPolicy | None = None,
+    http_settings: HTTPClientSettings | None = None,
+    rate_limiter: RateLimiter | None = None,
+) -> AsyncMPTClient:
     """Build and cache MPT client instance."""
-    return AsyncMPTClient.from_config(
-        base_url=base_url, authentication=BearerTokenAuthentication(api_token)
+    authentication = BearerTokenAuthentication(api_token)
+    if retry_policy is None and http_settings is None and rate_limiter is None:
+        return AsyncMPTClient.from_config(base_url=base_url, authentication=authentication)
+    return AsyncMPTClient(
+        build_http_client(
+            TransportSettings(base_url=base_url),
+            authentication=authentication,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            http_settings=http_settings,
+        )
+    )
+
+
+def build_extension_mpt_client(runtime_settings: RuntimeSettings) -> AsyncMPTClient:
+    """Build the MPT client authenticated with the extension token of the runtime settings."""
+    return build_mpt_client(
+        base_url=runtime_settings.mpt_api_base_url,
+        api_token=runtime_settings.ext_api_key,
+        retry_policy=RetryPolicy.from_runtime_settings(runtime_settings),
+        http_settings=HTTPClientSettings.from_runtime_settings(runtime_settings),
+        rate_limiter=get_extension_rate_limiter(runtime_settings),
+    )
+
+
+def build_http_client(  # noqa: WPS211
+    transport_settings: TransportSettings,
+    *,
+    authentication: Authentication,
+    transport: AsyncBaseTransport | None = None,
+    rate_limiter: RateLimiter | None = None,
+    retry_policy: RetryPolicy | None = None,
+    http_settings: HTTPClientSettings | None = None,
+) -> AsyncHTTPClient:
+    """Build an async HTTP client, optionally routed through a caller-owned transport.
+
+    Without options this is the upstream `AsyncHTTPClient` with its own pool. With
+    any option, a `PooledAsyncHTTPClient` is built directly on the given transport,
+    or on a pool built from `http_settings`, keeping the upstream retry policy and
+    default headers. A `retry_policy` replaces the upstream retries, which resend
+    immediately, with jittered backoff.
+
+    Args:
+        transport_settings: Base URL, timeout, and retry policy of the client.
+        authentication: Authentication provider used for every request.
+        transport: Optional transport that owns the connections, e.g. a shared pool.
+        rate_limiter: Optional limiter applied to every attempt, retries included.
+        retry_policy: Optional backoff policy used instead of the upstream retries.
+        http_settings: Optional pool limits and timeouts used instead of the
+            `transport_settings` timeout and the httpx pool defaults.
+    """
+    options = (transport, rate_limiter, retry_policy, http_settings)
+    if all(option is None for option in options):
+        return AsyncHTTPClient(transport_settings, authentication=authentication)
+
+    transport = transport or _build_pool(http_settings)
+    if rate_limiter is not None:
+        transport = RateLimitTransport(transport, rate_limiter)
+    retry_transport: AsyncBaseTransport
+    if retry_policy is None:
+        retry_transport = RetryTransport(transport=transport, retry=transport_settings.retry)
+    else:
+        retry_transport = BackoffRetryTransport(transport, retry_policy)
+
+    return PooledAsyncHTTPClient(
+        transport_settings,
+        authentication=authentication,
+        transport=retry_transport,
+        timeout=transport_settings.timeout if http_settings is None else http_settings.timeout,
     )
+
+
+def _build_pool(http_settings: HTTPClientSettings | None) -> AsyncBaseTransport:
+    if http_settings is None:
+        return AsyncHTTPTransport()
+    return http_settings.build_transport()
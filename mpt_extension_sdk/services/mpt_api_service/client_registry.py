@@ -0,0 +1,137 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import override
+
+from httpx import AsyncBaseTransport, AsyncHTTPTransport, Request, Response
+
+from mpt_extension_sdk.services.api_client_v2.mpt_api_client import AsyncMPTClient
+from mpt_extension_sdk.services.mpt_api_service.http_settings import HTTPClientSettings
+from mpt_extension_sdk.settings.runtime import get_runtime_settings
+
+ClientRegistryKey = tuple[str, str, str]
+AccountClientFactory = Callable[[AsyncBaseTransport], AsyncMPTClient]
+PoolFactory = Callable[[], AsyncBaseTransport]
+
+DEFAULT_MAX_CLIENTS = 512
+DEFAULT_IDLE_TTL_SECONDS = 900.0
+
+
+class SharedPoolTransport(AsyncBaseTransport):
+    """Non-owning transport that sends requests through a shared connection pool.
+
+    Closing one account client must not drop connections that other accounts still
+    use, so `aclose` leaves the pool open and the registry closes it on shutdown.
+    """
+
+    def __init__(self, pool: AsyncBaseTransport) -> None:
+        self._pool = pool
+
+    @override
+    async def handle_async_request(self, request: Request) -> Response:
+        """Send the request through the shared pool."""
+        return await self._pool.handle_async_request(request)
+
+    @override
+    async def aclose(self) -> None:
+        """Keep the shared pool open; its lifecycle belongs to the registry."""
+
+
+@dataclass
+class RegisteredClient:
+    """Account client kept by the registry with its last access time."""
+
+    client: AsyncMPTClient
+    last_used_at: float
+
+
+class AccountClientRegistry:
+    """Process-wide registry of account-scoped MPT clients.
+
+    Clients are keyed by `(base_url, extension_id, account_id)` and send every request
+    through one keep-alive connection pool. Accounts idle for longer than the TTL, and
+    the least recently used accounts beyond the size bound, are evicted. Eviction only
+    drops the client object: connections belong to the shared pool, so requests still
+    in flight on an evicted client complete normally.
+
+    Evicted clients are not closed, as they own no transport. Their other state (the
+    entity caches, weakly keyed by client, and the rate limiter and token provider
+    the client holds) is released with the client object. A per-client resource that
+    needs closing must be released here on eviction instead.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_clients: int = DEFAULT_MAX_CLIENTS,
+        idle_ttl_seconds: float = DEFAULT_IDLE_TTL_SECONDS,
+        pool_factory: PoolFactory = AsyncHTTPTransport,
+    ) -> None:
+        if max_clients <= 0:
+            raise ValueError("max_clients must be greater than 0")
+        self._max_clients = max_clients
+        self._idle_ttl_seconds = idle_ttl_seconds
+        self._pool_factory = pool_factory
+        self._pool: AsyncBaseTransport | None = None
+        self._clients: OrderedDict[ClientRegistryKey, RegisteredClient] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def get_client(self, key: ClientRegistryKey, factory: AccountClientFactory) -> AsyncMPTClient:
+        """Return the registered client for a key, building it on first use.
+
+        Args:
+            key: The `(base_url, extension_id, account_id)` registry key.
+            factory: Builds a new client routed through the provided shared transport.
+        """
+        now = time.monotonic()
+        self._evict_idle(now)
+        registered = self._clients.get(key)
+        if registered is not None:
+            registered.last_used_at = now
+            self._clients.move_to_end(key)
+            return registered.client
+
+        client = factory(SharedPoolTransport(self._get_pool()))
+        self._clients[key] = RegisteredClient(client=client, last_used_at=now)
+        while len(self._clients) > self._max_clients:
+            self._clients.popitem(last=False)
+        return client
+
+    async def aclose(self) -> None:
+        """Drop every registered client and close the shared connection pool."""
+        self._clients.clear()
+        pool = self._pool
+        self._pool = None
+        if pool is not None:
+            await pool.aclose()
+
+    def _evict_idle(self, now: float) -> None:
+        """Evict clients not used within the idle TTL, oldest first."""
+        while self._clients:
+            oldest_key, oldest = next(iter(self._clients.items()))
+            if now - oldest.last_used_at < self._idle_ttl_seconds:
+                return
+            self._clients.pop(oldest_key)
+
+    def _get_pool(self) -> AsyncBaseTransport:
+        """Return the shared connection pool, creating it after startup or shutdown."""
+        if self._pool is None:
+            self._pool = self._pool_factory()
+        return self._pool
+
+
+@lru_cache
+def get_account_client_registry() -> AccountClientRegistry:
+    """Return the process-wide account client registry.
+
+    Its shared pool is sized by the `SDK_HTTP_*` runtime settings.
+    """
+    return AccountClientRegistry(pool_factory=_build_shared_pool)
+
+
+def _build_shared_pool() -> AsyncBaseTransport:
+    return HTTPClientSettings.from_runtime_settings(get_runtime_settings()).build_transport()
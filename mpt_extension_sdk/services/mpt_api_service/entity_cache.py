@@ -0,0 +1,129 @@
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from weakref import WeakKeyDictionary
+
+from mpt_extension_sdk.models import Agreement, Order
+from mpt_extension_sdk.services.api_client_v2.mpt_api_client import AsyncMPTClient
+
+Clock = Callable[[], float]
+
+
+@dataclass(frozen=True)
+class CachedEntity[Entity]:
+    """Entity kept by the cache with its expiry time."""
+
+    entity: Entity
+    expires_at: float
+
+
+class EntityCache[Entity]:
+    """Read-through cache of Marketplace entities with a TTL and an LRU size bound.
+
+    Entries are keyed by entity id. A fetch only populates the cache when no write
+    invalidated an entry while it was in flight, and never replaces a cached entity
+    with an older revision. Cached models are frozen, so callers share one instance.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float,
+        max_entries: int,
+        clock: Clock = time.monotonic,
+    ) -> None:
+        if ttl_seconds <= 0 or max_entries <= 0:
+            raise ValueError("ttl_seconds and max_entries must be greater than 0")
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[str, CachedEntity[Entity]] = OrderedDict()
+        self._generation = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get_or_fetch(self, entity_id: str, fetch: Callable[[], Awaitable[Entity]]) -> Entity:
+        """Return the cached entity, fetching and caching it on a miss.
+
+        Args:
+            entity_id: The entity ID used as cache key.
+            fetch: Fetches the entity from Marketplace API.
+        """
+        cached = self.get(entity_id)
+        if cached is not None:
+            return cached
+
+        generation = self._generation
+        entity = await fetch()
+        if generation == self._generation:
+            self.put(entity_id, entity)
+        return entity
+
+    def get(self, entity_id: str) -> Entity | None:
+        """Return the cached entity, or None when it is missing or expired."""
+        cached = self._entries.get(entity_id)
+        if cached is None:
+            return None
+        if cached.expires_at <= self._clock():
+            self._entries.pop(entity_id)
+            return None
+        self._entries.move_to_end(entity_id)
+        return cached.entity
+
+    def put(self, entity_id: str, entity: Entity) -> None:
+        """Cache an entity unless a newer revision is already cached."""
+        cached = self._entries.get(entity_id)
+        if cached is not None and _revision(entity) < _revision(cached.entity):
+            return
+        self._entries[entity_id] = CachedEntity(
+            entity=entity, expires_at=self._clock() + self._ttl_seconds
+        )
+        self._entries.move_to_end(entity_id)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, entity_id: str) -> None:
+        """Drop an entity after a write and discard fetches still in flight."""
+        self._generation += 1
+        self._entries.pop(entity_id, None)
+
+    def clear(self) -> None:
+        """Drop every cached entity."""
+        self._generation += 1
+        self._entries.clear()
+
+
+@dataclass(frozen=True)
+class EntityCaches:
+    """Entity caches used by the services of one MPT client."""
+
+    orders: EntityCache[Order] | None = None
+    agreements: EntityCache[Agreement] | None = None
+
+
+_client_entity_caches: WeakKeyDictionary[AsyncMPTClient, EntityCaches] = WeakKeyDictionary()
+
+
+def get_client_entity_caches(
+    client: AsyncMPTClient, *, ttl_seconds: float, max_entries: int
+) -> EntityCaches:
+    """Return the entity caches bound to a client, creating them on first use.
+
+    Caches live as long as the client, so pooled account clients keep their entities
+    across requests and an evicted account drops its cache with the client.
+    """
+    entity_caches = _client_entity_caches.get(client)
+    if entity_caches is None:
+        entity_caches = EntityCaches(
+            orders=EntityCache(ttl_seconds=ttl_seconds, max_entries=max_entries),
+            agreements=EntityCache(ttl_seconds=ttl_seconds, max_entries=max_entries),
+        )
+        _client_entity_caches[client] = entity_caches
+    return entity_caches
+
+
+def _revision(entity: object) -> int:
+    revision = getattr(entity, "revision", None)
+    return -1 if revision is None else revision
@@ -0,0 +1,65 @@
+from dataclasses import dataclass
+from importlib.util import find_spec
+from typing import Self
+
+from httpx import AsyncHTTPTransport, Limits, Timeout
+
+from mpt_extension_sdk.errors.runtime import ConfigError
+from mpt_extension_sdk.settings.runtime import (
+    DEFAULT_HTTP_CONNECT_TIMEOUT_SECONDS,
+    DEFAULT_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    DEFAULT_HTTP_MAX_CONNECTIONS,
+    DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    DEFAULT_HTTP_READ_TIMEOUT_SECONDS,
+    RuntimeSettings,
+)
+
+
+@dataclass(frozen=True)
+class HTTPClientSettings:
+    """Connection pool, timeout and protocol settings of the SDK HTTP clients.
+
+    The read timeout also bounds writes and the wait for a pooled connection, so a
+    saturated pool fails a request instead of holding its task indefinitely.
+    """
+
+    max_connections: int = DEFAULT_HTTP_MAX_CONNECTIONS
+    max_keepalive_connections: int = DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS
+    keepalive_expiry_seconds: float = DEFAULT_HTTP_KEEPALIVE_EXPIRY_SECONDS
+    connect_timeout_seconds: float = DEFAULT_HTTP_CONNECT_TIMEOUT_SECONDS
+    read_timeout_seconds: float = DEFAULT_HTTP_READ_TIMEOUT_SECONDS
+    http2: bool = False
+
+    @classmethod
+    def from_runtime_settings(cls, runtime_settings: RuntimeSettings) -> Self:
+        """Build the settings from the `SDK_HTTP_*` runtime settings."""
+        return cls(
+            max_connections=runtime_settings.http_max_connections,
+            max_keepalive_connections=runtime_settings.http_max_keepalive_connections,
+            keepalive_expiry_seconds=runtime_settings.http_keepalive_expiry_seconds,
+            connect_timeout_seconds=runtime_settings.http_connect_timeout_seconds,
+            read_timeout_seconds=runtime_settings.http_read_timeout_seconds,
+            http2=runtime_settings.http2_enabled,
+        )
+
+    @property
+    def timeout(self) -> Timeout:
+        """Timeout applied to every request of a client."""
+        return Timeout(self.read_timeout_seconds, connect=self.connect_timeout_seconds)
+
+    def build_transport(self) -> AsyncHTTPTransport:
+        """Build a connection pool with these limits.
+
+        Raises:
+            ConfigError: If HTTP/2 is enabled but the `h2` package is not installed.
+        """
+        if self.http2 and find_spec("h2") is None:
+            raise ConfigError(
+                "HTTP/2 is enabled, but the h2 package is not installed; install httpx[http2]"
+            )
+        limits = Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry_seconds,
+        )
+        return AsyncHTTPTransport(limits=limits, http2=self.http2)
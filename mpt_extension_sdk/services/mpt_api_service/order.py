@@ -1,43 +1,71 @@
 import logging
 from collections.abc import Mapping
+from functools import partial
+from types import MappingProxyType
 from typing import Any
 
 from mpt_extension_sdk.models import Order
 from mpt_extension_sdk.models.base import BaseModel
 from mpt_extension_sdk.services.mpt_api_service.base import BaseService
+from mpt_extension_sdk.services.mpt_api_service.projection import ProjectionProfile
 
 logger = logging.getLogger(__name__)
 
+ORDER_SELECT = (
+    "agreement",
+    "agreement.authorizations",
+    "agreement.client",
+    "agreement.licensee",
+    "agreement.lines",
+    "agreement.parameters",
+    "assets",
+    "authorization",
+    "externalIds",
+    "lines",
+    "lines.asset",
+    "lines.subscription",
+    "parameters",
+    "product",
+    "seller",
+    "subscriptions",
+    "template",
+)
+# Relations the Order model cannot be validated without.
+ORDER_REQUIRED_SELECT = (
+    "agreement",
+    "agreement.client",
+    "agreement.licensee",
+    "authorization",
+    "product",
+)
+ORDER_SELECTS: Mapping[ProjectionProfile, tuple[str, ...]] = MappingProxyType({
+    ProjectionProfile.MINIMAL: ORDER_REQUIRED_SELECT,
+    ProjectionProfile.PARAMETERS: (*ORDER_REQUIRED_SELECT, "parameters"),
+    ProjectionProfile.FULL: ORDER_SELECT,
+})
+
 
 class OrderService(BaseService[Order]):
     """Order service."""
 
-    async def get_by_id(self, order_id: str) -> Order:
-        """Fetch an order from Marketplace API."""
-        order = await self._client.commerce.orders.get(
-            order_id,
-            select=[
-                "agreement",
-                "agreement.authorizations",
-                "agreement.client",
-                "agreement.licensee",
-                "agreement.lines",
-                "agreement.parameters",
-                "assets",
-                "authorization",
-                "externalIds",
-                "lines",
-                "lines.asset",
-                "lines.subscription",
-                "parameters",
-                "product",
-                "seller",
-                "subscriptions",
-                "template",
-            ],
-        )
-        logger.debug("Fetched order %s: %s", order_id, order.to_dict())
-        return Order.from_payload(order)
+    async def get_by_id(
+        self,
+        order_id: str,
+        projection: ProjectionProfile = ProjectionProfile.FULL,
+        *,
+        refresh: bool = False,
+    ) -> Order:
+        """Fetch an order from Marketplace API, or from the entity cache when enabled.
+
+        The entity cache and batched reads hold full orders, so narrower projections
+        are always fetched with their own request. With `refresh`, the cached order is
+        dropped and fetched again, which picks up writes made through other services.
+        """
+        if refresh:
+            self._invalidate(order_id)
+        if projection is not ProjectionProfile.FULL:
+            return await self._fetch_by_id(order_id, projection)
+        return await self._load_by_id(order_id, self._fetch_by_id)
 
     async def complete(
         self,
@@ -49,14 +77,17 @@ class OrderService(BaseService[Order]):
         payload = {} if attributes is None else self._serialize_attributes(attributes)
         payload["template"] = self._serialize_attributes(template)
         await self._client.commerce.orders.complete(order_id, payload)
+        self._invalidate(order_id)
 
     async def update(self, order_id: str, attributes: Mapping[str, Any] | BaseModel) -> None:
         """Update an order."""
         await self._client.commerce.orders.update(order_id, self._serialize_attributes(attributes))
+        self._invalidate(order_id)
 
     async def query(self, order_id: str, attributes: Mapping[str, Any] | BaseModel) -> None:
         """Switch an order to query with explicit attributes."""
         await self._client.commerce.orders.query(order_id, self._serialize_attributes(attributes))
+        self._invalidate(order_id)
 
     async def fail(
         self,
@@ -68,3 +99,16 @@ class OrderService(BaseService[Order]):
         payload = {} if attributes is None else self._serialize_attributes(attributes)
         payload["statusNotes"] = status_notes
         await self._client.commerce.orders.fail(order_id, payload)
+        self._invalidate(order_id)
+
+    async def _fetch_by_id(
+        self, order_id: str, projection: ProjectionProfile = ProjectionProfile.FULL
+    ) -> Order:
+        """Fetch an order with the expansions of a projection from Marketplace API."""
+        select = ORDER_SELECTS[projection]
+        order = await self._coalesced_read(
+            ("commerce.orders", order_id, *select),
+            partial(self._client.commerce.orders.get, order_id, select=list(select)),
+        )
+        logger.debug("Fetched order %s: %s", order_id, order.to_dict())
+        return Order.from_payload(order)
@@ -1,9 +1,12 @@
+from functools import partial
+
 from mpt_api_client import RQLQuery
 
 from mpt_extension_sdk.models import Product, ProductItem
-from mpt_extension_sdk.services.mpt_api_service.base import BaseService
-
-_MAX_PAGE_SIZE = 100
+from mpt_extension_sdk.services.mpt_api_service.base import (
+    DEFAULT_CHUNK_CONCURRENCY,
+    BaseService,
+)
 
 
 class ProductService(BaseService[Product]):
@@ -14,23 +17,36 @@ class ProductItemService(BaseService[ProductItem]):
     """Product item service."""
 
     async def get_product_one_time_items_by_ids(
-        self, product_id: str, item_ids: list[str]
+        self,
+        product_id: str,
+        item_ids: list[str],
+        *,
+        concurrency: int = DEFAULT_CHUNK_CONCURRENCY,
     ) -> list[ProductItem]:
-        """Fetch one-time items by product and item identifiers."""
+        """Fetch one-time items by product and item identifiers.
+
+        Item IDs are requested in chunks of 100 with up to `concurrency` chunks in
+        flight; a `PartialFetchError` reports the chunks that failed, and the original
+        API error is raised when every chunk failed.
+        """
         if not item_ids:
             return []
-        resources: list[ProductItem] = []
-        for start in range(0, len(item_ids), _MAX_PAGE_SIZE):
-            chunk_ids = item_ids[start : start + _MAX_PAGE_SIZE]
-            chunk_query = (
-                RQLQuery(product__id=product_id)
-                & RQLQuery().id.in_(chunk_ids)  # type: ignore[arg-type]
-                & RQLQuery().n("terms.period").eq("one-time")
-            )
-            page = await self._paginate(  # noqa: WPS476
-                self._client.catalog.items.filter(chunk_query),
-                ProductItem,
-                limit=len(chunk_ids),
-            )
-            resources.extend(page.resources)
-        return resources
+        return await self._fetch_in_chunks(
+            item_ids, partial(self._fetch_one_time_items, product_id), concurrency=concurrency
+        )
+
+    async def _fetch_one_time_items(
+        self, product_id: str, item_ids: list[str]
+    ) -> list[ProductItem]:
+        """Fetch one chunk of one-time items of a product."""
+        chunk_query = (
+            RQLQuery(product__id=product_id)
+            & RQLQuery().id.in_(item_ids)  # type: ignore[arg-type]
+            & RQLQuery().n("terms.period").eq("one-time")
+        )
+        page = await self._paginate(
+            self._client.catalog.items.filter(chunk_query),
+            ProductItem,
+            limit=len(item_ids),
+        )
+        return page.resources
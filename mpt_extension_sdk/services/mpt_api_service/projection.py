@@ -0,0 +1,13 @@
+from enum import StrEnum
+
+
+class ProjectionProfile(StrEnum):
+    """Named sets of relations expanded when an order or agreement is fetched.
+
+    `MINIMAL` expands only the relations the SDK models require, `PARAMETERS` adds
+    the object parameters, and `FULL` expands the whole graph handlers get by default.
+    """
+
+    MINIMAL = "minimal"
+    PARAMETERS = "parameters"  # noqa: WPS110
+    FULL = "full"
@@ -0,0 +1,171 @@
+import asyncio
+import datetime as dt
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import override
+
+from httpx import AsyncBaseTransport, Request, Response, codes
+
+from mpt_extension_sdk.settings.runtime import RuntimeSettings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RETRY_AFTER_SECONDS = 1.0
+MAX_RETRY_AFTER_SECONDS = 120.0
+
+Clock = Callable[[], float]
+Sleep = Callable[[float], Awaitable[None]]
+
+
+@dataclass
+class ThrottlingStats:
+    """Throttling counters of a rate limiter or of the whole process."""
+
+    requests: int = 0
+    delayed_requests: int = 0
+    delay_seconds: float = 0
+    throttled_responses: int = 0
+
+
+class RateLimiter:
+    """Client-side limiter shared by the requests of one Marketplace account.
+
+    With `requests_per_second` set, requests take a token from a bucket refilled at
+    that rate and holding up to `burst` tokens, and wait when it is empty. A 429
+    response pauses every request of the limiter until its `Retry-After` elapses,
+    so concurrent requests stop hitting the API instead of each getting throttled.
+    """
+
+    def __init__(
+        self,
+        *,
+        requests_per_second: float | None = None,
+        burst: int | None = None,
+        clock: Clock = time.monotonic,
+        sleep: Sleep = asyncio.sleep,
+    ) -> None:
+        if requests_per_second is not None and requests_per_second <= 0:
+            raise ValueError("requests_per_second must be greater than 0")
+        if burst is not None and burst <= 0:
+            raise ValueError("burst must be greater than 0")
+        self._rate = requests_per_second
+        self._capacity = float(burst or requests_per_second or 1)
+        self._tokens = self._capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated_at = clock()
+        self._blocked_until: float = 0
+        self.stats = ThrottlingStats()
+
+    async def acquire(self) -> None:
+        """Wait until the request may be sent."""
+        delay = self._reserve()
+        _record_request(self.stats, delay)
+        _record_request(get_throttling_stats(), delay)
+        if delay > 0:
+            await self._sleep(delay)
+
+    def block_for(self, seconds: float) -> None:
+        """Pause every request of the limiter for `seconds` after a 429 response."""
+        self._blocked_until = max(self._blocked_until, self._clock() + seconds)
+        self.stats.throttled_responses += 1
+        get_throttling_stats().throttled_responses += 1
+
+    def _reserve(self) -> float:
+        """Take a token, possibly ahead of time, and return how long to wait for it."""
+        now = self._clock()
+        delay = max(self._blocked_until - now, 0)
+        if self._rate is None:
+            return delay
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        refilled = self._tokens + elapsed * self._rate
+        self._tokens = min(self._capacity, refilled) - 1
+        return max(delay, -self._tokens / self._rate)
+
+
+class RateLimitTransport(AsyncBaseTransport):
+    """Transport that sends requests through a rate limiter and honours 429s."""
+
+    def __init__(self, transport: AsyncBaseTransport, rate_limiter: RateLimiter) -> None:
+        self._transport = transport
+        self._rate_limiter = rate_limiter
+
+    @override
+    async def handle_async_request(self, request: Request) -> Response:
+        """Wait for the limiter, send the request and record throttled responses."""
+        await self._rate_limiter.acquire()
+        response = await self._transport.handle_async_request(request)
+        if response.status_code == codes.TOO_MANY_REQUESTS:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            logger.warning(
+                "Marketplace API throttled %s %s; pausing for %.1fs",
+                request.method,
+                request.url.path,
+                retry_after,
+            )
+            self._rate_limiter.block_for(retry_after)
+        return response
+
+    @override
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self._transport.aclose()
+
+
+def parse_retry_after(header_value: str | None) -> float:
+    """Return the delay requested by a `Retry-After` header, in seconds.
+
+    Accepts delta-seconds and HTTP dates, falls back to one second when the header
+    is missing or invalid, and caps the delay at `MAX_RETRY_AFTER_SECONDS`.
+    """
+    if not header_value:
+        return DEFAULT_RETRY_AFTER_SECONDS
+    try:
+        seconds = float(header_value)
+    except ValueError:
+        seconds = _seconds_until_http_date(header_value)
+    return min(max(seconds, 0), MAX_RETRY_AFTER_SECONDS)
+
+
+def get_extension_rate_limiter(runtime_settings: RuntimeSettings) -> RateLimiter:
+    """Return the process-wide limiter of the clients using the extension token.
+
+    Those clients act as one principal, so they share one bucket and one 429 pause.
+    """
+    return _get_rate_limiter(
+        runtime_settings.rate_limit_requests_per_second or None,
+        runtime_settings.rate_limit_burst or None,
+    )
+
+
+@lru_cache
+def get_throttling_stats() -> ThrottlingStats:
+    """Return the process-wide throttling counters of every rate limiter."""
+    return ThrottlingStats()
+
+
+@lru_cache
+def _get_rate_limiter(requests_per_second: float | None, burst: int | None) -> RateLimiter:
+    return RateLimiter(requests_per_second=requests_per_second, burst=burst)
+
+
+def _record_request(stats: ThrottlingStats, delay: float) -> None:
+    stats.requests += 1
+    if delay > 0:
+        stats.delayed_requests += 1
+        stats.delay_seconds += delay
+
+
+def _seconds_until_http_date(header_value: str) -> float:
+    try:
+        retry_at = parsedate_to_datetime(header_value)
+    except (TypeError, ValueError):
+        return DEFAULT_RETRY_AFTER_SECONDS
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=dt.UTC)
+    return (retry_at - dt.datetime.now(dt.UTC)).total_seconds()
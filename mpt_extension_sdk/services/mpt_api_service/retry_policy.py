@@ -0,0 +1,190 @@
+import asyncio
+import re
+import secrets
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from http import HTTPMethod, HTTPStatus
+from typing import override
+
+from httpx import (
+    AsyncBaseTransport,
+    ConnectError,
+    ConnectTimeout,
+    NetworkError,
+    RemoteProtocolError,
+    Request,
+    Response,
+    TimeoutException,
+)
+
+from mpt_extension_sdk.observability.tracing import TRACER, set_attributes
+from mpt_extension_sdk.services.mpt_api_service.rate_limit import parse_retry_after
+from mpt_extension_sdk.settings.runtime import (
+    DEFAULT_HTTP_RETRY_MAX_ATTEMPTS,
+    DEFAULT_HTTP_RETRY_MAX_ELAPSED_SECONDS,
+    RuntimeSettings,
+)
+
+DEFAULT_BASE_DELAY_SECONDS = 0.2
+DEFAULT_MAX_DELAY_SECONDS = 5.0
+
+IDEMPOTENT_METHODS = frozenset((HTTPMethod.GET, HTTPMethod.HEAD, HTTPMethod.OPTIONS))
+TRANSIENT_STATUSES = frozenset((
+    HTTPStatus.BAD_GATEWAY,
+    HTTPStatus.SERVICE_UNAVAILABLE,
+    HTTPStatus.GATEWAY_TIMEOUT,
+))
+TRANSIENT_ERRORS = (TimeoutException, NetworkError, RemoteProtocolError)
+# Errors raised before the request reached the server, so any method may be resent.
+UNSENT_ERRORS = (ConnectError, ConnectTimeout)
+# Task transitions end in the same state when repeated, so they are safe to resend.
+# Starting a task is not: a resent start may find the task already processing.
+# Searched rather than fully matched, so a base URL with a path prefix still matches.
+SAFE_TASK_TRANSITION = re.compile(r"/public/v1/system/tasks/[^/]+/(complete|fail|reschedule)$")
+
+Clock = Callable[[], float]
+Sleep = Callable[[float], Awaitable[None]]
+Jitter = Callable[[float, float], float]
+JITTER: Jitter = secrets.SystemRandom().uniform
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Retry policy with jittered exponential backoff and an elapsed-time budget.
+
+    Idempotent reads and task transitions are retried on 502, 503, 504 and network
+    errors. Any request is retried on 429, after its `Retry-After`, and on errors
+    raised before it was sent. The delay before retry `n` is drawn uniformly from
+    `[0, min(max_delay_seconds, base_delay_seconds * 2 ** n)]`.
+    """
+
+    max_attempts: int = DEFAULT_HTTP_RETRY_MAX_ATTEMPTS
+    max_elapsed_seconds: float = DEFAULT_HTTP_RETRY_MAX_ELAPSED_SECONDS
+    base_delay_seconds: float = DEFAULT_BASE_DELAY_SECONDS
+    max_delay_seconds: float = DEFAULT_MAX_DELAY_SECONDS
+
+    @classmethod
+    def from_runtime_settings(cls, runtime_settings: RuntimeSettings) -> "RetryPolicy | None":
+        """Return the configured policy, or None when retries are not enabled."""
+        if not runtime_settings.http_retry_enabled:
+            return None
+        return cls(
+            max_attempts=runtime_settings.http_retry_max_attempts,
+            max_elapsed_seconds=runtime_settings.http_retry_max_elapsed_seconds,
+        )
+
+    def is_safe_to_resend(self, request: Request) -> bool:
+        """Whether resending the request cannot apply its effect twice."""
+        if request.method in IDEMPOTENT_METHODS:
+            return True
+        return request.method == HTTPMethod.POST and bool(
+            SAFE_TASK_TRANSITION.search(request.url.path)
+        )
+
+    def backoff_seconds(self, retry_number: int, jitter: Jitter = JITTER) -> float:
+        """Return the jittered delay before the given retry, starting at 0."""
+        ceiling = min(self.max_delay_seconds, self.base_delay_seconds * 2**retry_number)
+        return jitter(0, ceiling)
+
+
+class BackoffRetryTransport(AsyncBaseTransport):
+    """Transport that resends transient failures according to a retry policy.
+
+    Every attempt runs in its own span carrying the attempt number, the delay that
+    preceded it and its outcome, so retried requests are visible in traces.
+    """
+
+    def __init__(
+        self,
+        transport: AsyncBaseTransport,
+        policy: RetryPolicy,
+        *,
+        clock: Clock = time.monotonic,
+        sleep: Sleep = asyncio.sleep,
+        jitter: Jitter = JITTER,
+    ) -> None:
+        self._transport = transport
+        self._policy = policy
+        self._clock = clock
+        self._sleep = sleep
+        self._jitter = jitter
+
+    @override
+    async def handle_async_request(self, request: Request) -> Response:
+        """Send the request, retrying it while the policy and budget allow."""
+        started_at = self._clock()
+        delay: float = 0
+        attempt = 0
+        while True:
+            outcome = await self._send_attempt(request, attempt, delay)
+            next_delay = self._next_delay(request, attempt, started_at, outcome)
+            if next_delay is None:
+                return _unwrap(outcome)
+            if isinstance(outcome, Response):
+                await outcome.aclose()
+            delay = next_delay
+            await self._sleep(delay)  # noqa: WPS476
+            attempt += 1
+
+    @override
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self._transport.aclose()
+
+    async def _send_attempt(
+        self, request: Request, attempt: int, delay: float
+    ) -> Response | Exception:
+        """Send one attempt in its own span and return its response or transient error."""
+        with TRACER.start_as_current_span(f"HTTP {request.method} attempt") as span:
+            set_attributes(
+                span,
+                {
+                    "http.request.method": request.method,
+                    "url.path": request.url.path,
+                    "http.request.resend_count": attempt,
+                    "mpt.retry.delay_seconds": delay,
+                },
+            )
+            try:
+                response = await self._transport.handle_async_request(request)
+            except TRANSIENT_ERRORS as error:
+                set_attributes(span, {"error.type": type(error).__name__})
+                return error
+            set_attributes(span, {"http.response.status_code": response.status_code})
+            return response
+
+    def _next_delay(
+        self,
+        request: Request,
+        attempt: int,
+        started_at: float,
+        outcome: Response | Exception,
+    ) -> float | None:
+        """Return the delay before the next attempt, or None when it must not be retried."""
+        if attempt + 1 >= self._policy.max_attempts:
+            return None
+        if not self._is_retryable(request, outcome):
+            return None
+        delay = self._policy.backoff_seconds(attempt, self._jitter)
+        if isinstance(outcome, Response) and outcome.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+            delay = max(delay, parse_retry_after(outcome.headers.get("Retry-After")))
+        elapsed = self._clock() - started_at
+        if elapsed + delay > self._policy.max_elapsed_seconds:
+            return None
+        return delay
+
+    def _is_retryable(self, request: Request, outcome: Response | Exception) -> bool:
+        if isinstance(outcome, UNSENT_ERRORS):
+            return True
+        if isinstance(outcome, Response) and outcome.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+            return True
+        if not self._policy.is_safe_to_resend(request):
+            return False
+        return isinstance(outcome, Exception) or outcome.status_code in TRANSIENT_STATUSES
+
+
+def _unwrap(outcome: Response | Exception) -> Response:
+    if isinstance(outcome, Exception):
+        raise outcome
+    return outcome
@@ -0,0 +1,41 @@
+import asyncio
+from collections.abc import Callable, Coroutine, Hashable
+from functools import lru_cache
+from typing import Any
+
+type ReadCall[Result] = Callable[[], Coroutine[Any, Any, Result]]
+
+
+class SingleFlight[Result]:
+    """Share one in-flight call between concurrent callers using the same key.
+
+    The first caller starts the call and later callers with the same key await the
+    same task until it completes; the key is released as soon as it does. The call
+    is shielded, so a cancelled caller does not cancel the read for the others.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: dict[Hashable, asyncio.Task[Result]] = {}
+
+    def __len__(self) -> int:
+        return len(self._in_flight)
+
+    async def run(self, key: Hashable, call: ReadCall[Result]) -> Result:
+        """Await the in-flight call for a key, starting it when none is running.
+
+        Args:
+            key: Identifies identical calls, e.g. client, endpoint, id and query.
+            call: Starts the call when no identical call is in flight.
+        """
+        in_flight = self._in_flight.get(key)
+        if in_flight is None:
+            in_flight = asyncio.create_task(call())
+            self._in_flight[key] = in_flight
+            in_flight.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return await asyncio.shield(in_flight)
+
+
+@lru_cache
+def get_read_single_flight() -> SingleFlight[Any]:
+    """Return the process-wide single-flight group for coalesced service reads."""
+    return SingleFlight()
@@ -1,14 +1,35 @@
-from collections.abc import Mapping
-from typing import Any
+from collections.abc import AsyncIterator, Mapping
+from functools import partial
+from typing import Any, override
 
-from mpt_extension_sdk.models import Subscription
+from mpt_api_client import RQLQuery
+
+from mpt_extension_sdk.models import Order, Subscription
 from mpt_extension_sdk.models.base import BaseModel
-from mpt_extension_sdk.services.mpt_api_service.base import BaseService
+from mpt_extension_sdk.services.api_client_v2.mpt_api_client import AsyncMPTClient
+from mpt_extension_sdk.services.mpt_api_service.base import (
+    DEFAULT_PREFETCH_PAGES,
+    BatchedReadService,
+    PaginatedCollection,
+)
+from mpt_extension_sdk.services.mpt_api_service.entity_cache import EntityCache
 
 
-class SubscriptionService(BaseService[Subscription]):
+class SubscriptionService(BatchedReadService[Subscription]):  # noqa: WPS214
     """Subscription service."""
 
+    def __init__(
+        self,
+        client: AsyncMPTClient,
+        *,
+        coalesce_reads: bool = False,
+        batch_reads: bool = False,
+        order_cache: EntityCache[Order] | None = None,
+    ) -> None:
+        """Initialize the service with the order cache its order writes invalidate."""
+        super().__init__(client, coalesce_reads=coalesce_reads, batch_reads=batch_reads)
+        self._order_cache = order_cache
+
     async def create(self, subscription: Mapping[str, Any] | BaseModel) -> Subscription:
         """Create a subscription."""
         return Subscription.from_payload(
@@ -20,21 +41,68 @@ class SubscriptionService(BaseService[Subscription]):
     async def create_order_subscription(
         self, order_id: str, subscription: Mapping[str, Any] | BaseModel
     ) -> Subscription:
-        """Create a subscription inside an order."""
-        return Subscription.from_payload(
-            await self._client.commerce.orders.subscriptions(order_id).create(
-                self._serialize_attributes(subscription)
-            )
+        """Create a subscription inside an order and drop the cached order."""
+        created = await self._client.commerce.orders.subscriptions(order_id).create(
+            self._serialize_attributes(subscription)
+        )
+        if self._order_cache is not None:
+            self._order_cache.invalidate(order_id)
+        return Subscription.from_payload(created)
+
+    async def get_all(
+        self, offset: int = 0, limit: int = 100, rql_filter: RQLQuery | None = None
+    ) -> PaginatedCollection[Subscription]:
+        """Fetch a page of subscriptions, optionally filtered by an RQL query."""
+        collection = self._client.commerce.subscriptions
+        if rql_filter is not None:
+            collection = collection.filter(rql_filter)
+        return await self._paginate(collection, Subscription, offset=offset, limit=limit)
+
+    def iter_all(
+        self,
+        rql_filter: RQLQuery | None = None,
+        *,
+        page_size: int = 100,
+        prefetch_pages: int = DEFAULT_PREFETCH_PAGES,
+        ordered: bool = True,
+    ) -> AsyncIterator[Subscription]:
+        """Stream all subscriptions, fetching the next pages while the current one is consumed.
+
+        Args:
+            rql_filter: Optional RQL query applied to the subscriptions collection.
+            page_size: Number of subscriptions requested per page.
+            prefetch_pages: Maximum number of page requests in flight.
+            ordered: Yield subscriptions in collection order instead of page arrival order.
+        """
+        return self._iterate(
+            partial(self.get_all, rql_filter=rql_filter),
+            page_size=page_size,
+            prefetch_pages=prefetch_pages,
+            ordered=ordered,
         )
 
     async def get_by_id(self, subscription_id: str) -> Subscription:
         """Fetch a subscription by ID."""
-        return Subscription.from_payload(
-            await self._client.commerce.subscriptions.get(subscription_id)
-        )
+        return await self._load_by_id(subscription_id, self._fetch_by_id)
 
     async def update(self, subscription_id: str, attributes: Mapping[str, Any] | BaseModel) -> None:
         """Update a subscription."""
         await self._client.commerce.subscriptions.update(
             subscription_id, self._serialize_attributes(attributes)
         )
+
+    @override
+    async def _fetch_many(self, entity_ids: list[str]) -> list[Subscription]:
+        """Fetch subscriptions by ID in one request."""
+        return await self._fetch_by_ids(
+            self._client.commerce.subscriptions, Subscription, entity_ids
+        )
+
+    async def _fetch_by_id(self, subscription_id: str) -> Subscription:
+        """Fetch one subscription from Marketplace API."""
+        return Subscription.from_payload(
+            await self._coalesced_read(
+                ("commerce.subscriptions", subscription_id),
+                partial(self._client.commerce.subscriptions.get, subscription_id),
+            )
+        )
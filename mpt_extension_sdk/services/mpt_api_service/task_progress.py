@@ -0,0 +1,102 @@
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from typing import Self
+
+from mpt_extension_sdk.services.mpt_api_service.task import TaskService
+from mpt_extension_sdk.settings.runtime import DEFAULT_TASK_PROGRESS_INTERVAL_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+class TaskProgressReporter:  # noqa: WPS214
+    """Throttled, coalescing progress reporter of one platform task.
+
+    `report` only records the latest value and returns immediately; a background
+    task sends it with at most one update per interval, and values reported while
+    an update waits are coalesced into the most recent one. Failed updates are
+    logged and never reach the handler. Leaving the reporter as an async context
+    manager flushes it; while it is entered, synchronous handlers running in the
+    sync executor may report from their worker thread.
+    """
+
+    def __init__(
+        self,
+        task_service: TaskService,
+        task_id: str,
+        *,
+        interval_seconds: float = DEFAULT_TASK_PROGRESS_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._task_service = task_service
+        self._task_id = task_id
+        self._interval_seconds = interval_seconds
+        self._clock = clock
+        self._pending: float | None = None
+        self._last_sent_at: float | None = None
+        self._flush_requested = asyncio.Event()
+        self._sender: asyncio.Task[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    async def __aenter__(self) -> Self:
+        self._loop = asyncio.get_running_loop()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.flush()
+
+    def report(self, progress: float) -> None:
+        """Record the latest task progress without waiting for the update."""
+        if self._loop is not None and not self._is_loop_thread():
+            self._loop.call_soon_threadsafe(self.report, progress)
+            return
+        self._pending = progress
+        if self._sender is None or self._sender.done():
+            self._sender = asyncio.create_task(
+                self._send_updates(), name=f"mpt-task-progress-{self._task_id}"
+            )
+
+    async def flush(self) -> None:
+        """Send the latest reported progress now and wait until it is sent.
+
+        The SDK calls it before completing, failing or rescheduling the task.
+        """
+        sender = self._sender
+        if sender is None:
+            return
+        self._flush_requested.set()
+        await sender
+        self._flush_requested.clear()
+
+    async def _send_updates(self) -> None:
+        while self._pending is not None:
+            delay = self._next_update_delay()
+            if delay > 0 and not self._flush_requested.is_set():
+                try:
+                    await asyncio.wait_for(self._flush_requested.wait(), timeout=delay)
+                except TimeoutError:
+                    logger.debug("Progress interval elapsed for task %s", self._task_id)
+            await self._send_pending()
+
+    async def _send_pending(self) -> None:
+        progress = self._pending
+        if progress is None:
+            return
+        self._pending = None
+        self._last_sent_at = self._clock()
+        try:
+            await self._task_service.progress(self._task_id, progress)
+        except Exception:
+            logger.warning("Failed to update progress of task %s", self._task_id, exc_info=True)
+
+    def _is_loop_thread(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def _next_update_delay(self) -> float:
+        if self._last_sent_at is None:
+            return 0
+        return self._interval_seconds - (self._clock() - self._last_sent_at)
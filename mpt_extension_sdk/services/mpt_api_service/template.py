@@ -1,19 +1,58 @@
-from collections.abc import Mapping
+import logging
+from collections.abc import Iterable, Mapping
+from functools import lru_cache, partial
 
 from mpt_api_client import RQLQuery
 
-from mpt_extension_sdk.models import Template
+from mpt_extension_sdk.models import Order, Template
 from mpt_extension_sdk.models.base import BaseModel
+from mpt_extension_sdk.services.api_client_v2.mpt_api_client import AsyncMPTClient
 from mpt_extension_sdk.services.mpt_api_service.base import BaseService
+from mpt_extension_sdk.services.mpt_api_service.client_factory import build_extension_mpt_client
+from mpt_extension_sdk.services.mpt_api_service.entity_cache import EntityCache
+from mpt_extension_sdk.settings.extension import get_extension_settings
+from mpt_extension_sdk.settings.runtime import RuntimeSettings
 
+logger = logging.getLogger(__name__)
 
-class TemplateService(BaseService[Template]):
-    """Template service."""
+MAX_CACHED_PRODUCTS = 128
+
+type ProductTemplateCache = EntityCache[list[Template]]
+
+
+class TemplateService(BaseService[Template]):  # noqa: WPS214
+    """Template service.
+
+    With a product template cache, the template lookups read every template of a
+    product once per TTL and select the matching template locally.
+    """
+
+    def __init__(
+        self,
+        client: AsyncMPTClient,
+        *,
+        product_cache: ProductTemplateCache | None = None,
+        order_cache: EntityCache[Order] | None = None,
+    ) -> None:
+        """Initialize the service with optional product template and order caches."""
+        super().__init__(client)
+        self._product_cache = product_cache
+        self._order_cache = order_cache
 
     async def get_template(
         self, product_id: str, status: str, name: str | None = None
     ) -> Template | None:
         """Fetch the named template for a status or fall back to the default."""
+        if self._product_cache is not None:
+            candidates = [
+                template
+                for template in await self._get_product_templates(product_id)
+                if template.type == f"Order{status}"
+                and (template.default or (name and template.name == name))
+            ]
+            # Mirrors order_by("default"): a named template wins over the default one.
+            return min(candidates, key=lambda template: bool(template.default), default=None)
+
         type_filter = RQLQuery().type.eq(f"Order{status}")
         default_filter = RQLQuery(default=True)
         template_filter = type_filter & default_filter
@@ -35,6 +74,11 @@ class TemplateService(BaseService[Template]):
         self, product_id: str, template_name: str
     ) -> Template | None:
         """Fetch an asset template by its name."""
+        if self._product_cache is not None:
+            return _find_template(
+                await self._get_product_templates(product_id), "Asset", template_name
+            )
+
         query = RQLQuery(type="Asset") & RQLQuery(name=template_name)
         templates = (
             await self._client.catalog.products
@@ -46,6 +90,9 @@ class TemplateService(BaseService[Template]):
 
     async def get_order_querying_template(self, product_id: str) -> Template | None:
         """Fetch the order querying template."""
+        if self._product_cache is not None:
+            return _find_template(await self._get_product_templates(product_id), "OrderQuerying")
+
         query = RQLQuery(type="OrderQuerying") & RQLQuery(default=True)
         templates = (
             await self._client.catalog.products
@@ -58,6 +105,89 @@ class TemplateService(BaseService[Template]):
     async def set_order_template(
         self, order_id: str, template: Template | Mapping[str, object] | BaseModel
     ) -> None:
-        """Update the order template."""
+        """Update the order template and drop the cached order."""
         payload = {"template": self._serialize_attributes(template)}
         await self._client.commerce.orders.update(order_id, payload)
+        if self._order_cache is not None:
+            self._order_cache.invalidate(order_id)
+
+    async def warm_up(self, product_ids: Iterable[str]) -> None:
+        """Load the templates of the given products into the product template cache."""
+        if self._product_cache is None:
+            return
+        for product_id in product_ids:
+            try:
+                await self._get_product_templates(product_id)  # noqa: WPS476
+            except Exception:
+                logger.exception("Failed to warm up templates of product %s", product_id)
+
+    def invalidate_templates(self, product_id: str | None = None) -> None:
+        """Drop the cached templates of a product, or of every product."""
+        if self._product_cache is None:
+            return
+        if product_id is None:
+            self._product_cache.clear()
+        else:
+            self._product_cache.invalidate(product_id)
+
+    async def _get_product_templates(self, product_id: str) -> list[Template]:
+        """Return every template of a product through the product template cache."""
+        if self._product_cache is None:
+            return await self._fetch_product_templates(product_id)
+        return await self._product_cache.get_or_fetch(
+            product_id, partial(self._fetch_product_templates, product_id)
+        )
+
+    async def _fetch_product_templates(self, product_id: str) -> list[Template]:
+        """Fetch every template of a product from Marketplace API."""
+        collection = self._client.catalog.products.templates(product_id)
+        return [
+            template
+            async for template in self._iterate(partial(self._paginate, collection, Template))
+        ]
+
+
+@lru_cache
+def get_product_template_cache(ttl_seconds: int) -> ProductTemplateCache:
+    """Return the process-wide product template cache.
+
+    Templates are product catalog data, so one cache is shared by every client.
+    """
+    return EntityCache(ttl_seconds=ttl_seconds, max_entries=MAX_CACHED_PRODUCTS)
+
+
+def get_runtime_template_cache(runtime_settings: RuntimeSettings) -> ProductTemplateCache | None:
+    """Return the product template cache when the runtime settings enable it."""
+    if runtime_settings.template_cache_ttl_seconds <= 0:
+        return None
+    return get_product_template_cache(runtime_settings.template_cache_ttl_seconds)
+
+
+async def warm_up_template_cache(runtime_settings: RuntimeSettings) -> None:
+    """Load the templates of the extension products into the template cache.
+
+    Product ids are read from the `product_ids` of the extension settings, and the
+    templates are read with the extension token.
+    """
+    template_cache = get_runtime_template_cache(runtime_settings)
+    if template_cache is None:
+        return
+    product_ids = getattr(get_extension_settings(), "product_ids", None)
+    if not product_ids:
+        logger.warning("Skipping template cache warm-up: no product_ids in extension settings")
+        return
+    template_service = TemplateService(
+        build_extension_mpt_client(runtime_settings), product_cache=template_cache
+    )
+    await template_service.warm_up(product_ids)
+
+
+def _find_template(
+    templates: list[Template], template_type: str, name: str | None = None
+) -> Template | None:
+    """Return the first template of a type with the given name, or the default one."""
+    for template in templates:
+        matches = template.name == name if name else template.default
+        if template.type == template_type and matches:
+            return template
+    return None
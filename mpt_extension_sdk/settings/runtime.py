@@ -1,7 +1,7 @@
 import os
 import socket
 import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import lru_cache
 from importlib import import_module
 from pathlib import Path
@@ -12,10 +12,22 @@ from mpt_extension_sdk.runtime.models import MetaConfig
 from mpt_extension_sdk.settings.base import BaseSettings
 
 DEFAULT_LOCAL_PORT = 8080
+DEFAULT_ENTITY_CACHE_MAX_ENTRIES = 256
+DEFAULT_HTTP_RETRY_MAX_ATTEMPTS = 4
+DEFAULT_HTTP_RETRY_MAX_ELAPSED_SECONDS = 15
+DEFAULT_HTTP_MAX_CONNECTIONS = 100
+DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_HTTP_KEEPALIVE_EXPIRY_SECONDS = 5
+DEFAULT_HTTP_CONNECT_TIMEOUT_SECONDS = 5
+DEFAULT_HTTP_READ_TIMEOUT_SECONDS = 20
+DEFAULT_TASK_PROGRESS_INTERVAL_SECONDS = 5
+DEFAULT_SYNC_EXECUTOR_MAX_WORKERS = 16
+DEFAULT_PROCESS_EXECUTOR_MAX_WORKERS = 2
+ACCOUNT_TOKEN_EXPIRY_LEEWAY_SECONDS = 60
 
 
 @dataclass(frozen=True)
-class RuntimeSettings(BaseSettings):
+class RuntimeSettings(BaseSettings):  # noqa: WPS214
     """Runtime settings loaded exclusively from environment variables."""
 
     app_module: str
@@ -39,6 +51,35 @@ class RuntimeSettings(BaseSettings):
     otel_otlp_endpoint: str
     ziti_workers: int
     ziti_reload: bool
+    entity_cache_ttl_seconds: int = 0
+    entity_cache_max_entries: int = DEFAULT_ENTITY_CACHE_MAX_ENTRIES
+    coalesced_read_services: list[str] = field(default_factory=list)
+    batched_read_services: list[str] = field(default_factory=list)
+    template_cache_ttl_seconds: int = 0
+    template_cache_warmup: bool = False
+    token_refresh_ahead_seconds: int = 0
+    account_token_store_path: str = ""
+    rate_limit_requests_per_second: int = 0
+    rate_limit_burst: int = 0
+    http_retry_enabled: bool = False
+    http_retry_max_attempts: int = DEFAULT_HTTP_RETRY_MAX_ATTEMPTS
+    http_retry_max_elapsed_seconds: int = DEFAULT_HTTP_RETRY_MAX_ELAPSED_SECONDS
+    http_max_connections: int = DEFAULT_HTTP_MAX_CONNECTIONS
+    http_max_keepalive_connections: int = DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS
+    http_keepalive_expiry_seconds: int = DEFAULT_HTTP_KEEPALIVE_EXPIRY_SECONDS
+    http_connect_timeout_seconds: int = DEFAULT_HTTP_CONNECT_TIMEOUT_SECONDS
+    http_read_timeout_seconds: int = DEFAULT_HTTP_READ_TIMEOUT_SECONDS
+    http2_enabled: bool = False
+    task_progress_interval_seconds: int = DEFAULT_TASK_PROGRESS_INTERVAL_SECONDS
+    task_max_in_flight: int = 0
+    task_max_queued: int = 0
+    event_lanes_enabled: bool = False
+    event_lanes_merge_duplicates: bool = False
+    event_dedup_ttl_seconds: int = 0
+    event_dedup_store_path: str = ""
+    sync_executor_max_workers: int = DEFAULT_SYNC_EXECUTOR_MAX_WORKERS
+    process_executor_max_workers: int = DEFAULT_PROCESS_EXECUTOR_MAX_WORKERS
+    task_outbox_path: str = ""
 
     @property
     def extension_package(self) -> str:
@@ -87,6 +128,64 @@ class RuntimeSettings(BaseSettings):
             local_workers=cls.int_env("SDK_LOCAL_WORKERS", default=1),
             ziti_workers=cls.int_env("SDK_ZITI_WORKERS", default=4),
             ziti_reload=cls.bool_env("SDK_ZITI_RELOAD", default=False),
+            entity_cache_ttl_seconds=cls.int_env("SDK_ENTITY_CACHE_TTL_SECONDS", default=0),
+            entity_cache_max_entries=cls.int_env(
+                "SDK_ENTITY_CACHE_MAX_ENTRIES", default=DEFAULT_ENTITY_CACHE_MAX_ENTRIES
+            ),
+            coalesced_read_services=cls.list_env("SDK_COALESCED_READ_SERVICES"),
+            batched_read_services=cls.list_env("SDK_BATCHED_READ_SERVICES"),
+            template_cache_ttl_seconds=cls.int_env("SDK_TEMPLATE_CACHE_TTL_SECONDS", default=0),
+            template_cache_warmup=cls.bool_env("SDK_TEMPLATE_CACHE_WARMUP", default=False),
+            token_refresh_ahead_seconds=cls._load_token_refresh_ahead_seconds(),
+            account_token_store_path=os.getenv("SDK_ACCOUNT_TOKEN_STORE_PATH", ""),
+            rate_limit_requests_per_second=cls.int_env(
+                "SDK_RATE_LIMIT_REQUESTS_PER_SECOND", default=0
+            ),
+            rate_limit_burst=cls.int_env("SDK_RATE_LIMIT_BURST", default=0),
+            http_retry_enabled=cls.bool_env("SDK_HTTP_RETRY_ENABLED", default=False),
+            http_retry_max_attempts=cls.int_env(
+                "SDK_HTTP_RETRY_MAX_ATTEMPTS", default=DEFAULT_HTTP_RETRY_MAX_ATTEMPTS
+            ),
+            http_retry_max_elapsed_seconds=cls.int_env(
+                "SDK_HTTP_RETRY_MAX_ELAPSED_SECONDS",
+                default=DEFAULT_HTTP_RETRY_MAX_ELAPSED_SECONDS,
+            ),
+            http_max_connections=cls.int_env(
+                "SDK_HTTP_MAX_CONNECTIONS", default=DEFAULT_HTTP_MAX_CONNECTIONS
+            ),
+            http_max_keepalive_connections=cls.int_env(
+                "SDK_HTTP_MAX_KEEPALIVE_CONNECTIONS",
+                default=DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+            http_keepalive_expiry_seconds=cls.int_env(
+                "SDK_HTTP_KEEPALIVE_EXPIRY_SECONDS", default=DEFAULT_HTTP_KEEPALIVE_EXPIRY_SECONDS
+            ),
+            http_connect_timeout_seconds=cls.int_env(
+                "SDK_HTTP_CONNECT_TIMEOUT_SECONDS", default=DEFAULT_HTTP_CONNECT_TIMEOUT_SECONDS
+            ),
+            http_read_timeout_seconds=cls.int_env(
+                "SDK_HTTP_READ_TIMEOUT_SECONDS", default=DEFAULT_HTTP_READ_TIMEOUT_SECONDS
+            ),
+            http2_enabled=cls.bool_env("SDK_HTTP2_ENABLED", default=False),
+            task_progress_interval_seconds=cls.int_env(
+                "SDK_TASK_PROGRESS_INTERVAL_SECONDS",
+                default=DEFAULT_TASK_PROGRESS_INTERVAL_SECONDS,
+            ),
+            task_max_in_flight=cls.int_env("SDK_TASK_MAX_IN_FLIGHT", default=0),
+            task_max_queued=cls.int_env("SDK_TASK_MAX_QUEUED", default=0),
+            event_lanes_enabled=cls.bool_env("SDK_EVENT_LANES_ENABLED", default=False),
+            event_lanes_merge_duplicates=cls.bool_env(
+                "SDK_EVENT_LANES_MERGE_DUPLICATES", default=False
+            ),
+            event_dedup_ttl_seconds=cls.int_env("SDK_EVENT_DEDUP_TTL_SECONDS", default=0),
+            event_dedup_store_path=os.getenv("SDK_EVENT_DEDUP_STORE_PATH", ""),
+            sync_executor_max_workers=cls.int_env(
+                "SDK_SYNC_EXECUTOR_MAX_WORKERS", default=DEFAULT_SYNC_EXECUTOR_MAX_WORKERS
+            ),
+            process_executor_max_workers=cls.int_env(
+                "SDK_PROCESS_EXECUTOR_MAX_WORKERS", default=DEFAULT_PROCESS_EXECUTOR_MAX_WORKERS
+            ),
+            task_outbox_path=os.getenv("SDK_TASK_OUTBOX_PATH", ""),
         )
 
     @classmethod
@@ -99,6 +198,21 @@ class RuntimeSettings(BaseSettings):
         hostname = socket.gethostname().strip()
         return hostname or f"{uuid.getnode():012x}"  # noqa: WPS237
 
+    @classmethod
+    def _load_token_refresh_ahead_seconds(cls) -> int:
+        """Read the token refresh-ahead window, which must exceed the expiry leeway.
+
+        Cached account tokens are already renewed within the expiry leeway, so a
+        shorter window would never trigger a background refresh.
+        """
+        refresh_ahead_seconds = cls.int_env("SDK_TOKEN_REFRESH_AHEAD_SECONDS", default=0)
+        if 0 < refresh_ahead_seconds <= ACCOUNT_TOKEN_EXPIRY_LEEWAY_SECONDS:
+            raise ConfigError(
+                "SDK_TOKEN_REFRESH_AHEAD_SECONDS must be 0 or greater than "
+                f"{ACCOUNT_TOKEN_EXPIRY_LEEWAY_SECONDS}: {refresh_ahead_seconds}"
+            )
+        return refresh_ahead_seconds
+
     @classmethod
     def _resolve_identity_file_path(cls, external_id: str) -> Path:
         """Resolve the identity file path from env or the default runtime location."""
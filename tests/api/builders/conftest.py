@@ -0,0 +1,88 @@
+from collections.abc import Callable
+
+import pytest
+
+from mpt_extension_sdk import routing
+from mpt_extension_sdk.context import BaseContext
+from mpt_extension_sdk.runtime.object_lanes import ObjectLanes
+
+
+@pytest.fixture
+def mock_callable(mocker):
+    return mocker.Mock(spec=Callable)
+
+
+@pytest.fixture
+def fake_context(mocker, runtime_settings):
+    return mocker.Mock(spec=BaseContext, runtime_settings=runtime_settings)
+
+
+@pytest.fixture
+def make_event_route():
+    def factory(path, callback, *, delivery_mode):
+        return routing.EventRouteDefinition(
+            name=path,
+            path=path,
+            route_type=routing.RouteType.EVENT,
+            callback=callback,
+            event="OrderPurchased",
+            delivery_mode=delivery_mode,
+        )
+
+    return factory
+
+
+@pytest.fixture
+def object_lanes():
+    return ObjectLanes()
+
+
+@pytest.fixture
+def business_attributes():
+    return {"order.id": "ORD-001", "agreement.id": "AGR-001"}
+
+
+@pytest.fixture
+def get_business_attributes_mock(mocker, business_attributes):
+    return mocker.patch(
+        "mpt_extension_sdk.api.builders.event_handlers.get_business_attributes",
+        autospec=True,
+        return_value=business_attributes,
+    )
+
+
+@pytest.fixture
+def set_attributes_mock(mocker):
+    return mocker.patch(
+        "mpt_extension_sdk.api.builders.event_handlers.set_attributes", autospec=True
+    )
+
+
+@pytest.fixture
+def record_exception_mock(mocker):
+    return mocker.patch(
+        "mpt_extension_sdk.api.builders.event_handlers.record_exception", autospec=True
+    )
+
+
+@pytest.fixture
+def set_event_context_mock(mocker):
+    set_event_context = mocker.patch(
+        "mpt_extension_sdk.api.builders.event_handlers.set_event_context", autospec=True
+    )
+    mocker.patch("mpt_extension_sdk.api.builders.event.set_event_context", new=set_event_context)
+    return set_event_context
+
+
+@pytest.fixture
+def event_span(mocker):
+    return mocker.sentinel.span
+
+
+@pytest.fixture
+def start_event_span_mock(mocker, event_span):
+    start_event_span = mocker.patch(
+        "mpt_extension_sdk.api.builders.event_handlers.start_event_span", autospec=True
+    )
+    start_event_span.return_value.__enter__.return_value = event_span
+    return start_event_span
@@ -1,6 +1,11 @@
+import dataclasses
+
 import pytest
 
 from mpt_extension_sdk.api.builders import dependencies
+from mpt_extension_sdk.services.mpt_api_service.http_settings import HTTPClientSettings
+from mpt_extension_sdk.services.mpt_api_service.rate_limit import get_extension_rate_limiter
+from mpt_extension_sdk.services.mpt_api_service.retry_policy import RetryPolicy
 
 
 @pytest.fixture(autouse=True)
@@ -21,7 +26,11 @@ def test_get_tasks_service(mocker, runtime_settings):
 
     assert result is fake_api.tasks
     mock_mpt_api_service.from_config.assert_called_once_with(
-        base_url=runtime_settings.mpt_api_base_url, api_token=runtime_settings.ext_api_key
+        base_url=runtime_settings.mpt_api_base_url,
+        api_token=runtime_settings.ext_api_key,
+        retry_policy=None,
+        http_settings=HTTPClientSettings(),
+        rate_limiter=get_extension_rate_limiter(runtime_settings),
     )
 
 
@@ -37,3 +46,62 @@ def test_get_tasks_service_reuses_cached_client(mocker, runtime_settings):
 
     assert first is second
     mock_mpt_api_service.from_config.assert_called_once()
+
+
+def test_get_tasks_service_uses_retry_policy(mocker, runtime_settings):
+    mock_mpt_api_service = mocker.patch(
+        "mpt_extension_sdk.api.builders.dependencies.MPTAPIService", autospec=True
+    )
+    settings = dataclasses.replace(runtime_settings, http_retry_enabled=True)
+
+    dependencies.get_tasks_service(settings)  # act
+
+    mock_mpt_api_service.from_config.assert_called_once_with(
+        base_url=settings.mpt_api_base_url,
+        api_token=settings.ext_api_key,
+        retry_policy=RetryPolicy(),
+        http_settings=HTTPClientSettings(),
+        rate_limiter=get_extension_rate_limiter(settings),
+    )
+
+
+def test_get_task_transitions_returns_outbox(mocker):
+    request = mocker.Mock()
+
+    result = dependencies.get_task_transitions(request, mocker.Mock())
+
+    assert result is request.app.state.task_outbox
+
+
+def test_get_task_transitions_without_outbox(mocker):
+    request = mocker.Mock()
+    request.app.state.task_outbox = None
+    task_service = mocker.Mock()
+
+    result = dependencies.get_task_transitions(request, task_service)
+
+    assert result is task_service
+
+
+def test_get_async_task_runner(mocker):
+    request = mocker.Mock()
+
+    result = dependencies.get_async_task_runner(request)
+
+    assert result is request.app.state.async_task_runner
+
+
+def test_get_object_lanes(mocker):
+    request = mocker.Mock()
+
+    result = dependencies.get_object_lanes(request)
+
+    assert result is request.app.state.object_lanes
+
+
+def test_get_event_outcomes(mocker):
+    request = mocker.Mock()
+
+    result = dependencies.get_event_outcomes(request)
+
+    assert result is request.app.state.event_outcomes
@@ -1,7 +1,7 @@
+import asyncio
 import base64
 import json
-from collections.abc import Callable
-from unittest.mock import call
+from unittest.mock import ANY, call
 
 import pytest
 from fastapi import FastAPI
@@ -12,17 +12,12 @@ from mpt_extension_sdk.api.auth import AuthenticationError
 from mpt_extension_sdk.api.auth import constants as auth_constants
 from mpt_extension_sdk.api.builders import event as event_builder
 from mpt_extension_sdk.api.models.events import ResponseEnum
-from mpt_extension_sdk.context import BaseContext
 from mpt_extension_sdk.errors import pipeline as pipeline_errors
 from mpt_extension_sdk.extension_app import ExtensionApp
+from mpt_extension_sdk.services.mpt_api_service.projection import ProjectionProfile
 from mpt_extension_sdk.services.mpt_api_service.task import TaskService
 
 
-@pytest.fixture
-def mock_callable(mocker):
-    return mocker.Mock(spec=Callable)
-
-
 @pytest.fixture
 def auth_token():
     claims = {
@@ -77,6 +72,18 @@ def event_payload():
     }
 
 
+@pytest.fixture(autouse=True)
+def runtime_settings_mock(mocker, runtime_settings):
+    return mocker.patch(
+        "mpt_extension_sdk.api.builders.event_context.get_runtime_settings",
+        autospec=True,
+        return_value=mocker.Mock(
+            extension_id="EXT-001",
+            task_progress_interval_seconds=runtime_settings.task_progress_interval_seconds,
+        ),
+    )
+
+
 @pytest.fixture
 def app_instance():
     return ExtensionApp()
@@ -87,98 +94,96 @@ def fake_task_service(mocker):
     return mocker.AsyncMock(spec=TaskService)
 
 
-@pytest.fixture
-def fake_context(mocker):
-    return mocker.Mock(spec=BaseContext)
-
-
-@pytest.fixture
-def make_event_route():
-    def factory(path, callback, *, delivery_mode):
-        return routing.EventRouteDefinition(
-            name=path,
-            path=path,
-            route_type=routing.RouteType.EVENT,
-            callback=callback,
-            event="OrderPurchased",
-            delivery_mode=delivery_mode,
-        )
-
-    return factory
-
-
 @pytest.fixture
 def build_context_mock(mocker, fake_context):
     return mocker.patch(
-        "mpt_extension_sdk.api.builders.event.build_context",
+        "mpt_extension_sdk.api.builders.event_context.build_context",
         autospec=True,
         return_value=fake_context,
     )
 
 
 @pytest.fixture
-def business_attributes():
-    return {"order.id": "ORD-001", "agreement.id": "AGR-001"}
+def event_outcomes(mocker):
+    outcomes = mocker.Mock(spec=event_builder.EventOutcomes)
+    outcomes.replay.return_value = None
+    return outcomes
 
 
 @pytest.fixture
-def get_business_attributes_mock(mocker, business_attributes):
-    return mocker.patch(
-        "mpt_extension_sdk.api.builders.event.get_business_attributes",
-        autospec=True,
-        return_value=business_attributes,
-    )
-
-
-@pytest.fixture
-def set_attributes_mock(mocker):
-    return mocker.patch("mpt_extension_sdk.api.builders.event.set_attributes", autospec=True)
+def ok_payload():
+    return {"response": ResponseEnum.OK, "cancelReason": None, "delay": None}
 
 
 @pytest.fixture
-def record_exception_mock(mocker):
-    return mocker.patch("mpt_extension_sdk.api.builders.event.record_exception", autospec=True)
-
+def task_client(
+    build_context_mock,
+    get_business_attributes_mock,
+    set_attributes_mock,
+    record_exception_mock,
+    set_event_context_mock,
+    start_event_span_mock,
+    fake_task_service,
+    app_instance,
+    make_event_route,
+    object_lanes,
+    event_outcomes,
+):
+    def factory(mock_callable):
+        route = make_event_route(
+            "/test/task", mock_callable, delivery_mode=routing.EventDeliveryMode.TASK
+        )
+        router = event_builder.create_task_event_route(route, app_instance)
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[event_builder.get_object_lanes] = lambda: object_lanes
+        app.dependency_overrides[event_builder.get_event_outcomes] = lambda: event_outcomes
+        app.dependency_overrides[event_builder.get_tasks_service] = lambda: fake_task_service
+        app.dependency_overrides[event_builder.get_task_transitions] = lambda: fake_task_service
+        return TestClient(app, raise_server_exceptions=False)
 
-@pytest.fixture
-def set_event_context_mock(mocker):
-    return mocker.patch("mpt_extension_sdk.api.builders.event.set_event_context", autospec=True)
+    return factory
 
 
 @pytest.fixture
-def event_span(mocker):
-    return mocker.sentinel.span
+def task_event_client(task_client, mock_callable):
+    return task_client(mock_callable)
 
 
 @pytest.fixture
-def start_event_span_mock(mocker, event_span):
-    start_event_span = mocker.patch(
-        "mpt_extension_sdk.api.builders.event.start_event_span", autospec=True
-    )
-    start_event_span.return_value.__enter__.return_value = event_span
-    return start_event_span
+def task_runner(mocker):
+    runner = mocker.MagicMock(spec=["reserve", "saturation_delay", "submit"])
+    runner.reserve.return_value.__enter__.return_value = True
+    runner.saturation_delay.return_value = None
+    runner.submit.return_value = True
+    return runner
 
 
 @pytest.fixture
-def task_client(
+def background_task_client(
     build_context_mock,
-    get_business_attributes_mock,
-    set_attributes_mock,
-    record_exception_mock,
     set_event_context_mock,
-    start_event_span_mock,
     fake_task_service,
+    task_runner,
     app_instance,
     make_event_route,
+    object_lanes,
+    event_outcomes,
 ):
     def factory(mock_callable):
         route = make_event_route(
-            "/test/task", mock_callable, delivery_mode=routing.EventDeliveryMode.TASK
+            "/test/background",
+            mock_callable,
+            delivery_mode=routing.EventDeliveryMode.BACKGROUND_TASK,
         )
-        router = event_builder.create_task_event_route(route, app_instance)
+        router = event_builder.create_background_task_event_route(route, app_instance)
         app = FastAPI()
         app.include_router(router)
+        app.dependency_overrides[event_builder.get_object_lanes] = lambda: object_lanes
+        app.dependency_overrides[event_builder.get_event_outcomes] = lambda: event_outcomes
         app.dependency_overrides[event_builder.get_tasks_service] = lambda: fake_task_service
+        app.dependency_overrides[event_builder.get_task_transitions] = lambda: fake_task_service
+        app.dependency_overrides[event_builder.get_async_task_runner] = lambda: task_runner
         return TestClient(app, raise_server_exceptions=False)
 
     return factory
@@ -194,6 +199,8 @@ def event_client(
     start_event_span_mock,
     app_instance,
     make_event_route,
+    object_lanes,
+    event_outcomes,
 ):
     def factory(mock_callable):
         route = make_event_route(
@@ -202,6 +209,8 @@ def event_client(
         router = event_builder.create_non_task_event_route(route, app_instance)
         app = FastAPI()
         app.include_router(router)
+        app.dependency_overrides[event_builder.get_object_lanes] = lambda: object_lanes
+        app.dependency_overrides[event_builder.get_event_outcomes] = lambda: event_outcomes
         return TestClient(app, raise_server_exceptions=False)
 
     return factory
@@ -266,10 +275,18 @@ def test_event_route_success(
     auth = build_context_mock.call_args.kwargs["auth"]
     assert auth.token == auth_token
     assert auth.account.id == "ACC-001"
+    assert build_context_mock.call_args.kwargs["projection"] == ProjectionProfile.FULL
     start_event_span_mock.assert_called_once_with(
         "/test/event", task_based=False, event=mock_callable.call_args.args[0]
     )
-    set_attributes_mock.assert_called_once_with(event_span, business_attributes)
+    set_attributes_mock.assert_called_once_with(
+        event_span,
+        {
+            **business_attributes,
+            "mpt.hydration.authenticate_ms": ANY,
+            "mpt.hydration.context_ms": ANY,
+        },
+    )
     assert set_event_context_mock.call_args_list == [
         call(),
         call(order_id="ORD-001", agreement_id="AGR-001"),
@@ -306,6 +323,48 @@ def test_event_route_error(
     record_exception_mock.assert_called_once_with(event_span, error)
 
 
+def test_event_route_skips_merged_event(
+    ok_payload, mocker, auth_headers, event_client, event_payload, mock_callable, object_lanes
+):
+    ticket = mocker.patch.object(object_lanes, "acquire", autospec=True).return_value
+    ticket.__aenter__.return_value = False
+
+    result = event_client(mock_callable).post(
+        "/test/event", json=event_payload, headers=auth_headers
+    )
+
+    assert result.json() == ok_payload
+    mock_callable.assert_not_called()
+
+
+def test_event_route_replays_outcome(
+    auth_headers, build_context_mock, event_client, event_payload, mock_callable, event_outcomes
+):
+    event_outcomes.replay.return_value = event_builder.EventResponse.cancel(reason="Invalid")
+
+    result = event_client(mock_callable).post(
+        "/test/event", json=event_payload, headers=auth_headers
+    )
+
+    assert result.json()["cancelReason"] == "Invalid"
+    event_outcomes.replay.assert_awaited_once_with("/test/event", "EVT-002")
+    build_context_mock.assert_not_called()
+    mock_callable.assert_not_called()
+
+
+def test_event_route_records_outcome(
+    ok_payload, auth_headers, event_client, event_payload, mock_callable, event_outcomes
+):
+    result = event_client(mock_callable).post(
+        "/test/event", json=event_payload, headers=auth_headers
+    )
+
+    assert result.json() == ok_payload
+    event_outcomes.record.assert_awaited_once_with(
+        "/test/event", "EVT-002", event_builder.EventResponse.ok()
+    )
+
+
 def test_event_route_authentication_error(
     build_context_mock, event_client, event_payload, mock_callable
 ):
@@ -368,6 +427,7 @@ def test_task_route_success(
     fake_task_service.complete.assert_awaited_once()
     fake_task_service.fail.assert_not_awaited()
     mock_callable.assert_called_once_with(mock_callable.call_args.args[0], fake_context)
+    assert set(fake_context.timings) == {"authenticate", "context", "task_start"}
     auth = build_context_mock.call_args.kwargs["auth"]
     assert auth.token == auth_token
     assert auth.account.id == "ACC-001"
@@ -380,10 +440,40 @@ def test_task_route_success(
     ]
 
 
+def test_task_route_replays_outcome(
+    ok_payload,
+    auth_headers,
+    build_context_mock,
+    fake_task_service,
+    task_client,
+    task_event_payload,
+    mock_callable,
+    event_outcomes,
+):
+    event_outcomes.replay.return_value = event_builder.EventResponse.ok()
+
+    result = task_client(mock_callable).post(
+        "/test/task", json=task_event_payload, headers=auth_headers
+    )
+
+    assert result.json() == ok_payload
+    build_context_mock.assert_not_called()
+    fake_task_service.start.assert_not_awaited()
+
+
+def test_task_route_skips_recording_auth_error(
+    task_event_client, task_event_payload, event_outcomes
+):
+    result = task_event_client.post("/test/task", json=task_event_payload)
+
+    assert result.json()["cancelReason"] is not None
+    event_outcomes.record.assert_not_awaited()
+
+
 def test_task_route_authentication_error(
-    build_context_mock, fake_task_service, task_client, task_event_payload, mock_callable
+    build_context_mock, fake_task_service, task_event_client, task_event_payload, mock_callable
 ):
-    result = task_client(mock_callable).post("/test/task", json=task_event_payload)
+    result = task_event_client.post("/test/task", json=task_event_payload)
 
     response = result.json()
     assert response["response"] == ResponseEnum.CANCEL
@@ -409,11 +499,53 @@ def test_task_route_context_authentication_error(
 
     response = result.json()
     assert response.get("response") == ResponseEnum.CANCEL
-    fake_task_service.start.assert_not_awaited()
+    fake_task_service.start.assert_awaited_once_with("TASK-001")
+    fake_task_service.reschedule.assert_awaited_once_with("TASK-001")
     fake_task_service.fail.assert_not_awaited()
     mock_callable.assert_not_called()
 
 
+def test_task_route_adapter_error_reschedules(
+    mocker,
+    auth_headers,
+    app_instance,
+    fake_task_service,
+    task_client,
+    task_event_payload,
+    mock_callable,
+):
+    task_transitions = mocker.AsyncMock(spec=event_builder.TaskTransitionService)
+    mocker.patch.object(app_instance, "build_context", autospec=True, side_effect=TypeError)
+    client = task_client(mock_callable)
+    client.app.dependency_overrides[event_builder.get_task_transitions] = lambda: task_transitions
+
+    result = client.post("/test/task", json=task_event_payload, headers=auth_headers)
+
+    assert result.status_code == 500
+    fake_task_service.start.assert_awaited_once_with("TASK-001")
+    task_transitions.reschedule.assert_awaited_once_with("TASK-001")
+    fake_task_service.reschedule.assert_not_awaited()
+    mock_callable.assert_not_called()
+
+
+def test_task_route_rejects_other_extension(
+    auth_headers,
+    runtime_settings_mock,
+    build_context_mock,
+    fake_task_service,
+    task_event_client,
+    task_event_payload,
+    mock_callable,
+):
+    runtime_settings_mock.return_value.extension_id = "EXT-002"
+
+    result = task_event_client.post("/test/task", json=task_event_payload, headers=auth_headers)
+
+    assert result.json()["response"] == ResponseEnum.CANCEL
+    build_context_mock.assert_not_called()
+    fake_task_service.start.assert_not_awaited()
+
+
 @pytest.mark.parametrize(
     ("error", "expected_response", "expected_task_action"),
     [
@@ -452,22 +584,166 @@ def test_task_route_error(
     record_exception_mock.assert_called_once_with(event_span, error)
 
 
-async def test_run_handler(mocker, fake_context, mock_callable):
-    mock_callable = mocker.AsyncMock(spec=Callable, side_effect=mock_callable)
+def test_task_route_flushes_progress(
+    ok_payload,
+    auth_headers,
+    fake_context,
+    fake_task_service,
+    task_client,
+    task_event_payload,
+    mock_callable,
+):
+    mock_callable.side_effect = lambda _, context: context.progress.report(50)
+
+    result = task_client(mock_callable).post(
+        "/test/task", json=task_event_payload, headers=auth_headers
+    )
+
+    assert result.json() == ok_payload
+    assert fake_task_service.mock_calls[1:] == [
+        call.progress("TASK-001", 50),
+        call.complete("TASK-001"),
+    ]
+
+
+def test_create_event_route_dispatches_background(mock_callable, make_event_route):
+    route = make_event_route(
+        "/events/orders/purchase",
+        mock_callable,
+        delivery_mode=routing.EventDeliveryMode.BACKGROUND_TASK,
+    )
+
+    result = event_builder.create_event_route(route, ExtensionApp())
+
+    assert result.routes[0].name == "handle_background_task_event"
+
+
+def test_background_task_route_submits_task(
+    ok_payload,
+    auth_headers,
+    background_task_client,
+    task_event_payload,
+    mock_callable,
+    fake_task_service,
+    task_runner,
+):
+    result = background_task_client(mock_callable).post(
+        "/test/background", json=task_event_payload, headers=auth_headers
+    )
+
+    assert result.json() == ok_payload
+    fake_task_service.start.assert_awaited_once_with("TASK-001")
+    fake_task_service.complete.assert_not_awaited()
+    mock_callable.assert_not_called()
+    execution = task_runner.submit.call_args.kwargs["execution"]
+    assert (execution.task_id, execution.deadline_seconds) == ("TASK-001", 900)
+    assert execution.task_service is fake_task_service
+
+
+def test_background_route_records_when_finished(
+    auth_headers,
+    background_task_client,
+    task_event_payload,
+    mock_callable,
+    task_runner,
+    event_outcomes,
+):
+    background_task_client(mock_callable).post(
+        "/test/background", json=task_event_payload, headers=auth_headers
+    )
+    execution = task_runner.submit.call_args.kwargs["execution"]
+    event_outcomes.record.assert_not_awaited()
+
+    asyncio.run(execution.on_outcome(event_builder.EventResponse.ok()))  # act
+
+    event_outcomes.record.assert_awaited_once_with(
+        "/test/background", "EVT-001", event_builder.EventResponse.ok()
+    )
+
+
+def test_background_route_reschedules_unsubmitted(
+    auth_headers,
+    background_task_client,
+    task_event_payload,
+    mock_callable,
+    fake_task_service,
+    task_runner,
+    event_outcomes,
+):
+    task_runner.submit.return_value = False
+
+    result = background_task_client(mock_callable).post(
+        "/test/background", json=task_event_payload, headers=auth_headers
+    )
+
+    assert result.json()["response"] == ResponseEnum.DEFER
+    fake_task_service.reschedule.assert_awaited_once_with("TASK-001")
+    event_outcomes.record.assert_not_awaited()
+
+
+def test_background_task_route_skips_running_task(
+    ok_payload,
+    auth_headers,
+    background_task_client,
+    task_event_payload,
+    mock_callable,
+    fake_task_service,
+    task_runner,
+):
+    task_runner.reserve.return_value.__enter__.return_value = False
+
+    result = background_task_client(mock_callable).post(
+        "/test/background", json=task_event_payload, headers=auth_headers
+    )
+
+    assert result.json() == ok_payload
+    fake_task_service.start.assert_not_awaited()
+    task_runner.submit.assert_not_called()
+
+
+def test_background_task_route_defers_saturated(
+    auth_headers,
+    background_task_client,
+    task_event_payload,
+    mock_callable,
+    fake_task_service,
+    task_runner,
+):
+    task_runner.saturation_delay.return_value = 90
 
-    await event_builder.run_handler(mock_callable, "evt", fake_context)  # act
+    result = background_task_client(mock_callable).post(
+        "/test/background", json=task_event_payload, headers=auth_headers
+    )
 
-    mock_callable.assert_awaited_once_with("evt", fake_context)
+    assert result.json() == {"response": ResponseEnum.DEFER, "cancelReason": None, "delay": 90}
+    fake_task_service.start.assert_not_awaited()
+    task_runner.submit.assert_not_called()
 
 
-async def test_run_handler_supports_sync_handler(fake_context, mock_callable):
-    await event_builder.run_handler(mock_callable, "evt", fake_context)  # act
+def test_background_task_route_replays_outcome(
+    ok_payload,
+    auth_headers,
+    background_task_client,
+    task_event_payload,
+    mock_callable,
+    task_runner,
+    event_outcomes,
+):
+    event_outcomes.replay.return_value = event_builder.EventResponse.ok()
+
+    result = background_task_client(mock_callable).post(
+        "/test/background", json=task_event_payload, headers=auth_headers
+    )
 
-    mock_callable.assert_called_once_with("evt", fake_context)
+    assert result.json() == ok_payload
+    task_runner.reserve.assert_not_called()
 
 
-async def test_run_handler_propagates_async_exception(mocker, fake_context, mock_callable):
-    mock_callable = mocker.AsyncMock(spec=Callable, side_effect=ValueError("async boom"))
+def test_background_task_route_auth_error(
+    background_task_client, task_event_payload, mock_callable, fake_task_service, task_runner
+):
+    result = background_task_client(mock_callable).post("/test/background", json=task_event_payload)
 
-    with pytest.raises(ValueError, match="async boom"):
-        await event_builder.run_handler(mock_callable, "evt", fake_context)
+    assert result.json()["cancelReason"] is not None
+    fake_task_service.start.assert_not_awaited()
+    task_runner.submit.assert_not_called()
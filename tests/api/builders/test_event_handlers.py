@@ -0,0 +1,79 @@
+from collections.abc import Callable
+
+import pytest
+
+from mpt_extension_sdk import routing
+from mpt_extension_sdk.api.builders import event_handlers
+from mpt_extension_sdk.runtime.object_lanes import ObjectLanes
+
+
+async def test_run_background_handler(
+    mocker,
+    fake_context,
+    mock_callable,
+    make_event_route,
+    object_lanes,
+    get_business_attributes_mock,
+    set_attributes_mock,
+    set_event_context_mock,
+    start_event_span_mock,
+    event_span,
+    business_attributes,
+):
+    route = make_event_route(
+        "/test/background", mock_callable, delivery_mode=routing.EventDeliveryMode.BACKGROUND_TASK
+    )
+    event = mocker.Mock()
+    progress = mocker.MagicMock()
+    fake_context.refresh = mocker.AsyncMock()
+
+    await event_handlers.run_background_handler(
+        route, event, fake_context, progress, object_lanes
+    )  # act
+
+    fake_context.refresh.assert_awaited_once()
+    mock_callable.assert_called_once_with(event, fake_context)
+    progress.__aexit__.assert_awaited_once()
+    assert not object_lanes
+    set_attributes_mock.assert_called_once_with(event_span, business_attributes)
+    start_event_span_mock.assert_called_once_with("/test/background", task_based=True, event=event)
+
+
+async def test_background_handler_skips_refresh_unlaned(
+    mocker, fake_context, mock_callable, make_event_route
+):
+    route = make_event_route(
+        "/test/background", mock_callable, delivery_mode=routing.EventDeliveryMode.BACKGROUND_TASK
+    )
+    fake_context.refresh = mocker.AsyncMock()
+
+    await event_handlers.run_background_handler(
+        route,
+        mocker.Mock(),
+        fake_context,
+        mocker.MagicMock(),
+        ObjectLanes(enabled=False),
+    )  # act
+
+    fake_context.refresh.assert_not_awaited()
+
+
+async def test_run_handler(mocker, fake_context, mock_callable):
+    mock_callable = mocker.AsyncMock(spec=Callable, side_effect=mock_callable)
+
+    await event_handlers.run_handler(mock_callable, "evt", fake_context)  # act
+
+    mock_callable.assert_awaited_once_with("evt", fake_context)
+
+
+async def test_run_handler_supports_sync_handler(fake_context, mock_callable):
+    await event_handlers.run_handler(mock_callable, "evt", fake_context)  # act
+
+    mock_callable.assert_called_once_with("evt", fake_context)
+
+
+async def test_run_handler_propagates_async_exception(mocker, fake_context, mock_callable):
+    mock_callable = mocker.AsyncMock(spec=Callable, side_effect=ValueError("async boom"))
+
+    with pytest.raises(ValueError, match="async boom"):
+        await event_handlers.run_handler(mock_callable, "evt", fake_context)
@@ -146,6 +146,8 @@ def runtime_settings(meta_config):
         otel_otlp_endpoint="",
         ziti_workers=4,
         ziti_reload=False,
+        sync_executor_max_workers=4,
+        process_executor_max_workers=1,
     )
 
 
@@ -1,4 +1,5 @@
 import asyncio
+import threading
 from operator import itemgetter
 from typing import NamedTuple
 
@@ -32,6 +33,11 @@ def trace_sample_sync():
     return {"ok": True}
 
 
+@trace_span("adobe.render_payload", offload=True)
+def trace_sample_offloaded():
+    return trace.get_current_span(), threading.current_thread()
+
+
 @trace_span(
     "adobe.sync_with_missing_attr",
     attributes={
@@ -140,6 +146,21 @@ def test_trace_span_wraps_sync_function(mocker, span_exporter):
     assert span.name == "adobe.build_payload"
 
 
+async def test_trace_span_offloads_sync_function(mocker, span_exporter):
+    exporter, tracer = span_exporter
+    mocker.patch.object(decorators, "TRACER", tracer)
+
+    current_span, worker_thread = await trace_sample_offloaded()
+
+    span = next(
+        finished_span
+        for finished_span in exporter.get_finished_spans()
+        if finished_span.name == "adobe.render_payload"
+    )
+    assert worker_thread is not threading.current_thread()
+    assert current_span.get_span_context() == span.get_span_context()
+
+
 async def test_trace_span_omits_failing_callable_attr(mocker, span_exporter):
     exporter, tracer = span_exporter
     mocker.patch.object(decorators, "TRACER", tracer)
@@ -199,3 +220,11 @@ def test_business_attributes_return_empty():
     result = tracing.get_business_attributes(ctx)
 
     assert not result
+
+
+def test_timing_attributes_in_milliseconds(mocker):
+    ctx = mocker.Mock(timings={"authenticate": 0.0012, "context": 0.25})
+
+    result = tracing.get_timing_attributes(ctx)
+
+    assert result == {"mpt.hydration.authenticate_ms": 1.2, "mpt.hydration.context_ms": 250.0}
@@ -1,7 +1,8 @@
 from mpt_extension_sdk.pipeline.context.agreement import AgreementContext
-from mpt_extension_sdk.pipeline.context.event import EventMetadata
+from mpt_extension_sdk.pipeline.context.event import EventMetadata, UnloadedObject
 from mpt_extension_sdk.services.mpt_api_service import MPTAPIService
 from mpt_extension_sdk.services.mpt_api_service.agreement import AgreementService
+from mpt_extension_sdk.services.mpt_api_service.projection import ProjectionProfile
 from mpt_extension_sdk.settings.extension import BaseExtensionSettings
 
 
@@ -53,4 +54,36 @@ async def test_agreement_context_refreshes_agreement(
     await context.refresh_agreement()  # act
 
     assert context.agreement.id == "AGR-2"
-    service.agreements.get_by_id.assert_awaited_once_with("AGR-1")
+    service.agreements.get_by_id.assert_awaited_once_with(
+        "AGR-1", ProjectionProfile.FULL, refresh=True
+    )
+
+
+async def test_agreement_context_loads_lazy_agreement(
+    mocker, logger, runtime_settings, agreement_factory, auth_context
+):
+    service = mocker.AsyncMock(
+        spec=MPTAPIService, agreements=mocker.AsyncMock(spec=AgreementService)
+    )
+    service.agreements.get_by_id = mocker.AsyncMock(return_value=agreement_factory("AGR-1"))
+    context = AgreementContext(
+        logger=logger,
+        meta=EventMetadata(
+            event_id="EVT-1",
+            object_id="AGR-1",
+            object_type="Agreement",
+            task_id="TASK-1",
+        ),
+        mpt_api_service=service,
+        ext_settings=mocker.AsyncMock(spec=BaseExtensionSettings),
+        runtime_settings=runtime_settings,
+        auth=auth_context,
+        agreement=UnloadedObject("Agreement", "AGR-1"),
+    )
+    await context.hydrate()
+
+    result = await context.load_agreement()
+
+    assert result is context.agreement
+    assert context.agreement_loaded is True
+    service.agreements.get_by_id.assert_awaited_once_with("AGR-1", ProjectionProfile.FULL)
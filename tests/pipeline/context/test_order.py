@@ -1,7 +1,11 @@
-from mpt_extension_sdk.pipeline.context.event import EventMetadata
+import pytest
+
+from mpt_extension_sdk.errors.runtime import ContextNotHydratedError
+from mpt_extension_sdk.pipeline.context.event import EventMetadata, UnloadedObject
 from mpt_extension_sdk.pipeline.context.order import OrderContext
 from mpt_extension_sdk.services.mpt_api_service import MPTAPIService
 from mpt_extension_sdk.services.mpt_api_service.order import OrderService
+from mpt_extension_sdk.services.mpt_api_service.projection import ProjectionProfile
 from mpt_extension_sdk.settings.extension import BaseExtensionSettings
 
 
@@ -40,6 +44,7 @@ async def test_order_context_refreshes_order(
             object_id="ORD-1",
             object_type="Order",
             task_id="TASK-1",
+            projection=ProjectionProfile.PARAMETERS,
         ),
         mpt_api_service=service,
         ext_settings=mocker.AsyncMock(spec=BaseExtensionSettings),
@@ -51,4 +56,64 @@ async def test_order_context_refreshes_order(
     await context.refresh_order()  # act
 
     assert context.order.id == "ORD-2"
-    service.orders.get_by_id.assert_awaited_once_with("ORD-1")
+    service.orders.get_by_id.assert_awaited_once_with(
+        "ORD-1", ProjectionProfile.PARAMETERS, refresh=True
+    )
+
+
+async def test_order_context_loads_lazy_order_once(
+    mocker, logger, runtime_settings, order_factory, auth_context
+):
+    service = mocker.AsyncMock(spec=MPTAPIService, orders=mocker.AsyncMock(spec=OrderService))
+    service.orders.get_by_id = mocker.AsyncMock(return_value=order_factory("ORD-1"))
+    context = OrderContext(
+        logger=logger,
+        meta=EventMetadata(
+            event_id="EVT-1",
+            object_id="ORD-1",
+            object_type="Order",
+            task_id="TASK-1",
+        ),
+        mpt_api_service=service,
+        ext_settings=mocker.AsyncMock(spec=BaseExtensionSettings),
+        runtime_settings=runtime_settings,
+        auth=auth_context,
+        order=UnloadedObject("Order", "ORD-1"),
+    )
+    await context.hydrate()
+
+    result = await context.load_order()
+
+    assert result is context.order
+    assert context.order_loaded is True
+    service.orders.get_by_id.assert_awaited_once_with("ORD-1", ProjectionProfile.FULL)
+
+
+def test_unloaded_order_rejects_reads():
+    order = UnloadedObject("Order", "ORD-1")
+
+    with pytest.raises(ContextNotHydratedError, match="Order ORD-1 is not loaded"):
+        str(order.lines)
+
+
+async def test_refresh_skips_unloaded_order(mocker, logger, runtime_settings, auth_context):
+    service = mocker.AsyncMock(spec=MPTAPIService, orders=mocker.AsyncMock(spec=OrderService))
+    context = OrderContext(
+        logger=logger,
+        meta=EventMetadata(
+            event_id="EVT-1",
+            object_id="ORD-1",
+            object_type="Order",
+            task_id="TASK-1",
+        ),
+        mpt_api_service=service,
+        ext_settings=mocker.AsyncMock(spec=BaseExtensionSettings),
+        runtime_settings=runtime_settings,
+        auth=auth_context,
+        order=UnloadedObject("Order", "ORD-1"),
+    )
+
+    await context.refresh()  # act
+
+    assert context.order_loaded is False
+    service.orders.get_by_id.assert_not_awaited()
@@ -12,9 +12,10 @@ def step_event(step, ctx, error):
 
 
 class FakePipelineStep:
-    def __init__(self, name, side_effect=None):
+    def __init__(self, name, side_effect=None, *, hydrate_context=True):
         self.name = name
         self.side_effect = side_effect
+        self.hydrate_context = hydrate_context
         self.run_calls = []
 
     async def run(self, ctx):
@@ -70,7 +71,12 @@ def test_pipeline_name():
 @pytest.fixture
 def pipeline_ctx(mocker):
     logger = mocker.Mock(spec=Logger)
-    return mocker.Mock(logger=logger)
+    return mocker.Mock(logger=logger, hydrate=mocker.AsyncMock())
+
+
+@pytest.fixture
+def lazy_ctx(mocker):
+    return mocker.Mock(logger=mocker.Mock(spec=Logger), hydrate=mocker.AsyncMock())
 
 
 async def test_execute_runs_all_steps(pipeline_ctx):
@@ -85,6 +91,29 @@ async def test_execute_runs_all_steps(pipeline_ctx):
     assert pipeline.succeeded[1] == (steps[1], pipeline_ctx)
 
 
+async def test_execute_hydrates_context_per_step(lazy_ctx):
+    steps = [FakePipelineStep("first", hydrate_context=False), FakePipelineStep("second")]
+    pipeline = FakePipeline(steps)
+
+    await pipeline.execute(lazy_ctx)  # act
+
+    lazy_ctx.hydrate.assert_awaited_once_with()
+    assert len(pipeline.succeeded) == 2
+
+
+async def test_execute_fails_step_when_hydration_fails(lazy_ctx):
+    error = RuntimeError("not found")
+    lazy_ctx.hydrate.side_effect = error
+    step = FakePipelineStep("first")
+    pipeline = FakePipeline([step])
+
+    with pytest.raises(RuntimeError, match="not found"):
+        await pipeline.execute(lazy_ctx)
+
+    assert step.run_calls == []
+    assert pipeline.failed == [step_event(step, lazy_ctx, error)]
+
+
 async def test_execute_logs_pipeline_and_steps(pipeline_ctx):
     steps = [FakePipelineStep("first"), FakePipelineStep("second")]
     pipeline = FakePipeline(steps)
@@ -1,12 +1,16 @@
 from collections.abc import Callable
 
 import pytest
+from mpt_api_client.resources import AsyncCommerce
+from mpt_api_client.resources.commerce.orders import AsyncOrdersService
 
 from mpt_extension_sdk.pipeline.context.event import EventMetadata
 from mpt_extension_sdk.pipeline.context.order import OrderContext
 from mpt_extension_sdk.pipeline.decorators import refresh_order
 from mpt_extension_sdk.pipeline.step import BaseStep
+from mpt_extension_sdk.services.api_client_v2.mpt_api_client import AsyncMPTClient
 from mpt_extension_sdk.services.mpt_api_service import MPTAPIService
+from mpt_extension_sdk.services.mpt_api_service.entity_cache import EntityCache, EntityCaches
 from mpt_extension_sdk.settings.extension import BaseExtensionSettings
 
 
@@ -23,6 +27,14 @@ class SampleStep(BaseStep):
         return ctx
 
 
+class CreateOrderSubscriptionStep(BaseStep):
+    @refresh_order
+    async def process(self, ctx):
+        await ctx.mpt_api_service.subscriptions.create_order_subscription(
+            ctx.order_id, {"name": "Example subscription"}
+        )
+
+
 async def test_refresh_order(mocker, logger, runtime_settings, order_factory, auth_context):
     context = OrderContext(
         logger=logger,
@@ -69,3 +81,51 @@ async def test_refresh_order_on_failure(
         await SampleStep().failing(context)
 
     context.refresh_order.assert_not_awaited()
+
+
+async def test_refresh_order_sees_created_subscription(  # noqa: WPS210
+    mocker, logger, runtime_settings, order_factory, auth_context
+):
+    stale_order, fresh_order = order_factory("ORD-1"), order_factory("ORD-1")
+    client = mocker.Mock(spec=AsyncMPTClient)
+    client.commerce = mocker.Mock(spec=AsyncCommerce)
+    client.commerce.orders = mocker.Mock(spec=AsyncOrdersService)
+    order_resource = mocker.Mock(spec=["to_dict"])
+    order_resource.to_dict.return_value = {"id": "ORD-1"}
+    client.commerce.orders.get = mocker.AsyncMock(spec=Callable, return_value=order_resource)
+    order_subscriptions = mocker.Mock(spec=["create"])
+    order_subscriptions.create = mocker.AsyncMock(spec=Callable)
+    client.commerce.orders.subscriptions = mocker.Mock(
+        spec=Callable, return_value=order_subscriptions
+    )
+    mocker.patch(
+        "mpt_extension_sdk.services.mpt_api_service.order.Order.from_payload",
+        autospec=True,
+        side_effect=[stale_order, fresh_order],
+    )
+    mocker.patch(
+        "mpt_extension_sdk.services.mpt_api_service.subscription.Subscription.from_payload",
+        autospec=True,
+    )
+    service = MPTAPIService(
+        client, entity_caches=EntityCaches(orders=EntityCache(ttl_seconds=30, max_entries=8))
+    )
+    context = OrderContext(
+        logger=logger,
+        meta=EventMetadata(
+            event_id="EVT-1",
+            object_id="ORD-1",
+            object_type="Order",
+            task_id="TASK-1",
+        ),
+        mpt_api_service=service,
+        ext_settings=mocker.AsyncMock(spec=BaseExtensionSettings),
+        runtime_settings=runtime_settings,
+        auth=auth_context,
+        order=await service.orders.get_by_id("ORD-1"),
+    )
+
+    await CreateOrderSubscriptionStep().process(context)  # act
+
+    assert context.order is fresh_order
+    assert client.commerce.orders.get.await_count == 2
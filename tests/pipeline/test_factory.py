@@ -10,6 +10,7 @@ from mpt_extension_sdk.runtime.logging import correlation_id_ctx, task_id_ctx
 from mpt_extension_sdk.services.mpt_api_service import MPTAPIService
 from mpt_extension_sdk.services.mpt_api_service.agreement import AgreementService
 from mpt_extension_sdk.services.mpt_api_service.order import OrderService
+from mpt_extension_sdk.services.mpt_api_service.projection import ProjectionProfile
 from mpt_extension_sdk.settings.extension import BaseExtensionSettings
 
 
@@ -208,3 +209,67 @@ async def test_build_context_rejects_mismatched_ext_id(
         )
 
     FakeAuthAPIService.from_auth_context.assert_not_awaited()
+
+
+async def test_build_context_uses_projection(
+    mocker, logger, runtime_settings, event_factory, order_factory
+):
+    auth = mocker.Mock(spec=AuthContext)
+    auth.extension_id = "EXT-1"
+    service = mocker.AsyncMock(spec=MPTAPIService, orders=mocker.AsyncMock(spec=OrderService))
+    service.orders.get_by_id = mocker.AsyncMock(return_value=order_factory("ORD-1"))
+    mocker.patch(
+        "mpt_extension_sdk.pipeline.factory.get_runtime_settings",
+        autospec=True,
+        return_value=runtime_settings,
+    )
+    mocker.patch(
+        "mpt_extension_sdk.pipeline.factory.get_extension_settings",
+        autospec=True,
+        return_value=mocker.AsyncMock(spec=BaseExtensionSettings),
+    )
+    FakeAuthAPIService.from_auth_context = mocker.AsyncMock(return_value=service)
+
+    result = await build_context(
+        event_factory("Order", "ORD-1"),
+        logger,
+        auth=auth,
+        mpt_api_service_type=FakeAuthAPIService,
+        projection=ProjectionProfile.MINIMAL,
+    )
+
+    assert result.meta.projection == ProjectionProfile.MINIMAL
+    service.orders.get_by_id.assert_awaited_once_with("ORD-1", ProjectionProfile.MINIMAL)
+
+
+async def test_build_context_defers_fetch_when_lazy(
+    mocker, logger, runtime_settings, event_factory, order_factory
+):
+    auth = mocker.Mock(spec=AuthContext)
+    auth.extension_id = "EXT-1"
+    service = mocker.AsyncMock(spec=MPTAPIService, orders=mocker.AsyncMock(spec=OrderService))
+    service.orders.get_by_id = mocker.AsyncMock(return_value=order_factory("ORD-1"))
+    mocker.patch(
+        "mpt_extension_sdk.pipeline.factory.get_runtime_settings",
+        autospec=True,
+        return_value=runtime_settings,
+    )
+    mocker.patch(
+        "mpt_extension_sdk.pipeline.factory.get_extension_settings",
+        autospec=True,
+        return_value=mocker.AsyncMock(spec=BaseExtensionSettings),
+    )
+    FakeAuthAPIService.from_auth_context = mocker.AsyncMock(return_value=service)
+
+    result = await build_context(
+        event_factory("Order", "ORD-1"),
+        logger,
+        auth=auth,
+        mpt_api_service_type=FakeAuthAPIService,
+        lazy=True,
+    )
+
+    assert isinstance(result, OrderContext)
+    assert result.order_id == "ORD-1"
+    assert result.order_loaded is False
+    service.orders.get_by_id.assert_not_awaited()
@@ -0,0 +1,38 @@
+import asyncio
+
+import pytest
+
+from mpt_extension_sdk.pipeline.hydration import PhaseTimings
+
+
+@pytest.fixture
+def clock(mocker):
+    return mocker.Mock(side_effect=[10.0, 10.25])
+
+
+async def test_timed_records_duration(clock):
+    timings = PhaseTimings(clock=clock)
+
+    result = await timings.timed("context", _resolve("ctx"))
+
+    assert result == "ctx"
+    assert timings.durations == {"context": 0.25}
+
+
+async def test_timed_records_failed_phase(clock):
+    timings = PhaseTimings(clock=clock)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await timings.timed("task_start", _fail("boom"))
+
+    assert timings.durations == {"task_start": 0.25}
+
+
+async def _resolve(resolved):
+    await asyncio.sleep(0)
+    return resolved
+
+
+async def _fail(message):
+    await asyncio.sleep(0)
+    raise RuntimeError(message)
@@ -1,7 +1,16 @@
+import os
+
 import pytest
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
 
 from mpt_extension_sdk.context import BaseContext
-from mpt_extension_sdk.pipeline.step import BaseStep
+from mpt_extension_sdk.pipeline import EventMetadata, OrderContext
+from mpt_extension_sdk.pipeline import step as step_module
+from mpt_extension_sdk.pipeline.step import BaseStep, ContextSnapshot, CPUBoundStep
+from mpt_extension_sdk.runtime.process_executor import get_process_executor
 
 
 class FakeStep(BaseStep):
@@ -89,3 +98,64 @@ async def test_run_uses_default_pre_and_post_hooks(context_mock):
     await step.run(context_mock)  # act
 
     assert step.calls == [("process", context_mock)]
+
+
+class FakeLineTotalStep(CPUBoundStep):
+    def compute(self, snapshot):
+        line_prices = snapshot.state["line_prices"]
+        return {
+            "total": sum(line_prices),
+            "compute_pid": os.getpid(),
+            "compute_span_id": trace.get_current_span().get_span_context().span_id,
+        }
+
+
+@pytest.fixture
+def process_pool():
+    process_executor = get_process_executor()
+    process_executor.configure(max_workers=1)
+    yield process_executor
+    process_executor.configure(max_workers=0)
+
+
+@pytest.fixture
+def cpu_context(mocker, order_factory):
+    return mocker.Mock(
+        spec=OrderContext,
+        meta=EventMetadata(
+            event_id="EVT-1", object_id="ORD-1", object_type="Order", task_id="TASK-1"
+        ),
+        state={"line_prices": [10, 20, 30]},
+        order=order_factory("ORD-1"),
+    )
+
+
+async def test_cpu_bound_step_merges_result(process_pool, cpu_context):
+    await FakeLineTotalStep().run(cpu_context)  # act
+
+    assert cpu_context.state["total"] == 60
+    assert cpu_context.state["compute_pid"] != os.getpid()
+
+
+async def test_cpu_bound_step_stitches_span(mocker, process_pool, cpu_context):
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    mocker.patch.object(step_module, "TRACER", provider.get_tracer("tests"))
+
+    await FakeLineTotalStep().run(cpu_context)  # act
+
+    compute_span = exporter.get_finished_spans()[0]
+    assert compute_span.name == "step compute: FakeLineTotalStep"
+    assert cpu_context.state["compute_span_id"] == compute_span.context.span_id
+
+
+def test_cpu_bound_step_snapshot(cpu_context):
+    result = FakeLineTotalStep().snapshot(cpu_context)
+
+    assert result == ContextSnapshot(
+        meta=cpu_context.meta,
+        state={"line_prices": [10, 20, 30]},
+        order=cpu_context.order,
+        agreement=None,
+    )
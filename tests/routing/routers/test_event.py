@@ -2,6 +2,7 @@ import pytest
 
 from mpt_extension_sdk.context import ContextAdapter
 from mpt_extension_sdk.routing import EventDeliveryMode, EventRouter, RouteType
+from mpt_extension_sdk.services.mpt_api_service.projection import ProjectionProfile
 
 
 class FakeCustomAdapter(ContextAdapter):
@@ -51,3 +52,46 @@ def test_event_router_rejects_empty_event_name():
 
     with pytest.raises(ValueError, match="Route event cannot be empty"):
         router.event(path="orders", name="purchase", event="   ")
+
+
+def test_event_router_task_sets_projection(route_handler):
+    router = EventRouter(prefix="/events")
+
+    router.task(
+        path="orders",
+        name="purchase",
+        event="OrderPurchased",
+        projection=ProjectionProfile.PARAMETERS,
+    )(route_handler)  # act
+
+    assert router.routes[0].projection == ProjectionProfile.PARAMETERS
+
+
+def test_event_router_event_sets_lazy(route_handler):
+    router = EventRouter(prefix="/events")
+
+    router.event(path="orders", name="purchase", event="OrderPurchased", lazy=True)(
+        route_handler
+    )  # act
+
+    assert router.routes[0].lazy
+
+
+def test_event_router_task_in_background(route_handler):
+    router = EventRouter(prefix="/events")
+
+    router.task(
+        path="orders", name="purchase", event="OrderPurchased", background=True, deadline_seconds=60
+    )(route_handler)  # act
+
+    route = router.routes[0]
+    assert route.delivery_mode == EventDeliveryMode.BACKGROUND_TASK
+    assert route.deadline_seconds == 60
+    assert route.task_based
+
+
+def test_event_router_rejects_invalid_deadline():
+    router = EventRouter(prefix="/events")
+
+    with pytest.raises(ValueError, match="deadline_seconds must be greater than 0"):
+        router.task(path="orders", name="purchase", event="OrderPurchased", deadline_seconds=0)
@@ -1,4 +1,5 @@
 import asyncio
+import dataclasses
 from types import ModuleType
 
 import pytest
@@ -7,11 +8,15 @@ from fastapi.testclient import TestClient
 
 from mpt_extension_sdk import APIRouter, EventRouter, Plug, PlugRouter
 from mpt_extension_sdk.api import APIResponse
+from mpt_extension_sdk.api.models.events import EventResponse
 from mpt_extension_sdk.errors.runtime import ConfigError
 from mpt_extension_sdk.extension_app import ExtensionApp
 from mpt_extension_sdk.routing import RouteType, ScheduleRouteDefinition
 from mpt_extension_sdk.runtime import app as runtime_app
 from mpt_extension_sdk.runtime.async_tasks import AsyncTaskRunner
+from mpt_extension_sdk.runtime.sync_executor import get_sync_executor
+from mpt_extension_sdk.runtime.task_outbox import TaskOutbox
+from mpt_extension_sdk.services.mpt_api_service import MPTAPIService
 
 
 def runtime_plug_provider():
@@ -138,6 +143,72 @@ def test_create_runtime_app_bootstraps_deps(runtime_settings, runtime_app_patche
     instrument_fastapi_app.assert_called_once()
 
 
+def test_create_runtime_app_limits_tasks(mocker, runtime_settings, runtime_app_patches):
+    task_runner = mocker.patch("mpt_extension_sdk.runtime.app_state.AsyncTaskRunner", autospec=True)
+    settings = dataclasses.replace(runtime_settings, task_max_in_flight=8, task_max_queued=16)
+
+    result = runtime_app.create_runtime_app(settings)
+
+    task_runner.assert_called_with(max_in_flight=8, max_queued=16)
+    assert result.state.async_task_runner is task_runner.return_value
+
+
+def test_create_runtime_app_configures_lanes(mocker, runtime_settings, runtime_app_patches):
+    object_lanes = mocker.patch("mpt_extension_sdk.runtime.app_state.ObjectLanes", autospec=True)
+    settings = dataclasses.replace(runtime_settings, event_lanes_enabled=True)
+
+    result = runtime_app.create_runtime_app(settings)
+
+    object_lanes.assert_called_with(enabled=True, merge_duplicates=False)
+    assert result.state.object_lanes is object_lanes.return_value
+
+
+async def test_create_runtime_app_uses_app_store(mocker, runtime_settings, runtime_app_patches):
+    extension_app = runtime_app_patches["load_extension_app"].return_value
+    extension_app.event_outcome_store = mocker.AsyncMock()
+    settings = dataclasses.replace(runtime_settings, event_dedup_ttl_seconds=60)
+
+    result = runtime_app.create_runtime_app(settings)
+
+    await result.state.event_outcomes.replay("/events", "EVT-1")
+    extension_app.event_outcome_store.load.assert_awaited_once_with("/events#EVT-1")
+
+
+async def test_create_runtime_app_uses_sqlite_store(
+    tmp_path, runtime_settings, runtime_app_patches
+):
+    runtime_app_patches["load_extension_app"].return_value.event_outcome_store = None
+    settings = dataclasses.replace(
+        runtime_settings,
+        event_dedup_ttl_seconds=60,
+        event_dedup_store_path=str(tmp_path / "events.sqlite3"),
+    )
+
+    result = runtime_app.create_runtime_app(settings)
+
+    await result.state.event_outcomes.record("/events", "EVT-1", EventResponse.ok())
+    assert await result.state.event_outcomes.replay("/events", "EVT-1") == EventResponse.ok()
+
+
+def test_create_runtime_app_builds_task_outbox(tmp_path, runtime_settings, runtime_app_patches):
+    settings = dataclasses.replace(
+        runtime_settings, task_outbox_path=str(tmp_path / "outbox.sqlite3")
+    )
+
+    result = runtime_app.create_runtime_app(settings)
+
+    assert isinstance(result.state.task_outbox, TaskOutbox)
+    assert (tmp_path / "outbox.sqlite3").exists()
+
+
+def test_create_runtime_app_sizes_sync_pool(runtime_settings, runtime_app_patches):
+    settings = dataclasses.replace(runtime_settings, sync_executor_max_workers=2)
+
+    runtime_app.create_runtime_app(settings)  # act
+
+    assert get_sync_executor().stats.max_workers == 2
+
+
 def test_create_runtime_app_registers_health(runtime_settings, runtime_app_patches):
     extension_app = runtime_app_patches["load_extension_app"].return_value
 
@@ -186,6 +257,37 @@ def test_lifespan_shuts_down_async_task_runner(mocker):
     app.state.async_task_runner.shutdown.assert_awaited_once_with()
 
 
+def test_lifespan_runs_task_outbox(mocker):
+    app = runtime_app._create_fastapi_app(ExtensionApp())
+    app.state.task_outbox = mocker.create_autospec(TaskOutbox, instance=True)
+
+    asyncio.run(_run_lifespan_with_wrapper(app))  # act
+
+    app.state.task_outbox.start.assert_called_once_with()
+    app.state.task_outbox.stop.assert_awaited_once_with()
+
+
+def test_lifespan_closes_account_clients(mocker):
+    close_account_clients = mocker.patch.object(
+        MPTAPIService, "close_account_clients", autospec=True
+    )
+    app = runtime_app._create_fastapi_app(ExtensionApp())
+
+    asyncio.run(_run_lifespan_with_wrapper(app))  # act
+
+    close_account_clients.assert_awaited_once_with()
+
+
+def test_lifespan_warms_up_caches(mocker):
+    warm_up_caches = mocker.patch.object(MPTAPIService, "warm_up_caches", autospec=True)
+    app = runtime_app._create_fastapi_app(ExtensionApp())
+    app.state.warm_up_caches = True
+
+    asyncio.run(_run_lifespan_with_wrapper(app))  # act
+
+    warm_up_caches.assert_awaited_once_with()
+
+
 def test_ready_follows_app_lifespan(runtime_settings, runtime_app_patches):
     result = runtime_app.create_runtime_app(runtime_settings)
 
@@ -2,9 +2,11 @@ import asyncio
 
 import pytest
 
+from mpt_extension_sdk.api.models.events import EventResponse
 from mpt_extension_sdk.errors.pipeline import CancelError, DeferError, FailError
 from mpt_extension_sdk.errors.runtime import AsyncTasksRunnerError
 from mpt_extension_sdk.runtime.async_tasks import (
+    MIN_SATURATION_DELAY_SECONDS,
     PROCESSING_TIMEOUT_REASON,
     SHUTDOWN_INTERRUPTION_REASON,
     AsyncTaskRunner,
@@ -16,14 +18,17 @@ DEFAULT_DEADLINE_SECONDS = 60
 
 @pytest.fixture
 def submit(task_service, logger):
-    def factory(runner, task_callback, deadline=DEFAULT_DEADLINE_SECONDS):
+    def factory(  # noqa: WPS211
+        runner, task_callback, deadline=DEFAULT_DEADLINE_SECONDS, task_id="TSK-1", on_outcome=None
+    ):
         return runner.submit(
             execution=TaskExecution(
-                task_id="TSK-1",
+                task_id=task_id,
                 task_callback=task_callback,
                 task_service=task_service,
                 handler_logger=logger,
                 deadline_seconds=deadline,
+                on_outcome=on_outcome,
             ),
         )
 
@@ -82,6 +87,42 @@ async def test_runner_completes_task(mocker, task_service, submit):
     task_service.complete.assert_awaited_once_with("TSK-1")
 
 
+@pytest.mark.parametrize(
+    ("error", "expected_outcome"),
+    [
+        (None, EventResponse.ok()),
+        (CancelError("cancelled"), EventResponse.cancel(reason="cancelled")),
+        (DeferError("later"), EventResponse.reschedule(seconds=300)),
+    ],
+)
+async def test_runner_reports_outcome_when_finished(mocker, submit, error, expected_outcome):
+    runner = AsyncTaskRunner()
+    running_when_reported = []
+    on_outcome = mocker.AsyncMock(
+        side_effect=lambda _: running_when_reported.append(runner.is_running("TSK-1"))
+    )
+    submit(runner, mocker.AsyncMock(side_effect=error), on_outcome=on_outcome)
+
+    await asyncio.sleep(0)  # act
+
+    on_outcome.assert_awaited_once_with(expected_outcome)
+    assert running_when_reported == [True]
+    assert runner.is_running("TSK-1") is False
+
+
+async def test_runner_logs_outcome_errors(mocker, task_service, submit, logger):
+    runner = AsyncTaskRunner()
+    log_exception = mocker.patch.object(logger, "exception", autospec=True)
+    on_outcome = mocker.AsyncMock(side_effect=OSError("disk"))
+    submit(runner, mocker.AsyncMock(), on_outcome=on_outcome)
+
+    await asyncio.sleep(0)  # act
+
+    task_service.complete.assert_awaited_once_with("TSK-1")
+    log_exception.assert_called_once_with("Failed to record the outcome of async task %s", "TSK-1")
+    assert runner.is_running("TSK-1") is False
+
+
 async def test_runner_rejects_duplicate(mocker, submit):
     runner = AsyncTaskRunner()
     submit(runner, mocker.AsyncMock())
@@ -147,3 +188,55 @@ async def test_runner_fails_expired_processing(mocker, task_service, submit):
     await asyncio.sleep(0.01)  # act
 
     task_service.fail.assert_awaited_once_with("TSK-1", reason=PROCESSING_TIMEOUT_REASON)
+
+
+async def test_runner_queues_beyond_in_flight(mocker, task_service, submit):
+    runner = AsyncTaskRunner(max_in_flight=1, max_queued=1)
+    release = asyncio.Event()
+    first_callback = mocker.AsyncMock(side_effect=release.wait)
+    second_callback = mocker.AsyncMock()
+    submit(runner, first_callback, task_id="TSK-1")
+    submit(runner, second_callback, task_id="TSK-2")
+
+    await asyncio.sleep(0)  # act
+
+    first_callback.assert_awaited_once()
+    second_callback.assert_not_awaited()
+    assert runner.in_flight == 2
+    release.set()
+    await asyncio.sleep(0.01)
+    second_callback.assert_awaited_once()
+
+
+async def test_runner_defers_when_saturated(mocker, submit):
+    runner = AsyncTaskRunner(max_in_flight=1)
+    submit(runner, mocker.AsyncMock(side_effect=asyncio.Event().wait), task_id="TSK-1")
+
+    with runner.reserve("TSK-2"):
+        result = runner.saturation_delay()
+
+    assert result == MIN_SATURATION_DELAY_SECONDS * 2
+    await runner.shutdown()
+
+
+def test_runner_accepts_within_capacity():
+    runner = AsyncTaskRunner(max_in_flight=1)
+
+    with runner.reserve("TSK-1"):
+        result = runner.saturation_delay()
+
+    assert result is None
+
+
+def test_runner_without_limit_is_never_saturated():
+    runner = AsyncTaskRunner()
+
+    with runner.reserve("TSK-1"), runner.reserve("TSK-2"):
+        result = runner.saturation_delay()
+
+    assert result is None
+
+
+def test_runner_rejects_negative_limits():
+    with pytest.raises(ValueError, match="cannot be negative"):
+        AsyncTaskRunner(max_in_flight=-1)
@@ -0,0 +1,92 @@
+import pytest
+
+from mpt_extension_sdk.api.models.events import EventResponse
+from mpt_extension_sdk.runtime.event_outcomes import (
+    EventOutcomes,
+    InMemoryEventOutcomeStore,
+    SQLiteEventOutcomeStore,
+)
+
+CANCELLED = EventResponse.cancel(reason="Order is not valid")
+
+
+@pytest.fixture
+def clock(mocker):
+    return mocker.Mock(return_value=100.0)
+
+
+@pytest.fixture
+def memory_store(clock):
+    return InMemoryEventOutcomeStore(max_entries=2, clock=clock)
+
+
+async def test_memory_store_loads_outcome(memory_store):
+    await memory_store.save("EVT-1", CANCELLED, ttl_seconds=60)
+
+    result = await memory_store.load("EVT-1")
+
+    assert result == CANCELLED
+
+
+async def test_memory_store_expires_outcome(memory_store, clock):
+    await memory_store.save("EVT-1", CANCELLED, ttl_seconds=60)
+    clock.return_value = 160.0
+
+    result = await memory_store.load("EVT-1")
+
+    assert result is None
+    assert not memory_store
+
+
+async def test_memory_store_evicts_oldest(memory_store):
+    await memory_store.save("EVT-1", CANCELLED, ttl_seconds=60)
+    await memory_store.save("EVT-2", CANCELLED, ttl_seconds=60)
+
+    await memory_store.save("EVT-3", CANCELLED, ttl_seconds=60)  # act
+
+    assert await memory_store.load("EVT-1") is None
+    assert len(memory_store) == 2
+
+
+async def test_sqlite_store_shares_outcome(tmp_path):
+    path = tmp_path / "outcomes.sqlite3"
+    await SQLiteEventOutcomeStore(path).save("EVT-1", CANCELLED, ttl_seconds=60)
+
+    result = await SQLiteEventOutcomeStore(path).load("EVT-1")
+
+    assert result == CANCELLED
+
+
+async def test_sqlite_store_skips_expired(tmp_path):
+    store = SQLiteEventOutcomeStore(tmp_path / "outcomes.sqlite3")
+    await store.save("EVT-1", CANCELLED, ttl_seconds=-1)
+
+    result = await store.load("EVT-1")
+
+    assert result is None
+
+
+async def test_outcomes_replay_final_outcome(memory_store):
+    outcomes = EventOutcomes(memory_store, ttl_seconds=60)
+    await outcomes.record("/events/orders", "EVT-1", EventResponse.ok())
+
+    result = await outcomes.replay("/events/orders", "EVT-1")
+
+    assert result == EventResponse.ok()
+    assert await outcomes.replay("/events/other", "EVT-1") is None
+
+
+async def test_outcomes_do_not_record_defer(memory_store):
+    outcomes = EventOutcomes(memory_store, ttl_seconds=60)
+
+    await outcomes.record("/events/orders", "EVT-1", EventResponse.reschedule(seconds=60))  # act
+
+    assert await outcomes.replay("/events/orders", "EVT-1") is None
+
+
+async def test_outcomes_disabled_without_ttl(memory_store):
+    outcomes = EventOutcomes(memory_store, ttl_seconds=0)
+
+    await outcomes.record("/events/orders", "EVT-1", EventResponse.ok())  # act
+
+    assert not memory_store
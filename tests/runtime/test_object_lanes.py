@@ -0,0 +1,104 @@
+import asyncio
+
+import pytest
+
+from mpt_extension_sdk.runtime.object_lanes import ObjectLanes
+
+
+@pytest.fixture
+def run_in_lane():
+    def factory(lanes, object_id, log, label, merge_key=None):
+        async def run():  # noqa: WPS430
+            async with lanes.acquire(object_id, merge_key) as acquired:
+                log.append((label, "start", acquired))
+                await asyncio.sleep(0)
+                log.append((label, "end", acquired))
+
+        return asyncio.create_task(run())
+
+    return factory
+
+
+async def test_lanes_serialize_same_object(run_in_lane):
+    lanes = ObjectLanes()
+    log = []
+
+    await asyncio.gather(
+        run_in_lane(lanes, "ORD-1", log, "first"), run_in_lane(lanes, "ORD-1", log, "second")
+    )  # act
+
+    assert log == [
+        ("first", "start", True),
+        ("first", "end", True),
+        ("second", "start", True),
+        ("second", "end", True),
+    ]
+    assert not lanes
+
+
+async def test_lanes_run_objects_concurrently(run_in_lane):
+    lanes = ObjectLanes()
+    log = []
+
+    await asyncio.gather(
+        run_in_lane(lanes, "ORD-1", log, "first"), run_in_lane(lanes, "ORD-2", log, "second")
+    )  # act
+
+    started = [entry[:2] for entry in log[:2]]
+    assert started == [("first", "start"), ("second", "start")]
+
+
+async def test_lanes_merge_waiting_duplicates(run_in_lane):
+    lanes = ObjectLanes(merge_duplicates=True)
+    log = []
+
+    await asyncio.gather(
+        run_in_lane(lanes, "ORD-1", log, "running", "/orders"),
+        run_in_lane(lanes, "ORD-1", log, "superseded", "/orders"),
+        run_in_lane(lanes, "ORD-1", log, "latest", "/orders"),
+    )  # act
+
+    assert [entry for entry in log if entry[1] == "start"] == [
+        ("running", "start", True),
+        ("superseded", "start", False),
+        ("latest", "start", True),
+    ]
+
+
+async def test_lanes_keep_other_merge_keys(run_in_lane):
+    lanes = ObjectLanes(merge_duplicates=True)
+    log = []
+
+    await asyncio.gather(
+        run_in_lane(lanes, "ORD-1", log, "running", "/orders"),
+        run_in_lane(lanes, "ORD-1", log, "validate", "/validate"),
+        run_in_lane(lanes, "ORD-1", log, "change", "/orders"),
+    )  # act
+
+    assert all(entry[2] for entry in log)
+
+
+async def test_disabled_lanes_do_not_wait(run_in_lane):
+    lanes = ObjectLanes(enabled=False)
+    log = []
+
+    await asyncio.gather(
+        run_in_lane(lanes, "ORD-1", log, "first"), run_in_lane(lanes, "ORD-1", log, "second")
+    )  # act
+
+    started = [entry[:2] for entry in log[:2]]
+    assert started == [("first", "start"), ("second", "start")]
+
+
+async def test_cancelled_waiter_leaves_lane(run_in_lane):
+    lanes = ObjectLanes()
+    log = []
+    running = run_in_lane(lanes, "ORD-1", log, "running")
+    waiting = run_in_lane(lanes, "ORD-1", log, "waiting")
+    await asyncio.sleep(0)
+
+    waiting.cancel()
+    await asyncio.gather(running, waiting, return_exceptions=True)
+
+    assert not lanes
+    assert [entry[0] for entry in log] == ["running", "running"]
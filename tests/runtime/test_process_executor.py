@@ -0,0 +1,96 @@
+import os
+import queue
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from opentelemetry import trace
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
+
+from mpt_extension_sdk.observability.config import ObservabilityConfig
+from mpt_extension_sdk.runtime.process_executor import ProcessExecutor, run_in_trace_context
+
+
+def open_worker_span():
+    with trace.get_tracer("tests").start_as_current_span("worker span") as span:
+        span.set_attribute("process.pid", os.getpid())
+
+
+class OTLPReceiver(BaseHTTPRequestHandler):
+    def do_POST(self):
+        content_length = int(self.headers["Content-Length"])
+        self.server.export_requests.put(self.rfile.read(content_length))
+        self.send_response(200)
+        self.end_headers()
+
+    def log_message(self, *args):
+        """Keep the test output quiet."""
+
+
+@pytest.fixture
+def otlp_requests(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), OTLPReceiver)
+    server.export_requests = queue.Queue()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setenv(
+        "OTEL_EXPORTER_OTLP_TRACES_ENDPOINT", f"http://127.0.0.1:{server.server_port}/v1/traces"
+    )
+    yield server.export_requests
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def executor():
+    process_executor = ProcessExecutor(max_workers=1)
+    yield process_executor
+    process_executor.shutdown()
+
+
+async def test_run_uses_pool_process(executor):
+    result = await executor.run(os.getpid)
+
+    assert result != os.getpid()
+
+
+async def test_run_in_sync_executor_without_workers():
+    executor = ProcessExecutor(max_workers=0)
+
+    result = await executor.run(threading.current_thread)
+
+    assert result is not threading.current_thread()
+
+
+def test_configure_rejects_negative_workers(executor):
+    with pytest.raises(ValueError, match="cannot be negative"):
+        executor.configure(max_workers=-1)
+
+
+def test_run_in_trace_context_sets_current_span():
+    carrier = {}
+    with TracerProvider().get_tracer("tests").start_as_current_span("caller") as caller_span:
+        TraceContextTextMapPropagator().inject(carrier)
+
+    result = run_in_trace_context(carrier, trace.get_current_span)
+
+    assert result.get_span_context().span_id == caller_span.get_span_context().span_id
+
+
+async def test_run_exports_worker_span_as_child(otlp_requests):
+    executor = ProcessExecutor(
+        max_workers=1,
+        observability=ObservabilityConfig(enabled=True, exporters=("otlp",), service_name="tests"),
+    )
+    with TracerProvider().get_tracer("tests").start_as_current_span("caller") as caller:
+        caller_context = caller.get_span_context()
+        await executor.run(open_worker_span)
+    executor.shutdown()
+
+    result = ExportTraceServiceRequest.FromString(otlp_requests.get(timeout=30))
+
+    scope_spans = result.resource_spans[0].scope_spans[0]
+    assert [span.name for span in scope_spans.spans] == ["worker span"]
+    assert scope_spans.spans[0].trace_id == caller_context.trace_id.to_bytes(16, "big")
+    assert scope_spans.spans[0].parent_span_id == caller_context.span_id.to_bytes(8, "big")
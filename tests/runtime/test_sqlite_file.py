@@ -0,0 +1,40 @@
+import sqlite3
+import stat
+
+import pytest
+
+from mpt_extension_sdk.runtime.sqlite_file import SQLiteFile
+
+
+@pytest.fixture
+def database(tmp_path):
+    return SQLiteFile(tmp_path / "test.sqlite3", "CREATE TABLE IF NOT EXISTS items (name TEXT)")
+
+
+def _insert(connection: sqlite3.Connection, name: str) -> None:
+    connection.execute("INSERT INTO items VALUES (?)", (name,))
+
+
+def _insert_and_fail(connection: sqlite3.Connection, name: str) -> None:
+    _insert(connection, name)
+    raise ValueError(name)
+
+
+def _names(connection: sqlite3.Connection) -> list[str]:
+    return [row[0] for row in connection.execute("SELECT name FROM items")]
+
+
+async def test_run_commits_operation(tmp_path, database):
+    await database.run(_insert, "first")
+
+    result = await SQLiteFile(tmp_path / "test.sqlite3", "SELECT 1").run(_names)
+
+    assert result == ["first"]
+    assert stat.S_IMODE((tmp_path / "test.sqlite3").stat().st_mode) == 0o600
+
+
+async def test_run_rolls_back_failed_operation(database):
+    with pytest.raises(ValueError, match="first"):
+        await database.run(_insert_and_fail, "first")
+
+    assert not await database.run(_names)
@@ -0,0 +1,97 @@
+import asyncio
+import threading
+
+import pytest
+
+from mpt_extension_sdk.runtime.logging import correlation_id_ctx
+from mpt_extension_sdk.runtime.sync_executor import (
+    SyncExecutor,
+    SyncExecutorStats,
+    run_callback,
+)
+
+
+@pytest.fixture
+def executor():
+    sync_executor = SyncExecutor(max_workers=1)
+    yield sync_executor
+    sync_executor.shutdown()
+
+
+async def test_run_uses_worker_thread(executor):
+    result = await executor.run(threading.current_thread)
+
+    assert result is not threading.current_thread()
+
+
+async def test_run_propagates_context(executor):
+    correlation_id_ctx.set("corr-1")
+
+    result = await executor.run(correlation_id_ctx.get)
+
+    assert result == "corr-1"
+
+
+async def test_run_inline_without_workers():
+    executor = SyncExecutor(max_workers=0)
+
+    result = await executor.run(threading.current_thread)
+
+    assert result is threading.current_thread()
+
+
+async def test_stats_count_saturated_calls(executor):
+    release = threading.Event()
+    blocked_calls = [
+        asyncio.create_task(executor.run(release.wait)),
+        asyncio.create_task(executor.run(release.wait)),
+    ]
+    await asyncio.sleep(0.05)
+
+    result = executor.stats
+
+    release.set()
+    await asyncio.gather(*blocked_calls)
+    assert result == SyncExecutorStats(
+        max_workers=1,
+        running=1,
+        queued=1,
+        calls=2,
+        saturated_calls=1,
+        wait_seconds=result.wait_seconds,
+    )
+    assert (executor.stats.running, executor.stats.queued) == (0, 0)
+
+
+def test_configure_rejects_negative_workers(executor):
+    with pytest.raises(ValueError, match="cannot be negative"):
+        executor.configure(max_workers=-1)
+
+
+async def test_run_callback_awaits_coroutine_function():
+    async def resolve_event(event_id):  # noqa: WPS430
+        await asyncio.sleep(0)
+        return threading.current_thread(), event_id
+
+    result = await run_callback(resolve_event, "EVT-1")
+
+    assert result == (threading.current_thread(), "EVT-1")
+
+
+async def test_run_callback_offloads_sync_callable():
+    result = await run_callback(threading.current_thread)
+
+    assert result is not threading.current_thread()
+
+
+async def test_run_callback_awaits_returned_awaitable():
+    async def resolve():  # noqa: WPS430
+        await asyncio.sleep(0)
+        return "resolved"
+
+    def start_resolving():  # noqa: WPS430
+        return resolve()
+
+    result = await run_callback(start_resolving)
+
+    assert result == "resolved"
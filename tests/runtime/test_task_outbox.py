@@ -0,0 +1,154 @@
+import asyncio
+
+import pytest
+from mpt_api_client.exceptions import MPTHttpError
+
+from mpt_extension_sdk.runtime.task_outbox import (
+    SQLiteTaskOutboxStore,
+    TaskOutbox,
+    TaskTransition,
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SQLiteTaskOutboxStore(tmp_path / "outbox.sqlite3")
+
+
+@pytest.fixture
+def outbox(store, task_service):
+    return TaskOutbox(store, task_service, batch_size=2, max_attempts=2)
+
+
+async def test_store_claims_due_transitions_once(store):
+    await store.add("TSK-1", TaskTransition.FAIL, "boom")
+
+    result = await store.claim(limit=10)
+
+    assert [(entry.task_id, entry.transition, entry.reason) for entry in result] == [
+        ("TSK-1", TaskTransition.FAIL, "boom")
+    ]
+    assert not await store.claim(limit=10)
+
+
+async def test_store_holds_transitions_behind_pending(store):
+    await store.add("TSK-1", TaskTransition.RESCHEDULE)
+    await store.add("TSK-1", TaskTransition.COMPLETE)
+    await store.add("TSK-2", TaskTransition.COMPLETE)
+    await store.claim(limit=1)
+
+    result = await store.claim(limit=10)
+
+    assert [(entry.task_id, entry.transition) for entry in result] == [
+        ("TSK-2", TaskTransition.COMPLETE)
+    ]
+
+
+async def test_store_survives_reopening(tmp_path):
+    await SQLiteTaskOutboxStore(tmp_path / "outbox.sqlite3").add("TSK-1", TaskTransition.COMPLETE)
+
+    result = await SQLiteTaskOutboxStore(tmp_path / "outbox.sqlite3").claim(limit=10)
+
+    assert result[0].task_id == "TSK-1"
+
+
+async def test_outbox_queues_without_calling_service(outbox, store, task_service):
+    await outbox.complete("TSK-1")  # act
+
+    assert await store.count() == 1
+    task_service.complete.assert_not_awaited()
+
+
+async def test_flush_sends_transitions(outbox, store, task_service):
+    await outbox.fail("TSK-1", reason="boom")
+    await outbox.reschedule("TSK-2")
+
+    result = await outbox.flush()
+
+    assert result == 2
+    assert not await store.count()
+    task_service.fail.assert_awaited_once_with("TSK-1", reason="boom")
+    task_service.reschedule.assert_awaited_once_with("TSK-2")
+
+
+async def test_flush_sends_task_transitions_in_order(outbox, task_service):
+    sent = []
+
+    async def reschedule(task_id):  # noqa: WPS430
+        await asyncio.sleep(0)
+        sent.append(("reschedule", task_id))
+
+    task_service.reschedule.side_effect = reschedule
+    task_service.complete.side_effect = lambda task_id: sent.append(("complete", task_id))
+    await outbox.reschedule("TSK-1")
+    await outbox.complete("TSK-1")
+
+    await outbox.flush()  # act
+
+    assert sent == [("reschedule", "TSK-1"), ("complete", "TSK-1")]
+
+
+async def test_flush_holds_transitions_after_retry(outbox, store, task_service):
+    task_service.reschedule.side_effect = MPTHttpError(503, "unavailable", "")
+    await outbox.reschedule("TSK-1")
+    await outbox.complete("TSK-1")
+
+    await outbox.flush()  # act
+
+    task_service.complete.assert_not_awaited()
+    assert await store.count() == 2
+
+
+async def test_flush_sends_one_batch(outbox, store):
+    await asyncio.gather(
+        *(store.add(task_id, TaskTransition.COMPLETE) for task_id in ("TSK-1", "TSK-2", "TSK-3"))
+    )
+
+    result = await outbox.flush()
+
+    assert result == 2
+    assert await store.count() == 1
+
+
+async def test_flush_drops_finalized_task(outbox, store, task_service):
+    task_service.complete.side_effect = MPTHttpError(409, "final", "")
+    await outbox.complete("TSK-1")
+
+    await outbox.flush()  # act
+
+    assert not await store.count()
+
+
+async def test_flush_retries_failed_transition(outbox, store, task_service):
+    task_service.complete.side_effect = MPTHttpError(503, "unavailable", "")
+    await outbox.complete("TSK-1")
+
+    await outbox.flush()  # act
+
+    assert await store.count() == 1
+    assert not await store.claim(limit=10)
+
+
+async def test_flush_gives_up_after_max_attempts(store, task_service):
+    task_service.complete.side_effect = MPTHttpError(503, "unavailable", "")
+    outbox = TaskOutbox(store, task_service, max_attempts=1)
+    await outbox.complete("TSK-1")
+
+    await outbox.flush()  # act
+
+    assert not await store.count()
+
+
+async def test_started_outbox_sends_in_background(outbox, task_service):
+    outbox.start()
+
+    await outbox.complete("TSK-1")
+
+    await asyncio.sleep(0.05)
+    await outbox.stop()
+    task_service.complete.assert_awaited_once_with("TSK-1")
+
+
+def test_outbox_rejects_empty_batches(store, task_service):
+    with pytest.raises(ValueError, match="must be greater than 0"):
+        TaskOutbox(store, task_service, batch_size=0)
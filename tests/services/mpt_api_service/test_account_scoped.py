@@ -1,3 +1,4 @@
+import asyncio
 import datetime as dt
 from collections.abc import AsyncIterator
 from contextlib import aclosing
@@ -11,10 +12,16 @@ from mpt_extension_sdk.api.auth import Account, AccountType, AuthContext
 from mpt_extension_sdk.models.account import AccountToken
 from mpt_extension_sdk.services.mpt_api_service.account_scoped_client import (
     AccountScopedAuthentication,
-    AccountTokenProvider,
     build_account_scoped_mpt_client,
 )
 from mpt_extension_sdk.services.mpt_api_service.account_token import AccountTokenService
+from mpt_extension_sdk.services.mpt_api_service.account_token_provider import AccountTokenProvider
+from mpt_extension_sdk.services.mpt_api_service.account_token_store import (
+    AccountTokenStore,
+    SQLiteAccountTokenStore,
+)
+from mpt_extension_sdk.services.mpt_api_service.http_settings import HTTPClientSettings
+from mpt_extension_sdk.services.mpt_api_service.rate_limit import get_extension_rate_limiter
 
 
 @pytest.fixture
@@ -33,7 +40,12 @@ def account_token_factory():
 
 @pytest.fixture
 def token_provider_factory(mocker, account_token_factory, runtime_settings):  # noqa: WPS210
-    def factory(account_token: AccountToken | None = None):
+    def factory(
+        account_token: AccountToken | None = None,
+        *,
+        refresh_ahead_seconds: int = 0,
+        token_store: AccountTokenStore | None = None,
+    ):
         provider_token = account_token_factory() if account_token is None else account_token
         auth = mocker.Mock(
             spec=AuthContext,
@@ -49,7 +61,11 @@ def token_provider_factory(mocker, account_token_factory, runtime_settings):  #
             spec=["account_token"], account_token=account_token
         )
         provider = AccountTokenProvider(
-            runtime_settings=runtime_settings, auth=auth, service_type=service_type
+            runtime_settings=runtime_settings,
+            auth=auth,
+            service_type=service_type,
+            refresh_ahead_seconds=refresh_ahead_seconds,
+            token_store=token_store,
         )
         return provider, service_type, account_token
 
@@ -93,18 +109,34 @@ async def test_provider_caches_token(
 
     assert result == ["account-token", "account-token"]
     service_type.from_config.assert_called_once_with(
-        base_url=runtime_settings.mpt_api_base_url, api_token=runtime_settings.ext_api_key
+        base_url=runtime_settings.mpt_api_base_url,
+        api_token=runtime_settings.ext_api_key,
+        retry_policy=None,
+        http_settings=HTTPClientSettings(),
+        rate_limiter=get_extension_rate_limiter(runtime_settings),
     )
     installations.create_token.assert_awaited_once_with("ACC-1")
 
 
+async def test_provider_reports_cache_stats(
+    clear_account_token_cache, token_provider_factory, provider_tokens_factory
+):
+    provider, _, _ = token_provider_factory()
+    await provider_tokens_factory(provider)
+
+    result = AccountTokenProvider.cache_stats()
+
+    assert (result.size, result.locks) == (1, 0)
+    assert (result.hits, result.misses) == (1, 1)
+
+
 async def test_provider_invalidate_forces_refresh(
     clear_account_token_cache, token_provider_factory
 ):
     provider, _, installations = token_provider_factory()
     first_token = await provider.get_token()
 
-    provider.invalidate(first_token)
+    await provider.invalidate(first_token)
 
     await provider.get_token()
     assert installations.create_token.await_count == 2
@@ -116,12 +148,87 @@ async def test_provider_invalidate_ignores_stale_token(
     provider, _, installations = token_provider_factory()
     await provider.get_token()
 
-    provider.invalidate("already-replaced-token")
+    await provider.invalidate("already-replaced-token")
 
     await provider.get_token()
     installations.create_token.assert_awaited_once()
 
 
+async def test_provider_refreshes_token_ahead(
+    clear_account_token_cache, account_token_factory, token_provider_factory
+):
+    provider, _, installations = token_provider_factory(refresh_ahead_seconds=900)
+    refreshed_expires_at = dt.datetime.now(dt.UTC) + dt.timedelta(hours=1)
+    installations.create_token.side_effect = [
+        account_token_factory("token-1"),
+        account_token_factory("token-2", refreshed_expires_at),
+    ]
+    await provider.get_token()
+
+    result = await provider.get_token()
+
+    await asyncio.gather(*AccountTokenProvider._account_refresh_tasks.values())
+    assert result == "token-1"
+    assert await provider.get_token() == "token-2"
+
+
+async def test_refresh_ahead_failure_keeps_token(
+    clear_account_token_cache, account_token_factory, token_provider_factory
+):
+    provider, _, installations = token_provider_factory(refresh_ahead_seconds=900)
+    installations.create_token.side_effect = [
+        account_token_factory("token-1"),
+        RuntimeError("token endpoint unavailable"),
+    ]
+    await provider.get_token()
+    await provider.get_token()
+
+    await asyncio.gather(*AccountTokenProvider._account_refresh_tasks.values())  # act
+
+    assert provider._account_token_cache.get(provider.cache_key).token == "token-1"
+
+
+async def test_cancel_background_refreshes(clear_account_token_cache, token_provider_factory):
+    provider, _, installations = token_provider_factory(refresh_ahead_seconds=900)
+    await provider.get_token()
+    installations.create_token.side_effect = _wait_forever
+    await provider.get_token()
+    await asyncio.sleep(0)
+    refresh_tasks = list(AccountTokenProvider._account_refresh_tasks.values())
+
+    await AccountTokenProvider.cancel_background_refreshes()  # act
+
+    assert all(refresh_task.cancelled() for refresh_task in refresh_tasks)
+    assert not AccountTokenProvider._account_refresh_tasks
+
+
+async def test_provider_reuses_stored_token(
+    tmp_path, clear_account_token_cache, token_provider_factory
+):
+    token_store = SQLiteAccountTokenStore(tmp_path / "tokens.sqlite3")
+    first_worker, _, _ = token_provider_factory(token_store=token_store)
+    await first_worker.get_token()
+    AccountTokenProvider.clear_cache()
+    second_worker, _, installations = token_provider_factory(token_store=token_store)
+
+    result = await second_worker.get_token()
+
+    assert result == "account-token"
+    installations.create_token.assert_not_awaited()
+
+
+async def test_invalidate_discards_stored_token(
+    tmp_path, clear_account_token_cache, token_provider_factory
+):
+    token_store = SQLiteAccountTokenStore(tmp_path / "tokens.sqlite3")
+    provider, _, _ = token_provider_factory(token_store=token_store)
+    token = await provider.get_token()
+
+    await provider.invalidate(token)
+
+    assert await token_store.load(provider.cache_key) is None
+
+
 def test_build_client_sets_account_authentication(mocker):
     token_provider = mocker.Mock(
         spec=["get_token"], get_token=mocker.AsyncMock(return_value="account-token")
@@ -164,6 +271,7 @@ async def test_auth_flow_retries_once_on_unauthorized(mocker):
     token_provider = mocker.Mock(
         spec=["get_token", "invalidate"],
         get_token=mocker.AsyncMock(side_effect=["revoked-token", "fresh-token"]),
+        invalidate=mocker.AsyncMock(),
     )
     authentication = AccountScopedAuthentication(token_provider)
     auth_flow = authentication.async_auth_flow(
@@ -175,7 +283,7 @@ async def test_auth_flow_retries_once_on_unauthorized(mocker):
 
     assert first_authorization == "Bearer revoked-token"
     assert retried_request.headers["Authorization"] == "Bearer fresh-token"
-    token_provider.invalidate.assert_called_once_with("revoked-token")
+    token_provider.invalidate.assert_awaited_once_with("revoked-token")
     with pytest.raises(StopAsyncIteration):
         await auth_flow.asend(Response(codes.OK))
 
@@ -184,6 +292,7 @@ async def test_auth_flow_retry_resends_streamed_body(mocker):
     token_provider = mocker.Mock(
         spec=["get_token", "invalidate"],
         get_token=mocker.AsyncMock(side_effect=["revoked-token", "fresh-token"]),
+        invalidate=mocker.AsyncMock(),
     )
     received = []
 
@@ -204,6 +313,7 @@ async def test_auth_flow_does_not_retry_on_success(mocker):
     token_provider = mocker.Mock(
         spec=["get_token", "invalidate"],
         get_token=mocker.AsyncMock(return_value="account-token"),
+        invalidate=mocker.AsyncMock(),
     )
     authentication = AccountScopedAuthentication(token_provider)
     auth_flow = authentication.async_auth_flow(
@@ -214,7 +324,11 @@ async def test_auth_flow_does_not_retry_on_success(mocker):
 
     with pytest.raises(StopAsyncIteration):
         await auth_flow.asend(Response(codes.OK))
-    token_provider.invalidate.assert_not_called()
+    token_provider.invalidate.assert_not_awaited()
+
+
+async def _wait_forever(_account_id: str) -> None:
+    await asyncio.Event().wait()
 
 
 async def _stream_chunks() -> AsyncIterator[bytes]:  # ruff:ignore[unused-async]
@@ -0,0 +1,91 @@
+import asyncio
+import datetime as dt
+
+import pytest
+
+from mpt_extension_sdk.models.account import AccountToken
+from mpt_extension_sdk.services.mpt_api_service.account_token_cache import (
+    AccountTokenCache,
+    AccountTokenCacheStats,
+)
+
+ACCOUNT_KEY = ("EXT-1", "ACC-1")
+
+
+@pytest.fixture
+def account_token_factory():
+    def factory(token: str, *, expires_in_seconds: int = 600) -> AccountToken:
+        expires_at = dt.datetime.now(dt.UTC) + dt.timedelta(seconds=expires_in_seconds)
+        return AccountToken(token=token, exp=int(expires_at.timestamp()), expires_at=expires_at)
+
+    return factory
+
+
+def test_put_evicts_least_recently_used(account_token_factory):
+    token_cache = AccountTokenCache(max_entries=2)
+    token_cache.put(ACCOUNT_KEY, account_token_factory("token-1"))
+    token_cache.put(("EXT-1", "ACC-2"), account_token_factory("token-2"))
+    token_cache.get(ACCOUNT_KEY)
+
+    token_cache.put(("EXT-1", "ACC-3"), account_token_factory("token-3"))  # act
+
+    assert token_cache.get(("EXT-1", "ACC-2")) is None
+    assert token_cache.get(ACCOUNT_KEY).token == "token-1"
+    assert token_cache.stats == AccountTokenCacheStats(
+        size=2, max_entries=2, hits=2, misses=1, evictions=1, locks=0
+    )
+
+
+def test_get_drops_expired_token(account_token_factory):
+    token_cache = AccountTokenCache()
+    token_cache.put(ACCOUNT_KEY, account_token_factory("token-1", expires_in_seconds=-1))
+
+    result = token_cache.get(ACCOUNT_KEY)
+
+    assert result is None
+    assert not token_cache
+
+
+def test_peek_does_not_count_lookups(account_token_factory):
+    token_cache = AccountTokenCache()
+    token_cache.put(ACCOUNT_KEY, account_token_factory("token-1"))
+
+    result = [token_cache.peek(ACCOUNT_KEY), token_cache.peek(("EXT-1", "ACC-2"))]
+
+    assert [token and token.token for token in result] == ["token-1", None]
+    assert (token_cache.stats.hits, token_cache.stats.misses) == (0, 0)
+
+
+def test_discard_keeps_replaced_token(account_token_factory):
+    token_cache = AccountTokenCache()
+    token_cache.put(ACCOUNT_KEY, account_token_factory("token-2"))
+
+    token_cache.discard(ACCOUNT_KEY, "token-1")  # act
+
+    assert token_cache.get(ACCOUNT_KEY).token == "token-2"
+
+
+async def test_locked_releases_lock_after_last_user():
+    token_cache = AccountTokenCache()
+    entered = asyncio.Event()
+    release = asyncio.Event()
+
+    async def hold_lock() -> None:  # noqa: WPS430
+        async with token_cache.locked(ACCOUNT_KEY):
+            entered.set()
+            await release.wait()
+
+    holder = asyncio.create_task(hold_lock())
+    await entered.wait()
+    locked_while_held = token_cache.is_locked(ACCOUNT_KEY)
+    release.set()
+    await holder
+
+    assert locked_while_held
+    assert not token_cache.is_locked(ACCOUNT_KEY)
+    assert token_cache.stats.locks == 0
+
+
+def test_max_entries_must_be_positive():
+    with pytest.raises(ValueError, match="max_entries"):
+        AccountTokenCache(max_entries=0)
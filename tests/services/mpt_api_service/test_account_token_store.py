@@ -0,0 +1,79 @@
+import asyncio
+import datetime as dt
+import stat
+
+import pytest
+
+from mpt_extension_sdk.models.account import AccountToken
+from mpt_extension_sdk.services.mpt_api_service.account_token_store import (
+    SQLiteAccountTokenStore,
+)
+
+ACCOUNT_KEY = ("EXT-1", "ACC-1")
+
+
+@pytest.fixture
+def token_store(tmp_path):
+    return SQLiteAccountTokenStore(tmp_path / "tokens.sqlite3")
+
+
+def _account_token(token: str, *, expires_in_seconds: int = 600) -> AccountToken:
+    expires_at = dt.datetime.now(dt.UTC) + dt.timedelta(seconds=expires_in_seconds)
+    return AccountToken.from_payload({"token": token, "exp": int(expires_at.timestamp())})
+
+
+async def test_save_shares_token_between_stores(tmp_path, token_store):
+    await token_store.save(ACCOUNT_KEY, _account_token("token-1"))
+
+    result = await SQLiteAccountTokenStore(tmp_path / "tokens.sqlite3").load(ACCOUNT_KEY)
+
+    assert result.token == "token-1"
+    assert stat.S_IMODE((tmp_path / "tokens.sqlite3").stat().st_mode) == 0o600
+
+
+async def test_save_prunes_expired_tokens(token_store):
+    await token_store.save(("EXT-1", "ACC-2"), _account_token("expired", expires_in_seconds=-1))
+
+    await token_store.save(ACCOUNT_KEY, _account_token("token-1"))  # act
+
+    assert await token_store.load(("EXT-1", "ACC-2")) is None
+
+
+async def test_discard_keeps_replaced_token(token_store):
+    await token_store.save(ACCOUNT_KEY, _account_token("token-2"))
+
+    await token_store.discard(ACCOUNT_KEY, "token-1")  # act
+
+    result = await token_store.load(ACCOUNT_KEY)
+    assert result.token == "token-2"
+
+
+async def test_mint_lock_serializes_account(token_store):
+    events = []
+
+    async def mint(name: str) -> None:  # noqa: WPS430
+        async with token_store.mint_lock(ACCOUNT_KEY):
+            events.append(("start", name))
+            await asyncio.sleep(0.01)
+            events.append(("end", name))
+
+    await asyncio.gather(mint("first"), mint("second"))  # act
+
+    assert [event[0] for event in events] == ["start", "end", "start", "end"]
+
+
+async def test_cancelled_mint_lock_wait_releases_slot(token_store):
+    async with token_store.mint_lock(ACCOUNT_KEY):
+        waiter = asyncio.create_task(_hold_mint_lock(token_store))
+        await asyncio.sleep(0.05)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+
+    await asyncio.wait_for(_hold_mint_lock(token_store), timeout=1)  # act
+
+    assert waiter.cancelled()
+
+
+async def _hold_mint_lock(token_store: SQLiteAccountTokenStore) -> None:
+    async with token_store.mint_lock(ACCOUNT_KEY):
+        await asyncio.sleep(0)
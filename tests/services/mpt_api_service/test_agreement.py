@@ -1,17 +1,24 @@
+import asyncio
 from collections.abc import Callable
 
 import pytest
+from mpt_api_client import RQLQuery
 from mpt_api_client.resources.commerce.agreements import AsyncAgreementsService
 
+from mpt_extension_sdk.models import Agreement
 from mpt_extension_sdk.services.mpt_api_service.agreement import AgreementService
+from mpt_extension_sdk.services.mpt_api_service.base import PaginatedCollection
+from mpt_extension_sdk.services.mpt_api_service.entity_cache import EntityCache
+from mpt_extension_sdk.services.mpt_api_service.projection import ProjectionProfile
 
 
 @pytest.fixture
 def agreement_service_factory(mocker, async_mpt_client):
-    def factory():
+    def factory(cache=None, *, coalesce_reads=False):
         agreements_service = mocker.Mock(spec=AsyncAgreementsService)
         async_mpt_client.commerce.agreements = agreements_service
-        return AgreementService(async_mpt_client), agreements_service
+        service = AgreementService(async_mpt_client, cache=cache, coalesce_reads=coalesce_reads)
+        return service, agreements_service
 
     return factory
 
@@ -54,3 +61,93 @@ async def test_update_calls_agreement_update(mocker, agreement_service_factory):
     await service.update("AGR-1", {"status": "processing"})  # act
 
     agreement_client.update.assert_awaited_once_with("AGR-1", {"status": "processing"})
+
+
+async def test_get_all_applies_filter(mocker, agreement_service_factory):
+    service, agreements_client = agreement_service_factory()
+    rql_filter = RQLQuery(status="Active")
+    paginate = mocker.patch.object(service, "_paginate", autospec=True, return_value="page")
+
+    result = await service.get_all(offset=10, limit=5, rql_filter=rql_filter)
+
+    assert result == "page"
+    agreements_client.filter.assert_called_once_with(rql_filter)
+    paginate.assert_awaited_once_with(
+        agreements_client.filter.return_value, Agreement, offset=10, limit=5
+    )
+
+
+async def test_iter_all_streams_agreements(mocker, agreement_service_factory):
+    service, _ = agreement_service_factory()
+    rql_filter = RQLQuery(status="Active")
+    get_all = mocker.patch.object(
+        service,
+        "get_all",
+        autospec=True,
+        side_effect=[
+            PaginatedCollection(limit=2, offset=0, resources=["AGR-1", "AGR-2"], total=3),
+            PaginatedCollection(limit=2, offset=2, resources=["AGR-3"], total=3),
+        ],
+    )
+
+    result = [agreement async for agreement in service.iter_all(rql_filter, page_size=2)]
+
+    assert result == ["AGR-1", "AGR-2", "AGR-3"]
+    assert get_all.await_args_list == [
+        mocker.call(offset=0, limit=2, rql_filter=rql_filter),
+        mocker.call(offset=2, limit=2, rql_filter=rql_filter),
+    ]
+
+
+async def test_get_by_id_reads_through_cache(mocker, agreement_service_factory):
+    cache = EntityCache(ttl_seconds=30, max_entries=8)
+    service, agreements_client = agreement_service_factory(cache)
+    agreements_client.get = mocker.AsyncMock(
+        spec=Callable, return_value=mocker.Mock(spec=["to_dict"])
+    )
+    mocker.patch(
+        "mpt_extension_sdk.services.mpt_api_service.agreement.Agreement.from_payload",
+        autospec=True,
+        return_value="agreement-model",
+    )
+    await service.get_by_id("AGR-1")
+
+    await service.update("AGR-1", {"status": "processing"})  # act
+
+    assert await service.get_by_id("AGR-1") == "agreement-model"
+    assert agreements_client.get.await_count == 2
+
+
+async def test_get_by_id_coalesces_concurrent_reads(mocker, agreement_service_factory):
+    service, agreements_client = agreement_service_factory(coalesce_reads=True)
+    agreements_client.get = mocker.AsyncMock(
+        spec=Callable, return_value=mocker.Mock(spec=["to_dict"])
+    )
+    mocker.patch(
+        "mpt_extension_sdk.services.mpt_api_service.agreement.Agreement.from_payload",
+        autospec=True,
+        side_effect=lambda _payload: object(),
+    )
+
+    result = await asyncio.gather(service.get_by_id("AGR-1"), service.get_by_id("AGR-1"))
+
+    assert result[0] is not result[1]
+    agreements_client.get.assert_awaited_once()
+
+
+async def test_get_by_id_minimal_projection(mocker, agreement_service_factory):
+    service, agreements_client = agreement_service_factory()
+    agreements_client.get = mocker.AsyncMock(
+        spec=Callable, return_value=mocker.Mock(spec=["to_dict"])
+    )
+    mocker.patch(
+        "mpt_extension_sdk.services.mpt_api_service.agreement.Agreement.from_payload",
+        autospec=True,
+        return_value="agreement-model",
+    )
+
+    await service.get_by_id("AGR-1", ProjectionProfile.MINIMAL)  # act
+
+    agreements_client.get.assert_awaited_once_with(
+        "AGR-1", select=["client", "licensee", "product"]
+    )
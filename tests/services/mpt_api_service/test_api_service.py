@@ -1,7 +1,44 @@
+import dataclasses
+
+import pytest
 from mpt_api_client import AsyncMPTClient
 
-from mpt_extension_sdk.api.auth import AuthContext
+from mpt_extension_sdk.api.auth import Account, AccountType, AuthContext
 from mpt_extension_sdk.services.mpt_api_service.api_service import MPTAPIService
+from mpt_extension_sdk.services.mpt_api_service.client_registry import (
+    SharedPoolTransport,
+    get_account_client_registry,
+)
+from mpt_extension_sdk.services.mpt_api_service.http_settings import HTTPClientSettings
+from mpt_extension_sdk.services.mpt_api_service.rate_limit import RateLimiter
+from mpt_extension_sdk.services.mpt_api_service.template import (
+    TemplateService,
+    get_product_template_cache,
+)
+
+
+@pytest.fixture
+def clear_account_client_registry(mocker, runtime_settings):
+    mocker.patch(
+        "mpt_extension_sdk.services.mpt_api_service.client_registry.get_runtime_settings",
+        autospec=True,
+        return_value=runtime_settings,
+    )
+    get_account_client_registry.cache_clear()
+    yield
+    get_account_client_registry.cache_clear()
+
+
+@pytest.fixture
+def account_auth_factory(mocker):
+    def factory(account_id="ACC-1"):
+        return mocker.Mock(
+            spec=AuthContext,
+            extension_id="EXT-1",
+            account=Account(id=account_id, type=AccountType.CLIENT),
+        )
+
+    return factory
 
 
 def test_api_service_composes_expected_services(mocker):  # noqa: WPS218
@@ -37,8 +74,10 @@ def test_api_service_from_config(mocker):
     assert result.client is client
 
 
-async def test_from_auth_context_uses_account_client(mocker, runtime_settings):  # noqa: WPS210
-    auth = mocker.Mock(spec=AuthContext)
+async def test_from_auth_context_uses_account_client(  # noqa: WPS210
+    mocker, runtime_settings, clear_account_client_registry, account_auth_factory
+):
+    auth = account_auth_factory()
     client = mocker.AsyncMock(spec=AsyncMPTClient)
     get_runtime_settings = mocker.patch(
         "mpt_extension_sdk.services.mpt_api_service.api_service.get_runtime_settings",
@@ -46,11 +85,11 @@ async def test_from_auth_context_uses_account_client(mocker, runtime_settings):
         return_value=runtime_settings,
     )
     token_provider = mocker.patch(
-        "mpt_extension_sdk.services.mpt_api_service.api_service.AccountTokenProvider",
+        "mpt_extension_sdk.services.mpt_api_service.account_scoped_client.AccountTokenProvider",
         autospec=True,
     )
     build_account_scoped_mpt_client = mocker.patch(
-        "mpt_extension_sdk.services.mpt_api_service.api_service.build_account_scoped_mpt_client",
+        "mpt_extension_sdk.services.mpt_api_service.account_scoped_client.build_account_scoped_mpt_client",
         autospec=True,
         return_value=client,
     )
@@ -61,9 +100,159 @@ async def test_from_auth_context_uses_account_client(mocker, runtime_settings):
     assert result.client is client
     get_runtime_settings.assert_called_once_with()
     token_provider.assert_called_once_with(
-        runtime_settings=runtime_settings, auth=auth, service_type=MPTAPIService
+        runtime_settings=runtime_settings,
+        auth=auth,
+        service_type=MPTAPIService,
+        refresh_ahead_seconds=0,
+        token_store=None,
     )
     build_account_scoped_mpt_client.assert_called_once_with(
         base_url="https://api.example.com",
         token_provider=token_provider.return_value,
+        transport=mocker.ANY,
+        rate_limiter=mocker.ANY,
+        retry_policy=None,
+        http_settings=HTTPClientSettings(),
+    )
+    assert isinstance(
+        build_account_scoped_mpt_client.call_args.kwargs["transport"], SharedPoolTransport
     )
+    assert isinstance(build_account_scoped_mpt_client.call_args.kwargs["rate_limiter"], RateLimiter)
+
+
+async def test_from_auth_context_reuses_account_client(
+    mocker, runtime_settings, clear_account_client_registry, account_auth_factory
+):
+    mocker.patch(
+        "mpt_extension_sdk.services.mpt_api_service.api_service.get_runtime_settings",
+        autospec=True,
+        return_value=runtime_settings,
+    )
+    build_account_scoped_mpt_client = mocker.patch(
+        "mpt_extension_sdk.services.mpt_api_service.account_scoped_client.build_account_scoped_mpt_client",
+        autospec=True,
+        side_effect=lambda **_kwargs: mocker.AsyncMock(spec=AsyncMPTClient),
+    )
+
+    result = [
+        await MPTAPIService.from_auth_context("https://api.example.com", account_auth_factory()),
+        await MPTAPIService.from_auth_context("https://api.example.com", account_auth_factory()),
+        await MPTAPIService.from_auth_context(
+            "https://api.example.com", account_auth_factory("ACC-2")
+        ),
+    ]
+
+    assert result[0].client is result[1].client
+    assert result[2].client is not result[0].client
+    assert build_account_scoped_mpt_client.call_count == 2
+
+
+async def test_close_account_clients_closes_registry(mocker, clear_account_client_registry):
+    aclose = mocker.patch.object(get_account_client_registry(), "aclose", autospec=True)
+
+    await MPTAPIService.close_account_clients()  # act
+
+    aclose.assert_awaited_once_with()
+
+
+async def test_from_auth_context_binds_entity_caches(
+    mocker, runtime_settings, clear_account_client_registry, account_auth_factory
+):
+    mocker.patch(
+        "mpt_extension_sdk.services.mpt_api_service.api_service.get_runtime_settings",
+        autospec=True,
+        return_value=dataclasses.replace(runtime_settings, entity_cache_ttl_seconds=30),
+    )
+    mocker.patch(
+        "mpt_extension_sdk.services.mpt_api_service.account_scoped_client.build_account_scoped_mpt_client",
+        autospec=True,
+        return_value=mocker.AsyncMock(spec=AsyncMPTClient),
+    )
+
+    result = [
+        await MPTAPIService.from_auth_context("https://api.example.com", account_auth_factory()),
+        await MPTAPIService.from_auth_context("https://api.example.com", account_auth_factory()),
+    ]
+
+    assert result[0].orders._cache is not None
+    assert result[0].orders._cache is result[1].orders._cache
+    assert result[0].agreements._cache is result[1].agreements._cache
+
+
+async def test_from_auth_context_coalesces_reads(
+    mocker, runtime_settings, clear_account_client_registry, account_auth_factory
+):
+    mocker.patch(
+        "mpt_extension_sdk.services.mpt_api_service.api_service.get_runtime_settings",
+        autospec=True,
+        return_value=dataclasses.replace(runtime_settings, coalesced_read_services=["orders"]),
+    )
+    mocker.patch(
+        "mpt_extension_sdk.services.mpt_api_service.account_scoped_client.build_account_scoped_mpt_client",
+        autospec=True,
+        return_value=mocker.AsyncMock(spec=AsyncMPTClient),
+    )
+
+    result = await MPTAPIService.from_auth_context(
+        "https://api.example.com", account_auth_factory()
+    )
+
+    assert result.orders._coalesce_reads
+    assert not result.agreements._coalesce_reads
+
+
+async def test_from_auth_context_uses_template_cache(
+    mocker, runtime_settings, clear_account_client_registry, account_auth_factory
+):
+    mocker.patch(
+        "mpt_extension_sdk.services.mpt_api_service.api_service.get_runtime_settings",
+        autospec=True,
+        return_value=dataclasses.replace(runtime_settings, template_cache_ttl_seconds=300),
+    )
+    mocker.patch(
+        "mpt_extension_sdk.services.mpt_api_service.account_scoped_client.build_account_scoped_mpt_client",
+        autospec=True,
+        return_value=mocker.AsyncMock(spec=AsyncMPTClient),
+    )
+
+    result = await MPTAPIService.from_auth_context(
+        "https://api.example.com", account_auth_factory()
+    )
+
+    assert result.templates._product_cache is get_product_template_cache(300)
+
+
+async def test_warm_up_caches_loads_product_templates(mocker, runtime_settings):
+    mocker.patch(
+        "mpt_extension_sdk.services.mpt_api_service.api_service.get_runtime_settings",
+        autospec=True,
+        return_value=dataclasses.replace(runtime_settings, template_cache_ttl_seconds=300),
+    )
+    mocker.patch(
+        "mpt_extension_sdk.services.mpt_api_service.template.get_extension_settings",
+        autospec=True,
+        return_value=mocker.Mock(product_ids=("PROD-1",)),
+    )
+    mocker.patch(
+        "mpt_extension_sdk.services.mpt_api_service.template.build_extension_mpt_client",
+        autospec=True,
+        return_value=mocker.Mock(spec=AsyncMPTClient),
+    )
+    warm_up = mocker.patch.object(TemplateService, "warm_up", autospec=True)
+
+    await MPTAPIService.warm_up_caches()  # act
+
+    warm_up.assert_awaited_once_with(mocker.ANY, ("PROD-1",))
+
+
+async def test_warm_up_caches_skips_disabled_cache(mocker, runtime_settings):
+    mocker.patch(
+        "mpt_extension_sdk.services.mpt_api_service.api_service.get_runtime_settings",
+        autospec=True,
+        return_value=runtime_settings,
+    )
+    warm_up = mocker.patch.object(TemplateService, "warm_up", autospec=True)
+
+    await MPTAPIService.warm_up_caches()  # act
+
+    warm_up.assert_not_called()
@@ -3,11 +3,12 @@ from collections.abc import Callable
 import pytest
 
 from mpt_extension_sdk.services.mpt_api_service.asset import AssetService
+from mpt_extension_sdk.services.mpt_api_service.entity_cache import EntityCache
 
 
 @pytest.fixture
 def asset_client_mock(mocker, async_mpt_client):
-    def factory():
+    def factory(order_cache=None):
         asset_client = mocker.Mock(spec=["create", "update", "get"])
         order_asset_client = mocker.Mock(spec=["create"])
         async_mpt_client.commerce.assets = asset_client
@@ -15,7 +16,8 @@ def asset_client_mock(mocker, async_mpt_client):
             spec=Callable,
             return_value=order_asset_client,
         )
-        return AssetService(async_mpt_client), asset_client, order_asset_client
+        service = AssetService(async_mpt_client, order_cache=order_cache)
+        return service, asset_client, order_asset_client
 
     return factory
 
@@ -69,3 +71,18 @@ async def test_update(mocker, asset_client_mock):
     assert result == "asset-model"
     asset_client.update.assert_awaited_once_with("AST-1", {"description": "fake"})
     from_payload.assert_called_once_with(api_asset)
+
+
+async def test_create_order_asset_drops_order(mocker, asset_client_mock):
+    order_cache = mocker.Mock(spec=EntityCache)
+    service, _, order_asset_client = asset_client_mock(order_cache)
+    order_asset_client.create = mocker.AsyncMock(spec=Callable, return_value=mocker.Mock())
+    mocker.patch(
+        "mpt_extension_sdk.services.mpt_api_service.asset.Asset.from_payload",
+        autospec=True,
+        return_value="asset-model",
+    )
+
+    await service.create_order_asset("ORD-1", {"name": "AST-1"})  # act
+
+    order_cache.invalidate.assert_called_once_with("ORD-1")
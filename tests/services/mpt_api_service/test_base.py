@@ -1,8 +1,16 @@
+import asyncio
 from dataclasses import dataclass
 
+import pytest
+
+from mpt_extension_sdk.errors.runtime import PartialFetchError
 from mpt_extension_sdk.models.base import BaseModel
 from mpt_extension_sdk.services.api_client_v2.mpt_api_client import AsyncMPTClient
-from mpt_extension_sdk.services.mpt_api_service.base import BaseService
+from mpt_extension_sdk.services.mpt_api_service.base import (
+    BaseService,
+    BatchedReadService,
+    PaginatedCollection,
+)
 
 
 class FakeModel(BaseModel):
@@ -15,6 +23,18 @@ class FakeService(BaseService[FakeModel]):
     """Fake service exposing base pagination for tests."""
 
 
+class FakeBatchedService(BatchedReadService[FakeModel]):
+    """Fake service fetching entities in batches."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.batches = []
+
+    async def _fetch_many(self, entity_ids):
+        self.batches.append(entity_ids)
+        return [FakeModel(id=entity_id) for entity_id in entity_ids]
+
+
 @dataclass
 class FakePagination:
     limit: int
@@ -78,3 +98,240 @@ async def test_paginate_falls_back_when_meta_missing(mocker):
     assert result.limit == 2
     assert result.resources == [{"payload": "one"}, {"payload": "two"}]
     assert result.total == 6
+
+
+@pytest.fixture
+def fake_service(mocker):
+    return FakeService(mocker.Mock(spec=AsyncMPTClient))
+
+
+@pytest.fixture
+def page_fetcher_factory(mocker):
+    def factory(total, *, page_limit=None):
+        async def fetch_page(*, offset, limit):  # noqa: WPS430
+            await asyncio.sleep(0)
+            effective_limit = page_limit or limit
+            return PaginatedCollection(
+                limit=effective_limit,
+                offset=offset,
+                resources=list(range(offset, min(offset + effective_limit, total))),
+                total=total,
+            )
+
+        return mocker.AsyncMock(side_effect=fetch_page)
+
+    return factory
+
+
+async def test_iterate_yields_all_pages(mocker, fake_service, page_fetcher_factory):
+    fetch_page = page_fetcher_factory(5)
+
+    result = [resource async for resource in fake_service._iterate(fetch_page, page_size=2)]
+
+    assert result == [0, 1, 2, 3, 4]
+    assert fetch_page.await_args_list == [
+        mocker.call(offset=0, limit=2),
+        mocker.call(offset=2, limit=2),
+        mocker.call(offset=4, limit=2),
+    ]
+
+
+async def test_iterate_prefetches_next_pages(fake_service, page_fetcher_factory):
+    fetch_page = page_fetcher_factory(10)
+    resources = fake_service._iterate(fetch_page, page_size=2, prefetch_pages=2)
+
+    result = await anext(resources)
+
+    await asyncio.sleep(0)
+    assert result == 0
+    assert fetch_page.await_count == 3
+    await resources.aclose()
+
+
+async def test_iterate_follows_reported_limit(fake_service, page_fetcher_factory):
+    fetch_page = page_fetcher_factory(3, page_limit=2)
+
+    result = [resource async for resource in fake_service._iterate(fetch_page, page_size=50)]
+
+    assert result == [0, 1, 2]
+    fetch_page.assert_awaited_with(offset=2, limit=2)
+
+
+async def test_iterate_cancels_prefetch_on_close(fake_service):
+    resources = fake_service._iterate(_fetch_first_page_only, page_size=1)
+    await anext(resources)
+    await asyncio.sleep(0)
+
+    await resources.aclose()
+
+    assert asyncio.all_tasks() == {asyncio.current_task()}
+
+
+async def test_iterate_stops_on_empty_page(fake_service, page_fetcher_factory):
+    fetch_page = page_fetcher_factory(0)
+
+    result = [resource async for resource in fake_service._iterate(fetch_page)]
+
+    assert not result
+    fetch_page.assert_awaited_once_with(offset=0, limit=100)
+
+
+async def test_iterate_rejects_invalid_window(fake_service, page_fetcher_factory):
+    resources = fake_service._iterate(page_fetcher_factory(1), prefetch_pages=0)
+
+    with pytest.raises(ValueError, match="prefetch_pages"):
+        await anext(resources)
+
+
+async def test_iterate_caps_requests_in_flight(fake_service):
+    in_flight = []
+    peak = []
+
+    async def fetch_page(*, offset, limit):  # noqa: WPS430
+        in_flight.append(offset)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0)
+        in_flight.remove(offset)
+        return PaginatedCollection(limit=limit, offset=offset, resources=[offset], total=10)
+
+    resources = fake_service._iterate(fetch_page, page_size=1, prefetch_pages=3)
+
+    result = [resource async for resource in resources]
+
+    assert result == list(range(10))
+    assert max(peak) == 3
+
+
+async def test_iterate_unordered_yields_on_arrival(fake_service):
+    release_second_page = asyncio.Event()
+
+    async def fetch_page(*, offset, limit):  # noqa: WPS430
+        if offset == 1:
+            await release_second_page.wait()
+        return PaginatedCollection(limit=limit, offset=offset, resources=[offset], total=4)
+
+    resources = fake_service._iterate(fetch_page, page_size=1, prefetch_pages=3, ordered=False)
+    arrived = [await anext(resources) for _ in range(3)]  # noqa: WPS476
+    release_second_page.set()
+
+    result = arrived + [resource async for resource in resources]
+
+    assert result == [0, 2, 3, 1]
+
+
+async def test_coalesced_read_disabled_by_default(mocker, fake_service):
+    read = mocker.AsyncMock(return_value="payload")
+
+    await asyncio.gather(  # act
+        fake_service._coalesced_read(("commerce.orders", "ORD-1"), read),
+        fake_service._coalesced_read(("commerce.orders", "ORD-1"), read),
+    )
+
+    assert read.await_count == 2
+
+
+async def test_coalesced_read_shares_identical_reads(mocker):
+    client = mocker.Mock(spec=AsyncMPTClient)
+    services = [FakeService(client, coalesce_reads=True) for _ in range(2)]
+    read = mocker.AsyncMock(return_value="payload")
+
+    result = await asyncio.gather(*[
+        service._coalesced_read(("commerce.orders", "ORD-1"), read) for service in services
+    ])
+
+    assert result == ["payload", "payload"]
+    read.assert_awaited_once_with()
+
+
+async def test_load_by_id_uses_batch_fetch(mocker):
+    batch_fetch = mocker.AsyncMock(return_value=[FakeModel(id="ID-1")])
+    service = FakeService(mocker.Mock(spec=AsyncMPTClient), batch_fetch=batch_fetch)
+
+    result = await service._load_by_id("ID-1", mocker.AsyncMock())
+
+    assert result == FakeModel(id="ID-1")
+    batch_fetch.assert_awaited_once_with(["ID-1"])
+
+
+async def test_fetch_by_ids_filters_collection(mocker, fake_service):
+    collection = mocker.Mock(spec=["filter"])
+    paginate = mocker.patch.object(
+        fake_service,
+        "_paginate",
+        autospec=True,
+        return_value=PaginatedCollection(limit=2, offset=0, resources=["one", "two"], total=2),
+    )
+
+    result = await fake_service._fetch_by_ids(collection, FakeModel, ["ID-1", "ID-2"])
+
+    assert result == ["one", "two"]
+    assert str(collection.filter.call_args.args[0]) == "in(id,('ID-1','ID-2'))"
+    paginate.assert_awaited_once_with(collection.filter.return_value, FakeModel, limit=2)
+
+
+async def test_load_by_id_uses_batch_loader(mocker):
+    service = FakeBatchedService(mocker.Mock(spec=AsyncMPTClient), batch_reads=True)
+    fetch = mocker.AsyncMock()
+
+    result = await asyncio.gather(
+        service._load_by_id("ID-1", fetch), service._load_by_id("ID-2", fetch)
+    )
+
+    assert result == [FakeModel(id="ID-1"), FakeModel(id="ID-2")]
+    assert service.batches == [["ID-1", "ID-2"]]
+    fetch.assert_not_awaited()
+
+
+async def test_fetch_in_chunks_keeps_chunk_order(fake_service):
+    in_flight = []
+    peak = []
+
+    async def fetch_chunk(chunk_ids):  # noqa: WPS430
+        in_flight.append(chunk_ids)
+        peak.append(len(in_flight))
+        for _ in range(5 - len(chunk_ids)):
+            await asyncio.sleep(0)  # noqa: WPS476
+        in_flight.remove(chunk_ids)
+        return chunk_ids
+
+    item_ids = [f"ID-{index}" for index in range(5)]
+
+    result = await fake_service._fetch_in_chunks(item_ids, fetch_chunk, chunk_size=2, concurrency=2)
+
+    assert result == item_ids
+    assert max(peak) == 2
+
+
+async def test_fetch_in_chunks_reports_failed_chunks(fake_service):
+    async def fetch_chunk(chunk_ids):  # noqa: WPS430
+        await asyncio.sleep(0)
+        if "ID-2" in chunk_ids:
+            raise RuntimeError("boom")
+        return chunk_ids
+
+    with pytest.raises(PartialFetchError, match="2 of 5") as error:
+        await fake_service._fetch_in_chunks(
+            ["ID-0", "ID-1", "ID-2", "ID-3", "ID-4"], fetch_chunk, chunk_size=2
+        )
+
+    assert error.value.resources == ["ID-0", "ID-1", "ID-4"]
+    assert error.value.failed_ids == ["ID-2", "ID-3"]
+    assert [str(chunk_error) for chunk_error in error.value.errors] == ["boom"]
+
+
+async def test_fetch_in_chunks_reraises_when_all_fail(mocker, fake_service):
+    fetch_chunk = mocker.AsyncMock(side_effect=RuntimeError("boom"))
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await fake_service._fetch_in_chunks(["ID-0", "ID-1", "ID-2"], fetch_chunk, chunk_size=2)
+
+
+async def test_fetch_in_chunks_rejects_invalid_limits(mocker, fake_service):
+    with pytest.raises(ValueError, match="concurrency"):
+        await fake_service._fetch_in_chunks(["ID-1"], mocker.AsyncMock(), concurrency=0)
+
+
+async def _fetch_first_page_only(*, offset, limit):
+    if offset:
+        await asyncio.Future()
+    return PaginatedCollection(limit=limit, offset=offset, resources=["one"], total=2)
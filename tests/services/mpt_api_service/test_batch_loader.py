@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+from mpt_api_client.exceptions import MPTHttpError
+
+from mpt_extension_sdk.models.base import BaseModel
+from mpt_extension_sdk.services.mpt_api_service.batch_loader import BatchLoader
+
+
+class FakeEntity(BaseModel):
+    id: str
+
+
+@pytest.fixture
+def fetch_many(mocker):
+    async def fetch(entity_ids):  # noqa: WPS430
+        await asyncio.sleep(0)
+        return [FakeEntity(id=entity_id) for entity_id in entity_ids if entity_id != "MISSING"]
+
+    return mocker.AsyncMock(side_effect=fetch)
+
+
+async def test_load_batches_same_tick(mocker, fetch_many):
+    loader = BatchLoader(fetch_many)
+    loads = [loader.load(entity_id) for entity_id in ("SUB-1", "SUB-2", "SUB-1")]
+
+    result = await asyncio.gather(*loads)
+
+    assert [entity.id for entity in result] == ["SUB-1", "SUB-2", "SUB-1"]
+    fetch_many.assert_awaited_once_with(["SUB-1", "SUB-2"])
+
+
+async def test_load_splits_batches_into_chunks(mocker, fetch_many):
+    loader = BatchLoader(fetch_many, max_batch_size=2)
+
+    loads = [loader.load(entity_id) for entity_id in ("SUB-0", "SUB-1", "SUB-2")]
+    await asyncio.gather(*loads)  # act
+
+    assert fetch_many.await_args_list == [
+        mocker.call(["SUB-0", "SUB-1"]),
+        mocker.call(["SUB-2"]),
+    ]
+
+
+async def test_load_separate_ticks_separately(fetch_many):
+    loader = BatchLoader(fetch_many)
+    await loader.load("SUB-1")
+
+    await loader.load("SUB-2")  # act
+
+    assert fetch_many.await_count == 2
+
+
+async def test_load_raises_not_found_for_missing(fetch_many):
+    loader = BatchLoader(fetch_many)
+
+    result = await asyncio.gather(
+        loader.load("SUB-1"), loader.load("MISSING"), return_exceptions=True
+    )
+
+    assert result[0].id == "SUB-1"
+    assert isinstance(result[1], MPTHttpError)
+    assert result[1].status_code == 404
+
+
+async def test_load_propagates_batch_errors(mocker):
+    loader = BatchLoader(mocker.AsyncMock(side_effect=RuntimeError("boom")))
+
+    result = await asyncio.gather(
+        loader.load("SUB-1"), loader.load("SUB-2"), return_exceptions=True
+    )
+
+    assert [str(error) for error in result] == ["boom", "boom"]
+
+
+def test_loader_rejects_invalid_batch_size(fetch_many):
+    with pytest.raises(ValueError, match="max_batch_size"):
+        BatchLoader(fetch_many, max_batch_size=0)
@@ -1,7 +1,25 @@
 import pytest
+from httpx import MockTransport, Response, Timeout, codes
+from httpx_retries import RetryTransport
 from mpt_api_client import AsyncMPTClient
+from mpt_api_client.auth import BearerTokenAuthentication
+from mpt_api_client.http import TransportSettings
+from mpt_api_client.http.async_client import AsyncHTTPClient
 
-from mpt_extension_sdk.services.mpt_api_service.client_factory import build_mpt_client
+from mpt_extension_sdk.services.mpt_api_service.client_factory import (
+    build_extension_mpt_client,
+    build_http_client,
+    build_mpt_client,
+)
+from mpt_extension_sdk.services.mpt_api_service.http_settings import HTTPClientSettings
+from mpt_extension_sdk.services.mpt_api_service.rate_limit import (
+    RateLimiter,
+    get_extension_rate_limiter,
+)
+from mpt_extension_sdk.services.mpt_api_service.retry_policy import (
+    BackoffRetryTransport,
+    RetryPolicy,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -31,3 +49,111 @@ def test_build_mpt_client_uses_bearer_auth(mocker):
         base_url="https://api.example.com",
         authentication=authentication.return_value,
     )
+
+
+def test_build_extension_mpt_client(mocker, runtime_settings):
+    build_client = mocker.patch(
+        "mpt_extension_sdk.services.mpt_api_service.client_factory.build_mpt_client",
+        autospec=True,
+    )
+
+    result = build_extension_mpt_client(runtime_settings)
+
+    assert result is build_client.return_value
+    build_client.assert_called_once_with(
+        base_url=runtime_settings.mpt_api_base_url,
+        api_token=runtime_settings.ext_api_key,
+        retry_policy=None,
+        http_settings=HTTPClientSettings(),
+        rate_limiter=get_extension_rate_limiter(runtime_settings),
+    )
+
+
+def test_build_mpt_client_uses_rate_limiter(mocker):
+    http_client = mocker.patch(
+        "mpt_extension_sdk.services.mpt_api_service.client_factory.build_http_client",
+        autospec=True,
+    )
+    rate_limiter = RateLimiter()
+
+    build_mpt_client("https://api.example.com", "token-1", rate_limiter=rate_limiter)  # act
+
+    assert http_client.call_args.kwargs["rate_limiter"] is rate_limiter
+
+
+def test_build_http_client_keeps_own_pool():
+    result = build_http_client(
+        TransportSettings(base_url="https://api.example.com"),
+        authentication=BearerTokenAuthentication("token-1"),
+    )
+
+    assert isinstance(result.httpx_client._transport, RetryTransport)
+
+
+async def test_build_http_client_uses_transport():
+    transport = MockTransport(lambda request: Response(codes.OK, json={"id": "ORD-1"}))
+    http_client = build_http_client(
+        TransportSettings(base_url="https://api.example.com", timeout=5.0),
+        authentication=BearerTokenAuthentication("token-1"),
+        transport=transport,
+    )
+
+    result = await http_client.request("GET", "/public/v1/commerce/orders/ORD-1")
+
+    assert result.json() == {"id": "ORD-1"}
+    assert http_client.httpx_client.timeout == Timeout(5)
+    assert http_client.httpx_client.headers["User-Agent"] == "swo-marketplace-client/1.0"
+
+
+def test_build_http_client_skips_upstream_pool(mocker):
+    upstream_init = mocker.spy(AsyncHTTPClient, "__init__")
+    transport = MockTransport(lambda request: Response(codes.OK))
+
+    result = build_http_client(
+        TransportSettings(base_url="https://api.example.com"),
+        authentication=BearerTokenAuthentication("token-1"),
+        transport=transport,
+    )
+
+    upstream_init.assert_not_called()
+    assert result.httpx_client._transport._async_transport is transport
+
+
+async def test_build_http_client_rate_limits_retries(mocker):
+    responses = iter([
+        Response(codes.TOO_MANY_REQUESTS, headers={"Retry-After": "0"}),
+        Response(codes.OK, json={"id": "ORD-1"}),
+    ])
+    rate_limiter = RateLimiter(sleep=mocker.AsyncMock())
+    http_client = build_http_client(
+        TransportSettings(base_url="https://api.example.com"),
+        authentication=BearerTokenAuthentication("token-1"),
+        transport=MockTransport(lambda request: next(responses)),
+        rate_limiter=rate_limiter,
+    )
+
+    result = await http_client.request("GET", "/public/v1/commerce/orders/ORD-1")
+
+    assert result.json() == {"id": "ORD-1"}
+    assert (rate_limiter.stats.requests, rate_limiter.stats.throttled_responses) == (2, 1)
+
+
+def test_build_http_client_uses_retry_policy():
+    result = build_http_client(
+        TransportSettings(base_url="https://api.example.com"),
+        authentication=BearerTokenAuthentication("token-1"),
+        retry_policy=RetryPolicy(),
+    )
+
+    assert isinstance(result.httpx_client._transport, BackoffRetryTransport)
+
+
+def test_build_http_client_uses_http_settings():
+    result = build_http_client(
+        TransportSettings(base_url="https://api.example.com"),
+        authentication=BearerTokenAuthentication("token-1"),
+        http_settings=HTTPClientSettings(connect_timeout_seconds=3, read_timeout_seconds=30),
+    )
+
+    assert result.httpx_client.timeout == Timeout(30, connect=3)
+    assert isinstance(result.httpx_client._transport, RetryTransport)
@@ -0,0 +1,142 @@
+import dataclasses
+
+import pytest
+from httpx import AsyncBaseTransport, Request, Response, codes
+from mpt_api_client import AsyncMPTClient
+
+from mpt_extension_sdk.services.mpt_api_service.client_registry import (
+    AccountClientRegistry,
+    SharedPoolTransport,
+    get_account_client_registry,
+)
+
+
+@pytest.fixture
+def pool(mocker):
+    return mocker.AsyncMock(spec=AsyncBaseTransport)
+
+
+@pytest.fixture
+def client_factory(mocker):
+    return mocker.Mock(side_effect=lambda _transport: mocker.Mock(spec=AsyncMPTClient))
+
+
+@pytest.fixture
+def monotonic(mocker):
+    return mocker.patch(
+        "mpt_extension_sdk.services.mpt_api_service.client_registry.time.monotonic",
+        autospec=True,
+        return_value=100.0,
+    )
+
+
+def test_registry_reuses_client_per_key(pool, client_factory, monotonic):
+    registry = AccountClientRegistry(pool_factory=lambda: pool)
+
+    result = [
+        registry.get_client(("https://api.example.com", "EXT-1", "ACC-1"), client_factory),
+        registry.get_client(("https://api.example.com", "EXT-1", "ACC-1"), client_factory),
+    ]
+
+    assert result[0] is result[1]
+    client_factory.assert_called_once()
+    assert isinstance(client_factory.call_args.args[0], SharedPoolTransport)
+
+
+def test_registry_shares_pool_across_accounts(mocker, pool, client_factory, monotonic):
+    pool_factory = mocker.Mock(return_value=pool)
+    registry = AccountClientRegistry(pool_factory=pool_factory)
+
+    result = [
+        registry.get_client(("https://api.example.com", "EXT-1", "ACC-1"), client_factory),
+        registry.get_client(("https://api.example.com", "EXT-1", "ACC-2"), client_factory),
+    ]
+
+    assert result[0] is not result[1]
+    pool_factory.assert_called_once_with()
+    assert len(registry) == 2
+
+
+def test_registry_evicts_least_recently_used(pool, client_factory, monotonic):
+    registry = AccountClientRegistry(max_clients=2, pool_factory=lambda: pool)
+    first = registry.get_client(("url", "EXT-1", "ACC-1"), client_factory)
+    registry.get_client(("url", "EXT-1", "ACC-2"), client_factory)
+    registry.get_client(("url", "EXT-1", "ACC-1"), client_factory)
+    registry.get_client(("url", "EXT-1", "ACC-3"), client_factory)
+
+    result = registry.get_client(("url", "EXT-1", "ACC-1"), client_factory)
+
+    assert result is first
+    assert len(registry) == 2
+    assert client_factory.call_count == 3
+
+
+def test_registry_evicts_idle_clients(pool, client_factory, monotonic):
+    registry = AccountClientRegistry(idle_ttl_seconds=60.0, pool_factory=lambda: pool)
+    first = registry.get_client(("url", "EXT-1", "ACC-1"), client_factory)
+    monotonic.return_value = 160.0
+
+    result = registry.get_client(("url", "EXT-1", "ACC-1"), client_factory)
+
+    assert result is not first
+    assert client_factory.call_count == 2
+
+
+async def test_registry_aclose_closes_shared_pool(mocker, pool, client_factory, monotonic):
+    pool_factory = mocker.Mock(return_value=pool)
+    registry = AccountClientRegistry(pool_factory=pool_factory)
+    registry.get_client(("url", "EXT-1", "ACC-1"), client_factory)
+
+    await registry.aclose()
+
+    pool.aclose.assert_awaited_once_with()
+    assert not len(registry)
+    registry.get_client(("url", "EXT-1", "ACC-1"), client_factory)
+    assert pool_factory.call_count == 2
+
+
+async def test_registry_aclose_without_pool():
+    registry = AccountClientRegistry()
+
+    await registry.aclose()  # act
+
+    assert not len(registry)
+
+
+def test_registry_rejects_invalid_size():
+    with pytest.raises(ValueError, match="max_clients"):
+        AccountClientRegistry(max_clients=0)
+
+
+async def test_shared_pool_transport_keeps_pool(pool):
+    pool.handle_async_request.return_value = Response(codes.OK)
+    transport = SharedPoolTransport(pool)
+
+    result = await transport.handle_async_request(Request("GET", "https://api.example.com"))
+
+    await transport.aclose()
+    assert result.status_code == codes.OK
+    pool.aclose.assert_not_awaited()
+
+
+def test_registry_is_process_wide():
+    result = get_account_client_registry()
+
+    assert result is get_account_client_registry()
+
+
+async def test_shared_pool_uses_http_settings(mocker, runtime_settings, client_factory):
+    mocker.patch(
+        "mpt_extension_sdk.services.mpt_api_service.client_registry.get_runtime_settings",
+        autospec=True,
+        return_value=dataclasses.replace(runtime_settings, http_max_connections=7),
+    )
+    get_account_client_registry.cache_clear()
+    registry = get_account_client_registry()
+
+    registry.get_client(("https://api.example.com", "EXT-1", "ACC-1"), client_factory)  # act
+
+    shared_transport = client_factory.call_args.args[0]
+    assert shared_transport._pool._pool._max_connections == 7
+    await registry.aclose()
+    get_account_client_registry.cache_clear()
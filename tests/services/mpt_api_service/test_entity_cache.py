@@ -0,0 +1,110 @@
+import asyncio
+
+import pytest
+
+from mpt_extension_sdk.models.base import BaseModel
+from mpt_extension_sdk.services.api_client_v2.mpt_api_client import AsyncMPTClient
+from mpt_extension_sdk.services.mpt_api_service.entity_cache import (
+    EntityCache,
+    get_client_entity_caches,
+)
+
+
+class FakeEntity(BaseModel):
+    id: str
+    revision: int | None = None
+
+
+@pytest.fixture
+def clock(mocker):
+    return mocker.Mock(return_value=100.0)
+
+
+@pytest.fixture
+def entity_cache(clock):
+    return EntityCache(ttl_seconds=30, max_entries=2, clock=clock)
+
+
+async def test_get_or_fetch_caches_entity(mocker, entity_cache):
+    fetch = mocker.AsyncMock(return_value=FakeEntity(id="ORD-1"))
+
+    result = [
+        await entity_cache.get_or_fetch("ORD-1", fetch),
+        await entity_cache.get_or_fetch("ORD-1", fetch),
+    ]
+
+    assert result[0] is result[1]
+    fetch.assert_awaited_once_with()
+
+
+def test_get_expires_entries(clock, entity_cache):
+    entity_cache.put("ORD-1", FakeEntity(id="ORD-1"))
+    clock.return_value = 130.0
+
+    result = entity_cache.get("ORD-1")
+
+    assert result is None
+    assert not entity_cache
+
+
+def test_put_evicts_least_recently_used(entity_cache):
+    entity_cache.put("ORD-1", FakeEntity(id="ORD-1"))
+    entity_cache.put("ORD-2", FakeEntity(id="ORD-2"))
+    entity_cache.get("ORD-1")
+
+    entity_cache.put("ORD-3", FakeEntity(id="ORD-3"))  # act
+
+    assert entity_cache.get("ORD-1") is not None
+    assert entity_cache.get("ORD-2") is None
+
+
+def test_put_keeps_newer_revision(entity_cache):
+    newer = FakeEntity(id="ORD-1", revision=3)
+    entity_cache.put("ORD-1", newer)
+
+    entity_cache.put("ORD-1", FakeEntity(id="ORD-1", revision=2))  # act
+
+    assert entity_cache.get("ORD-1") is newer
+
+
+async def test_invalidate_discards_inflight_fetch(entity_cache):
+    fetch_started = asyncio.Event()
+    release_fetch = asyncio.Event()
+
+    async def fetch():  # noqa: WPS430
+        fetch_started.set()
+        await release_fetch.wait()
+        return FakeEntity(id="ORD-1", revision=1)
+
+    pending = asyncio.create_task(entity_cache.get_or_fetch("ORD-1", fetch))
+    await fetch_started.wait()
+    entity_cache.invalidate("ORD-1")
+    release_fetch.set()
+
+    result = await pending
+
+    assert result.revision == 1
+    assert entity_cache.get("ORD-1") is None
+
+
+def test_clear_drops_entries(entity_cache):
+    entity_cache.put("ORD-1", FakeEntity(id="ORD-1"))
+
+    entity_cache.clear()  # act
+
+    assert not entity_cache
+
+
+def test_cache_rejects_invalid_bounds():
+    with pytest.raises(ValueError, match="ttl_seconds"):
+        EntityCache(ttl_seconds=0, max_entries=1)
+
+
+def test_client_entity_caches_bound_to_client(mocker):
+    client = mocker.Mock(spec=AsyncMPTClient)
+
+    result = get_client_entity_caches(client, ttl_seconds=30, max_entries=8)
+
+    assert get_client_entity_caches(client, ttl_seconds=30, max_entries=8) is result
+    assert result.orders is not None
+    assert result.agreements is not None
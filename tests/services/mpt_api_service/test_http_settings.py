@@ -0,0 +1,51 @@
+import dataclasses
+
+import pytest
+from httpx import Timeout
+
+from mpt_extension_sdk.errors.runtime import ConfigError
+from mpt_extension_sdk.services.mpt_api_service.http_settings import HTTPClientSettings
+
+
+def test_from_runtime_settings(runtime_settings):
+    settings = dataclasses.replace(
+        runtime_settings,
+        http_max_connections=200,
+        http_read_timeout_seconds=30,
+        http2_enabled=True,
+    )
+
+    result = HTTPClientSettings.from_runtime_settings(settings)
+
+    assert result == HTTPClientSettings(max_connections=200, read_timeout_seconds=30, http2=True)
+
+
+def test_timeout_splits_connect_and_read():
+    http_settings = HTTPClientSettings(connect_timeout_seconds=3, read_timeout_seconds=30)
+
+    result = http_settings.timeout
+
+    assert result == Timeout(30, connect=3)
+
+
+def test_build_transport_applies_limits():
+    http_settings = HTTPClientSettings(
+        max_connections=50, max_keepalive_connections=10, keepalive_expiry_seconds=30
+    )
+
+    result = http_settings.build_transport()
+
+    pool = result._pool
+    assert (pool._max_connections, pool._max_keepalive_connections) == (50, 10)
+    assert pool._keepalive_expiry == 30
+
+
+def test_build_transport_requires_h2(mocker):
+    mocker.patch(
+        "mpt_extension_sdk.services.mpt_api_service.http_settings.find_spec",
+        autospec=True,
+        return_value=None,
+    )
+
+    with pytest.raises(ConfigError, match="h2"):
+        HTTPClientSettings(http2=True).build_transport()
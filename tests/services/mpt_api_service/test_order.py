@@ -5,18 +5,20 @@ from mpt_api_client.resources import AsyncCommerce
 from mpt_api_client.resources.commerce.orders import AsyncOrdersService
 
 from mpt_extension_sdk.services.api_client_v2.mpt_api_client import AsyncMPTClient
+from mpt_extension_sdk.services.mpt_api_service.entity_cache import EntityCache
 from mpt_extension_sdk.services.mpt_api_service.order import OrderService
+from mpt_extension_sdk.services.mpt_api_service.projection import ProjectionProfile
 
 
 @pytest.fixture
 def order_service_factory(mocker):
-    def factory():
+    def factory(cache=None):
         orders_client = mocker.Mock(spec=AsyncOrdersService)
         commerce_client = mocker.Mock(spec=AsyncCommerce)
         commerce_client.orders = orders_client
         client = mocker.Mock(spec=AsyncMPTClient)
         client.commerce = commerce_client
-        return OrderService(client), orders_client
+        return OrderService(client, cache=cache), orders_client
 
     return factory
 
@@ -104,3 +106,85 @@ async def test_fail_calls_orders_fail(mocker, order_service_factory):
         "ORD-1",
         {"reason": "validation-error", "statusNotes": {"message": "failed"}},
     )
+
+
+async def test_get_by_id_reads_through_cache(mocker, order_service_factory):
+    cache = EntityCache(ttl_seconds=30, max_entries=8)
+    service, orders_client = order_service_factory(cache)
+    api_order = mocker.Mock(spec=["to_dict"])
+    orders_client.get = mocker.AsyncMock(spec=Callable, return_value=api_order)
+    mocker.patch(
+        "mpt_extension_sdk.services.mpt_api_service.order.Order.from_payload",
+        autospec=True,
+        return_value="order-model",
+    )
+
+    result = [await service.get_by_id("ORD-1"), await service.get_by_id("ORD-1")]
+
+    assert result == ["order-model", "order-model"]
+    orders_client.get.assert_awaited_once()
+
+
+@pytest.mark.parametrize(
+    ("method_name", "args"),
+    [
+        ("complete", ({"id": "TPL-1"},)),
+        ("update", ({"status": "processing"},)),
+        ("query", ({"status": "Querying"},)),
+        ("fail", ({"message": "failed"},)),
+    ],
+)
+async def test_writes_invalidate_cache(mocker, order_service_factory, method_name, args):
+    cache = mocker.Mock(spec=EntityCache)
+    service, orders_client = order_service_factory(cache)
+    setattr(orders_client, method_name, mocker.AsyncMock(spec=Callable))
+
+    await getattr(service, method_name)("ORD-1", *args)  # act
+
+    cache.invalidate.assert_called_once_with("ORD-1")
+
+
+async def test_get_by_id_projection_skips_cache(mocker, order_service_factory):
+    cache = mocker.Mock(spec=EntityCache)
+    order_service, orders_client = order_service_factory(cache)
+    api_order = mocker.Mock(spec=["to_dict"])
+    orders_client.get = mocker.AsyncMock(spec=Callable, return_value=api_order)
+    mocker.patch(
+        "mpt_extension_sdk.services.mpt_api_service.order.Order.from_payload",
+        autospec=True,
+        return_value="order-model",
+    )
+
+    result = await order_service.get_by_id("ORD-1", ProjectionProfile.PARAMETERS)
+
+    assert result == "order-model"
+    orders_client.get.assert_awaited_once_with(
+        "ORD-1",
+        select=[
+            "agreement",
+            "agreement.client",
+            "agreement.licensee",
+            "authorization",
+            "product",
+            "parameters",
+        ],
+    )
+    cache.get_or_fetch.assert_not_called()
+
+
+async def test_get_by_id_refresh_refetches_cached_order(mocker, order_service_factory):
+    order_service, orders_client = order_service_factory(EntityCache(ttl_seconds=30, max_entries=8))
+    api_order = mocker.Mock(spec=["to_dict"])
+    orders_client.get = mocker.AsyncMock(spec=Callable, return_value=api_order)
+    mocker.patch(
+        "mpt_extension_sdk.services.mpt_api_service.order.Order.from_payload",
+        autospec=True,
+        side_effect=["stale-order", "fresh-order"],
+    )
+    await order_service.get_by_id("ORD-1")
+
+    result = await order_service.get_by_id("ORD-1", refresh=True)
+
+    assert result == "fresh-order"
+    assert await order_service.get_by_id("ORD-1") == "fresh-order"
+    assert orders_client.get.await_count == 2
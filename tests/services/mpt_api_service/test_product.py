@@ -1,7 +1,9 @@
 import pytest
+from mpt_api_client.exceptions import MPTHttpError
 from mpt_api_client.resources import AsyncCatalog
 from mpt_api_client.resources.catalog.items import AsyncItemsService
 
+from mpt_extension_sdk.errors.runtime import PartialFetchError
 from mpt_extension_sdk.models import ProductItem
 from mpt_extension_sdk.services.mpt_api_service.product import ProductItemService
 
@@ -75,3 +77,31 @@ async def test_get_items_chunks_when_over_max_page_size(  # noqa: WPS210
     paginate.assert_any_await(filtered_collections[0], ProductItem, limit=100)
     paginate.assert_any_await(filtered_collections[1], ProductItem, limit=100)
     paginate.assert_any_await(filtered_collections[2], ProductItem, limit=50)
+
+
+async def test_get_items_reports_failed_chunks(mocker, product_item_service_factory):
+    service, _ = product_item_service_factory()
+    mocker.patch.object(
+        service,
+        "_paginate",
+        autospec=True,
+        side_effect=[mocker.Mock(resources=["item-0"]), RuntimeError("boom")],
+    )
+    item_ids = [f"ITEM-{idx}" for idx in range(150)]
+
+    with pytest.raises(PartialFetchError) as error:
+        await service.get_product_one_time_items_by_ids("PROD-1", item_ids, concurrency=1)
+
+    assert error.value.resources == ["item-0"]
+    assert error.value.failed_ids == item_ids[100:]
+
+
+async def test_get_items_reraises_single_chunk_error(mocker, product_item_service_factory):
+    service, _ = product_item_service_factory()
+    api_error = MPTHttpError(503, "unavailable", "")
+    mocker.patch.object(service, "_paginate", autospec=True, side_effect=api_error)
+
+    with pytest.raises(MPTHttpError) as error:
+        await service.get_product_one_time_items_by_ids("PROD-1", ["ITEM-1"])
+
+    assert error.value is api_error
@@ -0,0 +1,101 @@
+import datetime as dt
+from email.utils import format_datetime
+
+import pytest
+from httpx import MockTransport, Request, Response, codes
+
+from mpt_extension_sdk.services.mpt_api_service.rate_limit import (
+    MAX_RETRY_AFTER_SECONDS,
+    RateLimiter,
+    RateLimitTransport,
+    ThrottlingStats,
+    get_throttling_stats,
+    parse_retry_after,
+)
+
+
+@pytest.fixture
+def clock(mocker):
+    return mocker.Mock(return_value=100.0)
+
+
+@pytest.fixture
+def sleep(mocker):
+    return mocker.AsyncMock()
+
+
+async def test_acquire_waits_for_empty_bucket(clock, sleep):
+    rate_limiter = RateLimiter(requests_per_second=2, burst=2, clock=clock, sleep=sleep)
+
+    for _ in range(4):
+        await rate_limiter.acquire()  # noqa: WPS476
+
+    assert [call.args[0] for call in sleep.await_args_list] == [0.5, 1.0]
+    assert rate_limiter.stats == ThrottlingStats(
+        requests=4, delayed_requests=2, delay_seconds=1.5, throttled_responses=0
+    )
+
+
+async def test_acquire_refills_bucket_over_time(clock, sleep):
+    rate_limiter = RateLimiter(requests_per_second=2, burst=1, clock=clock, sleep=sleep)
+    await rate_limiter.acquire()
+    clock.return_value = 100.5
+
+    await rate_limiter.acquire()  # act
+
+    sleep.assert_not_awaited()
+
+
+async def test_block_for_pauses_every_request(clock, sleep):
+    rate_limiter = RateLimiter(clock=clock, sleep=sleep)
+
+    rate_limiter.block_for(3)
+    await rate_limiter.acquire()
+
+    sleep.assert_awaited_once_with(3)
+    assert rate_limiter.stats.throttled_responses == 1
+
+
+async def test_transport_blocks_on_too_many_requests(clock, sleep):
+    rate_limiter = RateLimiter(clock=clock, sleep=sleep)
+    throttled_before = get_throttling_stats().throttled_responses
+    transport = RateLimitTransport(
+        MockTransport(lambda _: Response(codes.TOO_MANY_REQUESTS, headers={"Retry-After": "2"})),
+        rate_limiter,
+    )
+
+    result = await transport.handle_async_request(Request("GET", "https://api.example.com/"))
+
+    assert result.status_code == codes.TOO_MANY_REQUESTS
+    assert get_throttling_stats().throttled_responses == throttled_before + 1
+    await rate_limiter.acquire()
+    sleep.assert_awaited_once_with(2)
+
+
+@pytest.mark.parametrize(
+    ("header_value", "expected"),
+    [
+        (None, 1.0),
+        ("5", 5.0),
+        ("not-a-date", 1.0),
+        ("-3", 0),
+        ("86400", MAX_RETRY_AFTER_SECONDS),
+    ],
+)
+def test_parse_retry_after(header_value, expected):
+    result = parse_retry_after(header_value)
+
+    assert result == expected
+
+
+def test_parse_retry_after_http_date():
+    retry_at = dt.datetime.now(dt.UTC) + dt.timedelta(seconds=30)
+
+    result = parse_retry_after(format_datetime(retry_at, usegmt=True))
+
+    assert 28 <= result <= 30
+
+
+def test_rate_limiter_rejects_invalid_rate():
+    with pytest.raises(ValueError, match="requests_per_second"):
+        RateLimiter(requests_per_second=0)
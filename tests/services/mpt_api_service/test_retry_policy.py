@@ -0,0 +1,179 @@
+import dataclasses
+
+import pytest
+from httpx import ConnectError, MockTransport, ReadTimeout, Request, Response, codes
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from mpt_extension_sdk.services.mpt_api_service.retry_policy import (
+    BackoffRetryTransport,
+    RetryPolicy,
+)
+
+ORDER_URL = "https://api.example.com/public/v1/commerce/orders/ORD-1"
+COMPLETE_TASK_URL = "https://api.example.com/public/v1/system/tasks/TSK-1/complete"
+
+
+@pytest.fixture
+def sleep(mocker):
+    return mocker.AsyncMock()
+
+
+@pytest.fixture
+def clock(mocker):
+    return mocker.Mock(return_value=100.0)
+
+
+@pytest.fixture
+def retry_transport_factory(clock, sleep):
+    def factory(responses, policy=None):
+        outcomes = iter(responses)
+
+        def send(request: Request) -> Response:  # noqa: WPS430
+            outcome = next(outcomes)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        return BackoffRetryTransport(
+            MockTransport(send),
+            policy or RetryPolicy(),
+            clock=clock,
+            sleep=sleep,
+            jitter=lambda _, ceiling: ceiling,
+        )
+
+    return factory
+
+
+async def test_retries_read_with_backoff(retry_transport_factory, sleep):
+    transport = retry_transport_factory([
+        Response(codes.SERVICE_UNAVAILABLE),
+        Response(codes.BAD_GATEWAY),
+        Response(codes.OK),
+    ])
+
+    result = await transport.handle_async_request(Request("GET", ORDER_URL))
+
+    assert result.status_code == codes.OK
+    assert [call.args[0] for call in sleep.await_args_list] == [0.2, 0.4]
+
+
+@pytest.mark.parametrize(
+    "url",
+    [COMPLETE_TASK_URL, "https://gateway.example.com/mpt/public/v1/system/tasks/TSK-1/fail"],
+)
+async def test_retries_task_transition(retry_transport_factory, url):
+    transport = retry_transport_factory([Response(codes.GATEWAY_TIMEOUT), Response(codes.OK)])
+
+    result = await transport.handle_async_request(Request("POST", url))
+
+    assert result.status_code == codes.OK
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://api.example.com/public/v1/commerce/orders",
+        "https://api.example.com/public/v1/system/tasks/TSK-1/execute",
+        "https://api.example.com/public/v1/system/tasks/TSK-1/complete/extra",
+    ],
+)
+async def test_does_not_resend_other_writes(retry_transport_factory, sleep, url):
+    transport = retry_transport_factory([Response(codes.SERVICE_UNAVAILABLE)])
+
+    result = await transport.handle_async_request(Request("POST", url))
+
+    assert result.status_code == codes.SERVICE_UNAVAILABLE
+    sleep.assert_not_awaited()
+
+
+async def test_retries_any_write_after_throttling(retry_transport_factory, sleep):
+    transport = retry_transport_factory([
+        Response(codes.TOO_MANY_REQUESTS, headers={"Retry-After": "3"}),
+        Response(codes.CREATED),
+    ])
+
+    result = await transport.handle_async_request(
+        Request("POST", "https://api.example.com/public/v1/commerce/orders")
+    )
+
+    assert result.status_code == codes.CREATED
+    sleep.assert_awaited_once_with(3)
+
+
+async def test_retries_any_write_when_unsent(retry_transport_factory):
+    transport = retry_transport_factory([ConnectError("refused"), Response(codes.CREATED)])
+
+    result = await transport.handle_async_request(
+        Request("POST", "https://api.example.com/public/v1/commerce/orders")
+    )
+
+    assert result.status_code == codes.CREATED
+
+
+async def test_raises_after_max_attempts(retry_transport_factory, sleep):
+    transport = retry_transport_factory(
+        [ReadTimeout("slow"), ReadTimeout("slow")], RetryPolicy(max_attempts=2)
+    )
+
+    with pytest.raises(ReadTimeout):
+        await transport.handle_async_request(Request("GET", ORDER_URL))
+
+    sleep.assert_awaited_once()
+
+
+async def test_stops_when_budget_is_spent(retry_transport_factory, clock, sleep):
+    transport = retry_transport_factory(
+        [Response(codes.SERVICE_UNAVAILABLE)], RetryPolicy(max_elapsed_seconds=10)
+    )
+    clock.side_effect = [100.0, 109.9]
+
+    result = await transport.handle_async_request(Request("GET", ORDER_URL))
+
+    assert result.status_code == codes.SERVICE_UNAVAILABLE
+    sleep.assert_not_awaited()
+
+
+async def test_traces_each_attempt(mocker, retry_transport_factory):
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    mocker.patch(
+        "mpt_extension_sdk.services.mpt_api_service.retry_policy.TRACER",
+        provider.get_tracer("tests"),
+    )
+    transport = retry_transport_factory([ReadTimeout("slow"), Response(codes.OK)])
+
+    await transport.handle_async_request(Request("GET", ORDER_URL))  # act
+
+    attempts = [dict(span.attributes) for span in exporter.get_finished_spans()]
+    assert [attempt["http.request.resend_count"] for attempt in attempts] == [0, 1]
+    assert attempts[0]["error.type"] == "ReadTimeout"
+    assert attempts[1]["mpt.retry.delay_seconds"] == pytest.approx(0.2)
+    assert attempts[1]["http.response.status_code"] == codes.OK
+
+
+def test_backoff_is_capped():
+    policy = RetryPolicy(base_delay_seconds=1, max_delay_seconds=5)
+
+    result = policy.backoff_seconds(10, lambda _, ceiling: ceiling)
+
+    assert result == 5
+
+
+def test_from_runtime_settings_disabled(runtime_settings):
+    result = RetryPolicy.from_runtime_settings(runtime_settings)
+
+    assert result is None
+
+
+def test_from_runtime_settings_enabled(runtime_settings):
+    settings = dataclasses.replace(
+        runtime_settings, http_retry_enabled=True, http_retry_max_attempts=6
+    )
+
+    result = RetryPolicy.from_runtime_settings(settings)
+
+    assert result == RetryPolicy(max_attempts=6, max_elapsed_seconds=15)
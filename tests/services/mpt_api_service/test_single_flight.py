@@ -0,0 +1,70 @@
+import asyncio
+from functools import partial
+
+import pytest
+
+from mpt_extension_sdk.services.mpt_api_service.single_flight import SingleFlight
+
+
+@pytest.fixture
+def gated_call(mocker, single_flight):
+    release = asyncio.Event()
+
+    async def call():  # noqa: WPS430
+        await release.wait()
+        return "payload"
+
+    return mocker.AsyncMock(side_effect=call), release
+
+
+@pytest.fixture
+def single_flight():
+    return SingleFlight()
+
+
+async def test_run_shares_inflight_call(single_flight, gated_call):
+    call, release = gated_call
+    run_call = partial(single_flight.run, "key", call)
+    callers = [asyncio.create_task(run_call()) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+
+    result = await asyncio.gather(*callers)
+
+    assert result == ["payload", "payload", "payload"]
+    call.assert_awaited_once_with()
+    assert not single_flight
+
+
+async def test_run_keeps_different_keys_apart(mocker, single_flight):
+    call = mocker.AsyncMock(return_value="payload")
+
+    calls = [single_flight.run("one", call), single_flight.run("two", call)]
+    await asyncio.gather(*calls)  # act
+
+    assert call.await_count == 2
+
+
+async def test_run_survives_cancelled_caller(single_flight, gated_call):
+    call, release = gated_call
+    cancelled = asyncio.create_task(single_flight.run("key", call))
+    waiting = asyncio.create_task(single_flight.run("key", call))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    release.set()
+
+    result = await waiting
+
+    assert result == "payload"
+    assert cancelled.cancelled()
+
+
+async def test_run_propagates_errors_to_callers(mocker, single_flight):
+    call = mocker.AsyncMock(side_effect=RuntimeError("boom"))
+
+    result = await asyncio.gather(
+        single_flight.run("key", call), single_flight.run("key", call), return_exceptions=True
+    )
+
+    assert [str(error) for error in result] == ["boom", "boom"]
+    call.assert_awaited_once_with()
@@ -1,15 +1,20 @@
+import asyncio
 from collections.abc import Callable
 
 import pytest
+from mpt_api_client import RQLQuery
 
+from mpt_extension_sdk.models import Subscription
+from mpt_extension_sdk.services.mpt_api_service.base import PaginatedCollection
+from mpt_extension_sdk.services.mpt_api_service.entity_cache import EntityCache
 from mpt_extension_sdk.services.mpt_api_service.subscription import SubscriptionService
 
 
 @pytest.fixture
 def subscription_client_mock(mocker, async_mpt_client):
-    def factory():
+    def factory(*, batch_reads=False):
         subscription_client = async_mpt_client.commerce.subscriptions
-        return SubscriptionService(async_mpt_client), subscription_client
+        return SubscriptionService(async_mpt_client, batch_reads=batch_reads), subscription_client
 
     return factory
 
@@ -55,3 +60,76 @@ async def test_update(mocker, subscription_client_mock):
     await service.update("SUB-1", {"description": "fake"})  # act
 
     subscription_client.update.assert_awaited_once_with("SUB-1", {"description": "fake"})
+
+
+async def test_get_all_applies_filter(mocker, subscription_client_mock):
+    service, subscription_client = subscription_client_mock()
+    rql_filter = RQLQuery(status="Active")
+    paginate = mocker.patch.object(service, "_paginate", autospec=True, return_value="page")
+
+    result = await service.get_all(offset=10, limit=5, rql_filter=rql_filter)
+
+    assert result == "page"
+    paginate.assert_awaited_once_with(
+        subscription_client.filter.return_value, Subscription, offset=10, limit=5
+    )
+
+
+async def test_iter_all_streams_subscriptions(mocker, subscription_client_mock):
+    service, _ = subscription_client_mock()
+    get_all = mocker.patch.object(
+        service,
+        "get_all",
+        autospec=True,
+        side_effect=[
+            PaginatedCollection(limit=1, offset=0, resources=["SUB-1"], total=2),
+            PaginatedCollection(limit=1, offset=1, resources=["SUB-2"], total=2),
+        ],
+    )
+
+    result = [sub async for sub in service.iter_all(page_size=1, prefetch_pages=2)]
+
+    assert result == ["SUB-1", "SUB-2"]
+    get_all.assert_awaited_with(offset=1, limit=1, rql_filter=None)
+
+
+async def test_get_by_id_batches_concurrent_reads(mocker, subscription_client_mock):
+    service, subscription_client = subscription_client_mock(batch_reads=True)
+    paginate = mocker.patch.object(
+        service,
+        "_paginate",
+        autospec=True,
+        return_value=PaginatedCollection(
+            limit=2,
+            offset=0,
+            resources=[mocker.Mock(id="SUB-1"), mocker.Mock(id="SUB-2")],
+            total=2,
+        ),
+    )
+
+    result = await asyncio.gather(service.get_by_id("SUB-1"), service.get_by_id("SUB-2"))
+
+    assert [subscription.id for subscription in result] == ["SUB-1", "SUB-2"]
+    paginate.assert_awaited_once_with(
+        subscription_client.filter.return_value, Subscription, limit=2
+    )
+
+
+async def test_create_order_subscription_drops_order(mocker, async_mpt_client):
+    order_cache = mocker.Mock(spec=EntityCache)
+    order_subscriptions = mocker.Mock(spec=["create"])
+    order_subscriptions.create = mocker.AsyncMock(spec=Callable, return_value=mocker.Mock())
+    async_mpt_client.commerce.orders.subscriptions = mocker.Mock(
+        spec=Callable, return_value=order_subscriptions
+    )
+    mocker.patch(
+        "mpt_extension_sdk.services.mpt_api_service.subscription.Subscription.from_payload",
+        autospec=True,
+        return_value="subscription-model",
+    )
+    service = SubscriptionService(async_mpt_client, order_cache=order_cache)
+
+    result = await service.create_order_subscription("ORD-1", {"name": "SUB-1"})
+
+    assert result == "subscription-model"
+    order_cache.invalidate.assert_called_once_with("ORD-1")
@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+
+from mpt_extension_sdk.services.mpt_api_service.task import TaskService
+from mpt_extension_sdk.services.mpt_api_service.task_progress import TaskProgressReporter
+
+
+@pytest.fixture
+def task_service(mocker):
+    return mocker.AsyncMock(spec=TaskService)
+
+
+@pytest.fixture
+def clock(mocker):
+    return mocker.Mock(return_value=100.0)
+
+
+@pytest.fixture
+def reporter(task_service, clock):
+    return TaskProgressReporter(task_service, "TASK-1", interval_seconds=60, clock=clock)
+
+
+async def test_report_coalesces_values(reporter, task_service):
+    reporter.report(10)
+    reporter.report(20)
+    reporter.report(30)
+
+    await reporter.flush()  # act
+
+    task_service.progress.assert_awaited_once_with("TASK-1", 30)
+
+
+async def test_report_throttles_updates(reporter, task_service):
+    reporter.report(10)
+    await asyncio.sleep(0)
+    reporter.report(20)
+
+    await asyncio.sleep(0)  # act
+
+    task_service.progress.assert_awaited_once_with("TASK-1", 10)
+
+
+async def test_flush_sends_latest_value(reporter, task_service):
+    reporter.report(10)
+    await asyncio.sleep(0)
+    reporter.report(20)
+
+    await reporter.flush()  # act
+
+    assert [update.args for update in task_service.progress.await_args_list] == [
+        ("TASK-1", 10),
+        ("TASK-1", 20),
+    ]
+
+
+async def test_report_after_interval(reporter, task_service, clock):
+    reporter.report(10)
+    await asyncio.sleep(0)
+    clock.return_value = 160.0
+    reporter.report(20)
+
+    await asyncio.sleep(0)  # act
+
+    task_service.progress.assert_awaited_with("TASK-1", 20)
+
+
+async def test_flush_without_reports(reporter, task_service):
+    await reporter.flush()  # act
+
+    task_service.progress.assert_not_awaited()
+
+
+async def test_failed_update_is_not_raised(reporter, task_service, caplog):
+    task_service.progress.side_effect = RuntimeError("boom")
+    reporter.report(10)
+
+    await reporter.flush()  # act
+
+    assert "Failed to update progress of task TASK-1" in caplog.text
+
+
+async def test_report_from_worker_thread(reporter, task_service):
+    async with reporter:
+        await asyncio.to_thread(reporter.report, 10)  # act
+
+    task_service.progress.assert_awaited_once_with("TASK-1", 10)
@@ -6,7 +6,19 @@ from mpt_api_client.resources.commerce.orders import AsyncOrdersService
 
 from mpt_extension_sdk.models.template import Template
 from mpt_extension_sdk.services.api_client_v2.mpt_api_client import AsyncMPTClient
-from mpt_extension_sdk.services.mpt_api_service.template import TemplateService
+from mpt_extension_sdk.services.mpt_api_service.base import PaginatedCollection
+from mpt_extension_sdk.services.mpt_api_service.entity_cache import EntityCache
+from mpt_extension_sdk.services.mpt_api_service.template import (
+    TemplateService,
+    get_product_template_cache,
+)
+
+PRODUCT_TEMPLATES = (
+    Template(id="TPL-1", type="OrderCompleted", default=True, name="Default"),
+    Template(id="TPL-2", type="OrderCompleted", default=False, name="Welcome"),
+    Template(id="TPL-3", type="Asset", default=False, name="Asset Welcome"),
+    Template(id="TPL-4", type="OrderQuerying", default=True, name="Querying"),
+)
 
 
 @pytest.fixture
@@ -26,6 +38,22 @@ def template_service_factory(mocker):
     return factory
 
 
+@pytest.fixture
+def cached_template_service(mocker, async_mpt_client):
+    service = TemplateService(
+        async_mpt_client, product_cache=EntityCache(ttl_seconds=60, max_entries=8)
+    )
+    paginate = mocker.patch.object(
+        service,
+        "_paginate",
+        autospec=True,
+        return_value=PaginatedCollection(
+            limit=100, offset=0, resources=list(PRODUCT_TEMPLATES), total=len(PRODUCT_TEMPLATES)
+        ),
+    )
+    return service, paginate
+
+
 async def test_get_template_returns_default_template(mocker, template_service_factory):
     service, templates_factory, templates_query = template_service_factory()
     templates_query.fetch_page = mocker.AsyncMock(return_value=[mocker.sentinel.api_template])
@@ -157,3 +185,65 @@ async def test_set_order_template_updates_order(mocker):
 
     order_template.to_dict.assert_called_once_with()
     orders_client.update.assert_awaited_once_with("ORD-1", {"template": {"id": "TPL-1"}})
+
+
+async def test_set_order_template_drops_order(mocker):
+    order_cache = mocker.Mock(spec=EntityCache)
+    client = mocker.Mock(spec=AsyncMPTClient)
+    client.commerce = mocker.AsyncMock(spec=AsyncCommerce)
+    client.commerce.orders = mocker.AsyncMock(spec=AsyncOrdersService)
+    service = TemplateService(client, order_cache=order_cache)
+
+    await service.set_order_template("ORD-1", {"id": "TPL-1"})  # act
+
+    order_cache.invalidate.assert_called_once_with("ORD-1")
+
+
+async def test_cached_get_template_prefers_named(cached_template_service):
+    service, paginate = cached_template_service
+
+    result = await service.get_template("PROD-1", "Completed", name="Welcome")
+
+    assert result == PRODUCT_TEMPLATES[1]
+    assert await service.get_template("PROD-1", "Completed") == PRODUCT_TEMPLATES[0]
+    paginate.assert_awaited_once()
+
+
+async def test_cached_lookups_share_product_fetch(cached_template_service):
+    service, paginate = cached_template_service
+
+    result = (
+        await service.get_asset_template_by_name("PROD-1", "Asset Welcome"),
+        await service.get_order_querying_template("PROD-1"),
+        await service.get_template("PROD-1", "Failed"),
+    )
+
+    assert result == (PRODUCT_TEMPLATES[2], PRODUCT_TEMPLATES[3], None)
+    paginate.assert_awaited_once()
+
+
+async def test_invalidate_templates_refetches(cached_template_service):
+    service, paginate = cached_template_service
+    await service.get_order_querying_template("PROD-1")
+
+    service.invalidate_templates("PROD-1")
+    result = await service.get_order_querying_template("PROD-1")
+
+    assert result == PRODUCT_TEMPLATES[3]
+    assert paginate.await_count == 2
+
+
+async def test_warm_up_loads_templates(cached_template_service):
+    service, paginate = cached_template_service
+    paginate.side_effect = [RuntimeError("catalog unavailable"), paginate.return_value]
+
+    await service.warm_up(["PROD-1", "PROD-2"])  # act
+
+    assert await service.get_template("PROD-2", "Completed") == PRODUCT_TEMPLATES[0]
+    assert paginate.await_count == 2
+
+
+def test_get_product_template_cache_is_shared():
+    result = get_product_template_cache(300)
+
+    assert result is get_product_template_cache(300)
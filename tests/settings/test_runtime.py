@@ -1,3 +1,4 @@
+import dataclasses
 from pathlib import Path
 
 import pytest
@@ -58,6 +59,15 @@ def settings_loader_state(mocker, tmp_path):
     get_runtime_settings.cache_clear()
 
 
+@pytest.fixture
+def generated_meta_config(mocker, meta_config):
+    return mocker.patch(
+        "mpt_extension_sdk.settings.runtime.import_module",
+        autospec=True,
+        return_value=mocker.Mock(ext_app=FakeExtensionApp(meta_config)),
+    )
+
+
 def test_extension_package(runtime_settings):
     result = runtime_settings.extension_package
 
@@ -210,6 +220,97 @@ def test_load_prefers_traces_otlp_endpoint(
     assert result.otel_otlp_endpoint == "http://traces:4318"
 
 
+def test_load_reads_entity_cache_settings(
+    mocker, runtime_env, settings_loader_state, fake_package, generated_meta_config
+):
+    mocker.patch.dict(
+        "os.environ",
+        {"SDK_ENTITY_CACHE_TTL_SECONDS": "30", "SDK_ENTITY_CACHE_MAX_ENTRIES": "64"},
+    )
+
+    result = RuntimeSettings.load()
+
+    assert (result.entity_cache_ttl_seconds, result.entity_cache_max_entries) == (30, 64)
+
+
+def test_load_reads_read_service_lists(
+    mocker, runtime_env, settings_loader_state, fake_package, generated_meta_config
+):
+    mocker.patch.dict(
+        "os.environ",
+        {
+            "SDK_COALESCED_READ_SERVICES": "agreements, orders",
+            "SDK_BATCHED_READ_SERVICES": "subscriptions",
+        },
+    )
+
+    result = RuntimeSettings.load()
+
+    assert result.coalesced_read_services == ["agreements", "orders"]
+    assert result.batched_read_services == ["subscriptions"]
+
+
+def test_load_reads_template_cache_settings(
+    mocker, runtime_env, settings_loader_state, fake_package, generated_meta_config
+):
+    mocker.patch.dict(
+        "os.environ",
+        {"SDK_TEMPLATE_CACHE_TTL_SECONDS": "300", "SDK_TEMPLATE_CACHE_WARMUP": "true"},
+    )
+
+    result = RuntimeSettings.load()
+
+    assert (result.template_cache_ttl_seconds, result.template_cache_warmup) == (300, True)
+
+
+def test_load_reads_token_refresh_ahead(
+    mocker, runtime_env, settings_loader_state, fake_package, generated_meta_config
+):
+    mocker.patch.dict("os.environ", {"SDK_TOKEN_REFRESH_AHEAD_SECONDS": "300"})
+
+    result = RuntimeSettings.load()
+
+    assert result.token_refresh_ahead_seconds == 300
+
+
+@pytest.mark.parametrize("refresh_ahead_seconds", ["1", "60"])
+def test_load_rejects_refresh_ahead_within_leeway(
+    mocker,
+    runtime_env,
+    settings_loader_state,
+    fake_package,
+    generated_meta_config,
+    refresh_ahead_seconds,
+):
+    mocker.patch.dict("os.environ", {"SDK_TOKEN_REFRESH_AHEAD_SECONDS": refresh_ahead_seconds})
+
+    with pytest.raises(ConfigError, match="SDK_TOKEN_REFRESH_AHEAD_SECONDS must be 0"):
+        RuntimeSettings.load()
+
+
+def test_load_reads_account_token_store_path(
+    mocker, runtime_env, settings_loader_state, fake_package, generated_meta_config
+):
+    mocker.patch.dict("os.environ", {"SDK_ACCOUNT_TOKEN_STORE_PATH": "/tmp/tokens.sqlite3"})
+
+    result = RuntimeSettings.load()
+
+    assert result.account_token_store_path == "/tmp/tokens.sqlite3"
+
+
+def test_load_reads_rate_limit_settings(
+    mocker, runtime_env, settings_loader_state, fake_package, generated_meta_config
+):
+    mocker.patch.dict(
+        "os.environ",
+        {"SDK_RATE_LIMIT_REQUESTS_PER_SECOND": "20", "SDK_RATE_LIMIT_BURST": "40"},
+    )
+
+    result = RuntimeSettings.load()
+
+    assert (result.rate_limit_requests_per_second, result.rate_limit_burst) == (20, 40)
+
+
 def test_load_uses_uuid_when_hostname_blank(
     mocker, runtime_env, settings_loader_state, fake_package, meta_config
 ):
@@ -314,3 +415,137 @@ def test_get_runtime_settings_caches_load(mocker, runtime_settings):
     assert result == (runtime_settings, runtime_settings)
     load.assert_called_once_with()
     get_runtime_settings.cache_clear()
+
+
+def test_load_reads_http_retry_settings(
+    mocker, runtime_env, settings_loader_state, fake_package, generated_meta_config
+):
+    mocker.patch.dict(
+        "os.environ",
+        {
+            "SDK_HTTP_RETRY_ENABLED": "true",
+            "SDK_HTTP_RETRY_MAX_ATTEMPTS": "6",
+            "SDK_HTTP_RETRY_MAX_ELAPSED_SECONDS": "30",
+        },
+    )
+
+    result = RuntimeSettings.load()
+
+    assert result.http_retry_enabled
+    assert (result.http_retry_max_attempts, result.http_retry_max_elapsed_seconds) == (6, 30)
+
+
+def test_load_reads_http_client_settings(
+    mocker, runtime_env, settings_loader_state, fake_package, generated_meta_config
+):
+    mocker.patch.dict(
+        "os.environ",
+        {
+            "SDK_HTTP_MAX_CONNECTIONS": "200",
+            "SDK_HTTP_MAX_KEEPALIVE_CONNECTIONS": "100",
+            "SDK_HTTP_KEEPALIVE_EXPIRY_SECONDS": "30",
+            "SDK_HTTP_CONNECT_TIMEOUT_SECONDS": "3",
+            "SDK_HTTP_READ_TIMEOUT_SECONDS": "30",
+            "SDK_HTTP2_ENABLED": "true",
+        },
+    )
+
+    result = RuntimeSettings.load()
+
+    assert (result.http_max_connections, result.http_max_keepalive_connections) == (200, 100)
+    assert (result.http_connect_timeout_seconds, result.http_read_timeout_seconds) == (3, 30)
+    assert result.http_keepalive_expiry_seconds == 30
+    assert result.http2_enabled
+
+
+def test_load_reads_task_progress_interval(
+    mocker, runtime_env, settings_loader_state, fake_package, generated_meta_config
+):
+    mocker.patch.dict("os.environ", {"SDK_TASK_PROGRESS_INTERVAL_SECONDS": "10"})
+
+    result = RuntimeSettings.load()
+
+    assert result.task_progress_interval_seconds == 10
+
+
+def test_load_reads_task_limits(
+    mocker, runtime_env, settings_loader_state, fake_package, generated_meta_config
+):
+    mocker.patch.dict("os.environ", {"SDK_TASK_MAX_IN_FLIGHT": "8", "SDK_TASK_MAX_QUEUED": "16"})
+
+    result = RuntimeSettings.load()
+
+    assert (result.task_max_in_flight, result.task_max_queued) == (8, 16)
+
+
+def test_load_reads_event_lanes(
+    mocker, runtime_env, settings_loader_state, fake_package, generated_meta_config
+):
+    mocker.patch.dict(
+        "os.environ",
+        {"SDK_EVENT_LANES_ENABLED": "true", "SDK_EVENT_LANES_MERGE_DUPLICATES": "true"},
+    )
+
+    result = RuntimeSettings.load()
+
+    assert result.event_lanes_enabled
+    assert result.event_lanes_merge_duplicates
+
+
+def test_load_reads_event_dedup(
+    mocker, runtime_env, settings_loader_state, fake_package, generated_meta_config
+):
+    mocker.patch.dict(
+        "os.environ",
+        {"SDK_EVENT_DEDUP_TTL_SECONDS": "3600", "SDK_EVENT_DEDUP_STORE_PATH": "/tmp/events.db"},
+    )
+
+    result = RuntimeSettings.load()
+
+    assert (result.event_dedup_ttl_seconds, result.event_dedup_store_path) == (
+        3600,
+        "/tmp/events.db",
+    )
+
+
+def test_load_reads_sync_executor_max_workers(
+    mocker, runtime_env, settings_loader_state, fake_package, generated_meta_config
+):
+    mocker.patch.dict("os.environ", {"SDK_SYNC_EXECUTOR_MAX_WORKERS": "32"})
+
+    result = RuntimeSettings.load()
+
+    assert result.sync_executor_max_workers == 32
+
+
+def test_load_reads_process_executor_max_workers(
+    mocker, runtime_env, settings_loader_state, fake_package, generated_meta_config
+):
+    mocker.patch.dict("os.environ", {"SDK_PROCESS_EXECUTOR_MAX_WORKERS": "4"})
+
+    result = RuntimeSettings.load()
+
+    assert result.process_executor_max_workers == 4
+
+
+def test_load_reads_task_outbox_path(
+    mocker, runtime_env, settings_loader_state, fake_package, generated_meta_config
+):
+    mocker.patch.dict("os.environ", {"SDK_TASK_OUTBOX_PATH": "/tmp/outbox.db"})
+
+    result = RuntimeSettings.load()
+
+    assert result.task_outbox_path == "/tmp/outbox.db"
+
+
+def test_load_defaults_match_field_defaults(
+    runtime_env, settings_loader_state, fake_package, generated_meta_config
+):
+    result = RuntimeSettings.load()
+
+    required_fields = {
+        field.name: getattr(result, field.name)
+        for field in dataclasses.fields(RuntimeSettings)
+        if field.default is dataclasses.MISSING and field.default_factory is dataclasses.MISSING
+    }
+    assert result == RuntimeSettings(**required_fields)
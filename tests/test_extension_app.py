@@ -472,3 +472,16 @@ def test_ext_app_build_ctx_rejects_wrong_subtype(
 
     with pytest.raises(TypeError, match="must inherit from 'OrderContext'"):
         ExtensionApp().build_context(route, context)
+
+
+def test_meta_config_marks_background_task(dummy_handler):
+    event_router = EventRouter(prefix="/events/orders")
+    app = ExtensionApp(prefix="/api/v1")
+    event_router.task(path="/change", name="change", event="OrderChanged", background=True)(
+        dummy_handler
+    )
+    app.include_router(event_router)
+
+    result = app.to_meta_config()
+
+    assert result.events[0].task